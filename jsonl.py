@@ -12,43 +12,112 @@ __all__ = [
     "loads",
     "load_archive",
     "dump_archive",
+    "load_columns",
+    "count",
+    "stats",
+    "sample",
+    "load_many",
+    "transform",
+    "concat",
+    "recompress",
+    "sort",
+    "split",
+    "merge",
+    "dedupe",
+    "Cursor",
+    "URLCache",
+    "register_codec",
+    "Writer",
+    "LazyRecord",
 ]
 
-import bz2
+# Modules only needed by some functions (compression codecs, archives, HTTP, pools...)
+# are imported on first use, keeping `import jsonl` fast.
+import collections
+import collections.abc
 import contextlib
-import fnmatch
 import functools
-import gzip
+import heapq
+import importlib
+import importlib.util
 import io
+import itertools
 import json
 import logging
-import lzma
+import math
+import operator
 import os
-import shutil
+import re
 import string
 import sys
-import tarfile
-import tempfile
+import threading
+import time
 import urllib.parse
-import urllib.request
-import zipfile
+import zlib
+
+
+def _has_module(name, /):
+    """Check whether a module can be imported, without importing it."""
+
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def __getattr__(name):
+    if name == "zstd":  # `compression.zstd` (Python 3.14+) is imported on first use.
+        zstd = importlib.import_module("compression.zstd") if _zstd_available else None
+        globals()["zstd"] = zstd
+        return zstd
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def _lazy_opener(module, /):
+    """Get a function calling `open` of a compression module, which is imported on first use."""
+
+    def opener(*args, **kwargs):
+        return importlib.import_module(module).open(*args, **kwargs)
+
+    return opener
 
-try:
-    from compression import zstd
-except ImportError:
-    zstd = None  # Python < 3.14
 
 # ---------------------------------- Internal variables ----------------------------------
 
 _utf_8 = "utf-8"
 _new_line = "\n"
 _new_line_bytes = b"\n"
+_line_ends = (_new_line, _new_line_bytes)
+_new_lines = re.compile(b"\n")
+# Empty lines (see `_is_blank_line`) following the terminator of the previous line, up to their own terminator.
+_blank_lines = re.compile(b"\n[ \t\r\x0b\x0c]?(?=\n)")
+_block_size = 1024 * 1024
+
+_http_retries = 3  # Retries of a failed or interrupted HTTP request.
+_http_backoff = 0.5  # Seconds to wait before the first retry, doubled on each following retry.
+_http_timeout = 60  # Seconds to wait for a server response before retrying.
+_http_max_redirects = 10
+_http_retry_statuses = frozenset((429, 500, 502, 503, 504))
+_http_pool = collections.defaultdict(list)  # (scheme, netloc) -> Idle keep-alive connections.
+_http_pool_lock = threading.Lock()
+_http_pool_size = 8  # Idle connections kept per host.
 
 _default_decode = json.JSONDecoder().decode
 _default_encode = json.JSONEncoder(
     ensure_ascii=False,  # result can include non-ASCII characters
 ).encode
 
+Cursor = collections.namedtuple("Cursor", ("offset", "skip", "lineno"))
+Cursor.__doc__ = """
+Position of a JSON Lines file from which loading can be resumed.
+
+- `offset`: Byte offset of the file where reading resumes (a line start, or a gzip member start).
+- `skip`: Number of lines to skip after reading from `offset`.
+- `lineno`: Number of lines read since the start of the file.
+"""
+
+_undecoded = object()  # Value of a `LazyRecord` not deserialized yet.
+
 _logger = logging.getLogger(__name__)
 _logger.addHandler(logging.NullHandler())
 
@@ -61,9 +130,15 @@ ext_zst = ".zst"
 extensions = {ext_jsonl, ext_gz, ext_bz2, ext_xz}
 _openers = {
     ext_jsonl: open,
-    ext_gz: gzip.open,
-    ext_bz2: bz2.open,
-    ext_xz: lzma.open,
+    ext_gz: _lazy_opener("gzip"),
+    ext_bz2: _lazy_opener("bz2"),
+    ext_xz: _lazy_opener("lzma"),
+}
+_magics = {  # Initial bytes identifying the compressed files: https://en.wikipedia.org/wiki/List_of_file_signatures
+    ext_gz: b"\x1f\x8b",  # https://tools.ietf.org/html/rfc1952#page-6
+    ext_bz2: b"\x42\x5a\x68",
+    ext_xz: b"\xfd\x37\x7a\x58\x5a\x00",  # https://tukaani.org/xz/xz-file-format.txt
+    ext_zst: b"\x28\xb5\x2f\xfd",  # https://www.rfc-editor.org/info/rfc8878/
 }
 _archive_formats = {
     "zip": "zip",
@@ -72,13 +147,16 @@ _archive_formats = {
     "tar.bz2": "bztar",
     "tar.xz": "xztar",
 }
+_content_encodings = {"gzip": ext_gz, "x-gzip": ext_gz}  # Supported HTTP `Content-Encoding` values.
 
-if zstd is None:
+_zstd_available = _has_module("compression.zstd") and _has_module("_zstd")
+if not _zstd_available:
     _logger.info("zstd compression is not available!")
 else:
     extensions.add(ext_zst)
-    _openers[ext_zst] = zstd.open
+    _openers[ext_zst] = _lazy_opener("compression.zstd")
     _archive_formats["tar.zst"] = "zstdtar"
+    _content_encodings["zstd"] = ext_zst
 
 
 # ---------------------------------- Internal utils ----------------------------------
@@ -89,23 +167,24 @@ def _get_fileobj_extension(fileobj, /):
 
     fd_position = fileobj.tell()  # Save current position
     fileobj.seek(0)  # Go to the start of the file
-    bytes_ = fileobj.read(6)  # Read enough bytes to detect compression
+    bytes_ = fileobj.read(_get_magic_size())  # Read enough bytes to detect compression
     fileobj.seek(fd_position)  # Restore the original position
+    return _get_magic_extension(bytes_)
+
+
+def _get_magic_size():
+    """Get the number of initial bytes needed to detect the compression of a file."""
+
+    return max(map(len, _magics.values()), default=0)
 
-    if bytes_[:2] == b"\x1f\x8b":
-        # https://tools.ietf.org/html/rfc1952#page-6
-        return ext_gz
-    elif bytes_[:3] == b"\x42\x5a\x68":
-        # https://en.wikipedia.org/wiki/List_of_file_signatures
-        return ext_bz2
-    elif bytes_[:6] == b"\xfd\x37\x7a\x58\x5a\x00":
-        # https://tukaani.org/xz/xz-file-format.txt
-        return ext_xz
-    elif bytes_[:4] == b"\x28\xb5\x2f\xfd":
-        # https://www.rfc-editor.org/info/rfc8878/
-        return ext_zst
-    else:
-        return None
+
+def _get_magic_extension(bytes_, /):
+    """Get the file extension based on the initial bytes of a file."""
+
+    for extension, magic in _magics.items():
+        if magic and bytes_.startswith(magic):
+            return extension
+    return None
 
 
 def _get_file_extension(name, mode, /, *, fileobj=None):
@@ -123,8 +202,24 @@ def _get_file_extension(name, mode, /, *, fileobj=None):
         return None
 
 
+def _get_write_extension(name, mode, /):
+    """
+    Get the file extension used to write a file based on its filename.
+
+    If the extension is not recognized and the file is appended to, the compression format of its content is used,
+    so that a new stream of the same format is appended.
+    """
+
+    extension = os.path.splitext(name)[1]
+    if extension not in extensions and "a" in mode and os.path.isfile(name):
+        with open(name, mode="rb") as fd:
+            extension = _get_magic_extension(fd.read(_get_magic_size())) or extension
+    return extension
+
+
 def _looks_like_url(value, /):
-    if isinstance(value, urllib.request.Request):
+    request_module = sys.modules.get("urllib.request")  # A `Request` cannot exist before its module is imported.
+    if request_module and isinstance(value, request_module.Request):
         value = value.full_url
     if not isinstance(value, str):
         return False
@@ -137,6 +232,347 @@ def _looks_like_url(value, /):
     return True
 
 
+def _http_connect(scheme, netloc, /):
+    """Get an idle connection to the host from the pool, or a new one. Returns `(connection, reused)`."""
+
+    import http.client
+
+    with _http_pool_lock:
+        idle = _http_pool.get((scheme, netloc))
+        if idle:
+            return idle.pop(), True
+    connection_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    return connection_cls(netloc, timeout=_http_timeout), False
+
+
+def _http_release(scheme, netloc, connection, response, /):
+    """Return the connection to the pool if its response was fully read and the server keeps it alive."""
+
+    if response.isclosed() and not response.will_close:
+        with _http_pool_lock:
+            idle = _http_pool[(scheme, netloc)]
+            if len(idle) < _http_pool_size:
+                idle.append(connection)
+                return
+    connection.close()
+
+
+def _http_get(url, headers, /):
+    """
+    Send a GET request on a pooled connection, following redirects. Returns `(url, connection, response)`.
+
+    A pooled connection may have been closed by the server meanwhile, so the request is sent again
+    on a new connection if it fails on a reused one.
+    """
+
+    import http.client
+    import urllib.error
+
+    for _ in range(_http_max_redirects + 1):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise urllib.error.URLError("Unsupported redirection to {!r}".format(url))
+        path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        while True:
+            connection, reused = _http_connect(parts.scheme, parts.netloc)
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+            except (http.client.HTTPException, OSError):
+                connection.close()
+                if not reused:
+                    raise
+            else:
+                break
+
+        location = response.getheader("Location")
+        if response.status not in (301, 302, 303, 307, 308) or not location:
+            return url, connection, response
+        response.read()
+        _http_release(parts.scheme, parts.netloc, connection, response)
+        url = urllib.parse.urljoin(url, location)
+    raise urllib.error.HTTPError(url, response.status, "Too many redirections", response.headers, None)
+
+
+class _HTTPReader(io.RawIOBase):
+    """
+    Raw binary stream of an HTTP(S) resource, using pooled keep-alive connections.
+
+    Failed requests are retried with exponential backoff, and an interrupted download
+    is resumed from the current position with a `Range` request.
+    """
+
+    def __init__(self, url, headers, /, *, retries=_http_retries, backoff=_http_backoff):
+        self.url = url
+        self._headers = headers
+        self._retries = retries
+        self._backoff = backoff
+        self._position = 0
+        self._size = None
+        self._validator = None
+        self._connection = self._response = None
+        self._connect()
+        self.headers = self._response.headers
+        self._validator = self.headers.get("ETag") or self.headers.get("Last-Modified")
+        if self._response.length is not None:
+            self._size = self._response.length
+
+    def _wait(self, attempt, /):
+        time.sleep(self._backoff * 2**attempt)
+
+    def _connect(self):
+        """Send the request from the current position, retrying transient failures."""
+
+        import http.client
+        import urllib.error
+
+        headers = dict(self._headers)
+        if self._position:
+            headers["Range"] = "bytes={}-".format(self._position)
+            if self._validator:
+                headers["If-Range"] = self._validator  # Get the whole resource if it was modified meanwhile.
+
+        for attempt in itertools.count():
+            try:
+                url, connection, response = _http_get(self.url, headers)
+            except (http.client.HTTPException, OSError):
+                if attempt >= self._retries:
+                    raise
+            else:
+                if response.status not in _http_retry_statuses or attempt >= self._retries:
+                    break
+                connection.close()
+            self._wait(attempt)
+
+        if response.status >= 400:
+            body = response.read()
+            connection.close()
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(body))
+
+        self._connection, self._response = connection, response
+        if self._position:
+            expected = "bytes {}-".format(self._position)
+            if response.status == 206 and (response.getheader("Content-Range") or "").startswith(expected):
+                return
+            validator = response.getheader("ETag") or response.getheader("Last-Modified")
+            if response.status == 200 and validator == self._validator and response.length == self._size:
+                # The server does not support range requests: discard the bytes already read.
+                remaining = self._position
+                while remaining and (chunk := response.read(min(remaining, _block_size))):
+                    remaining -= len(chunk)
+                if not remaining:
+                    return
+            self.close()
+            raise OSError("Cannot resume the download of {!r}".format(self.url))
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        import http.client
+
+        for attempt in itertools.count():
+            try:
+                size = self._response.readinto(buffer)
+            except (http.client.HTTPException, OSError):
+                if attempt >= self._retries:
+                    raise
+            else:
+                if size or self._size is None or self._position >= self._size:
+                    break  # Data read, or end of the resource.
+                if attempt >= self._retries:
+                    raise http.client.IncompleteRead(b"", self._size - self._position)
+            self._connection.close()  # Interrupted download: resume it.
+            self._wait(attempt)
+            self._connect()
+
+        self._position += size
+        if not size and self._connection:
+            parts = urllib.parse.urlsplit(self.url)
+            _http_release(parts.scheme, parts.netloc, self._connection, self._response)
+            self._connection = None
+        return size
+
+    def close(self):
+        if self._connection:  # The response was not fully read: the connection cannot be reused.
+            self._connection.close()
+            self._connection = None
+        super().close()
+
+
+class _HTTPStream(io.BufferedReader):
+    """Buffered binary stream of an HTTP(S) resource exposing its response headers."""
+
+    def __init__(self, raw, headers, /):
+        super().__init__(raw)
+        self.headers = headers
+
+
+class _CacheWriter(io.RawIOBase):
+    """Raw binary stream copying the bytes read from another one into a cache entry, stored once fully read."""
+
+    def __init__(self, raw, cache, path, meta, /):
+        import tempfile
+
+        self._raw = raw
+        self._cache = cache
+        self._path = path
+        fd, self._tmp_path = tempfile.mkstemp(dir=cache.directory, prefix=".", suffix=".tmp")
+        self._fd = os.fdopen(fd, mode="wb")
+        self._fd.write(json.dumps(meta).encode(_utf_8) + _new_line_bytes)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = self._raw.readinto(buffer)
+        if self._fd:
+            if size:
+                self._fd.write(buffer[:size])
+            else:
+                self._fd.close()
+                self._fd = None
+                os.replace(self._tmp_path, self._path)  # Atomic: readers see either the old or the new entry.
+                self._cache._evict()
+        return size
+
+    def close(self):
+        if self._fd:  # Incomplete download: discard it.
+            self._fd.close()
+            self._fd = None
+            os.remove(self._tmp_path)
+        self._raw.close()
+        super().close()
+
+
+class URLCache:
+    """
+    On-disk cache of URL sources, revalidated with conditional requests.
+
+    Each response with an `ETag` or `Last-Modified` header is stored in a file of the cache directory,
+    keyed by URL. Later requests of the same URL send `If-None-Match`/`If-Modified-Since` headers,
+    and the stored body is read from disk if the server answers `304 Not Modified`.
+    Entries are written atomically, so the directory can be shared between processes,
+    and the least recently used ones are evicted when the cache exceeds `max_bytes`.
+    """
+
+    _headers = ("Content-Type", "Content-Encoding", "ETag", "Last-Modified")  # Response headers stored with the body.
+
+    def __init__(self, directory, /, *, max_bytes=1024**3):
+        """
+        Create a cache of URL sources in a directory.
+
+        :param str | os.PathLike directory: Directory of the cache entries (created if it does not exist).
+        :param int max_bytes: Maximum size of the cache entries, in bytes (defaults to 1 GiB).
+        """
+
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _get_path(self, url, /):
+        import hashlib
+
+        return os.path.join(self.directory, hashlib.sha256(url.encode(_utf_8)).hexdigest())
+
+    def _evict(self):
+        """Remove the least recently used entries until the cache fits in `max_bytes`."""
+
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.startswith("."):  # Skip the entries being written.
+                    with contextlib.suppress(FileNotFoundError):  # Removed by another process meanwhile.
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            total -= size
+
+    def _open(self, url, headers, /, *, retries=_http_retries, backoff=_http_backoff):
+        """Open the URL as a binary stream with response `headers`, from the cache if not modified."""
+
+        import email.message
+
+        path = self._get_path(url)
+        fd, meta = None, None
+        with contextlib.suppress(FileNotFoundError):
+            fd = io.FileIO(path)
+            try:
+                meta = json.loads(fd.readline())
+            except ValueError:
+                meta = None
+            if not meta or meta.get("url") != url:  # Corrupted entry, or hash collision.
+                fd.close()
+                fd, meta = None, None
+
+        if meta:
+            headers = dict(headers)
+            stored = meta["headers"]
+            if "ETag" in stored:
+                headers["If-None-Match"] = stored["ETag"]
+            if "Last-Modified" in stored:
+                headers["If-Modified-Since"] = stored["Last-Modified"]
+        try:
+            reader = _HTTPReader(url, headers, retries=retries, backoff=backoff)
+        except BaseException:
+            if fd:
+                fd.close()
+            raise
+
+        if fd:
+            if reader._response.status == 304:
+                reader.readall()  # Release the connection.
+                reader.close()
+                os.utime(path)  # Mark the entry as recently used.
+                message = email.message.Message()
+                for name, value in meta["headers"].items():
+                    message[name] = value
+                return _HTTPStream(fd, message)
+            fd.close()
+
+        stored = {name: reader.headers[name] for name in self._headers if name in reader.headers}
+        cache_control = reader.headers.get("Cache-Control", "")
+        if ("ETag" in stored or "Last-Modified" in stored) and "no-store" not in cache_control:
+            return _HTTPStream(_CacheWriter(reader, self, path, {"url": url, "headers": stored}), reader.headers)
+        return _HTTPStream(reader, reader.headers)
+
+
+def _urlopen(source, /, *, retries=_http_retries, backoff=_http_backoff, cache=None):
+    """
+    Open a URL or `urllib.request.Request` object as a binary stream with response `headers`.
+
+    HTTP(S) GET requests use pooled keep-alive connections, retry failures and resume interrupted downloads,
+    and are served by the `URLCache` if given. Other requests (other schemes or methods,
+    credentials in the URL or proxies) use `urllib.request.urlopen`.
+    """
+
+    import urllib.request
+
+    request = source if isinstance(source, urllib.request.Request) else urllib.request.Request(source)
+    parts = urllib.parse.urlsplit(request.full_url)
+    proxies = urllib.request.getproxies()
+    if (
+        parts.scheme not in ("http", "https")
+        or request.get_method() != "GET"
+        or parts.username is not None
+        or (parts.scheme in proxies and not urllib.request.proxy_bypass(parts.hostname))
+    ):
+        return urllib.request.urlopen(source)
+    headers = dict(request.header_items())
+    if not any(name.lower() == "accept-encoding" for name in headers):
+        headers["Accept-Encoding"] = ", ".join(encoding for encoding in _content_encodings if encoding != "x-gzip")
+    if cache is not None:
+        return cache._open(request.full_url, headers, retries=retries, backoff=backoff)
+    reader = _HTTPReader(request.full_url, headers, retries=retries, backoff=backoff)
+    return _HTTPStream(reader, reader.headers)
+
+
 def _get_encoding(mode, /):
     """Get the encoding based on the file mode."""
 
@@ -162,9 +598,85 @@ def _xopen(name, /, *, mode="rb", encoding=None):
     If the file extension is not recognized, the default `open` function is used.
     """
 
-    extension = _get_file_extension(name, mode)
-    opener = _openers.get(extension, open)
-    return opener(name, mode=mode, encoding=encoding or _get_encoding(mode))
+    encoding = encoding or _get_encoding(mode)
+    extension = _get_write_extension(name, mode)
+    if extension in extensions or "r" not in mode:
+        opener = _openers.get(extension, open)
+        return opener(name, mode=mode, encoding=encoding)
+
+    # Unknown extension: detect the compression from the initial bytes, opening the file only once.
+    fd = open(name, mode="rb")  # noqa: SIM115
+    try:
+        opener = _openers.get(_get_magic_extension(fd.peek(_get_magic_size())))
+        if opener is None:  # Uncompressed
+            return fd if "b" in mode else io.TextIOWrapper(fd, encoding=encoding)
+        return _ClosingFile(opener(fd, mode=mode, encoding=encoding), fd)
+    except BaseException:
+        fd.close()
+        raise
+
+
+class _ClosingFile:
+    """Proxy of a file object wrapping another one (e.g. a decompressor), closing both when closed."""
+
+    def __init__(self, file, fd, /):
+        self._file = file
+        self._fd = fd
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __iter__(self):
+        return iter(self._file)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        try:
+            self._file.close()
+        finally:
+            self._fd.close()
+
+
+@contextlib.contextmanager
+def _atomic_path(path, /):
+    """
+    Context manager yielding a temporary path next to `path`, which atomically replaces it on success.
+
+    The temporary file keeps the extension of `path` (so the same compression is applied), is synchronized
+    to disk before replacing `path`, and is removed on failure.
+    """
+
+    dirname, basename = os.path.split(path)
+    tmp_path = os.path.join(dirname, ".{}.{}".format(os.urandom(6).hex(), basename))
+    try:
+        yield tmp_path
+        _fsync_path(tmp_path)
+        with contextlib.suppress(FileNotFoundError):  # Keep the permissions of the replaced file.
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+    with contextlib.suppress(OSError):  # Make the rename durable (directories cannot be opened on Windows).
+        _fsync_path(dirname or os.curdir)
+
+
+def _fsync_path(path, /):
+    """Synchronize a file (or directory) to disk."""
+
+    # Files are opened for writing, which `os.fsync` requires on Windows.
+    fd = os.open(path, os.O_RDONLY if os.path.isdir(path) else os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 @contextlib.contextmanager
@@ -178,17 +690,7 @@ def _xfile(name, obj, /):
     :param obj: File-like an object.
     """
 
-    ext = _get_file_extension(name, "rb", fileobj=obj)
-    if ext == ext_gz:
-        file = gzip.GzipFile(fileobj=obj)
-    elif ext == ext_bz2:
-        file = bz2.BZ2File(obj)
-    elif ext == ext_xz:
-        file = lzma.LZMAFile(obj)  # noqa: SIM115
-    elif ext == ext_zst and zstd:
-        file = zstd.ZstdFile(obj)
-    else:
-        file = obj
+    file = _open_fileobj(_get_file_extension(name, "rb", fileobj=obj), obj)
     try:
         yield file
     finally:
@@ -196,6 +698,50 @@ def _xfile(name, obj, /):
             file.close()
 
 
+def _open_fileobj(ext, obj, /):
+    """Wrap a binary file-like object to decompress it according to a file extension (if compressed)."""
+
+    opener = _openers.get(ext)
+    if ext == ext_jsonl or opener is None:
+        return obj
+    return opener(obj, mode="rb")
+
+
+@contextlib.contextmanager
+def _xresponse(fd, /, *, url=None):
+    """
+    Context manager to decode a URL response according to its `Content-Encoding` header.
+
+    If `url` is given, the decoded content is also decompressed according to the URL extension
+    or, if not recognized, its magic bytes (peeked without consuming the response).
+
+    :param fd: Binary URL response, with `headers`.
+    :param Optional[str] url: URL of the response.
+    """
+
+    stream = fd if hasattr(fd, "peek") else io.BufferedReader(fd)
+    encoding = (fd.headers.get("Content-Encoding") or "identity").strip().lower()
+    if encoding == "identity":
+        file = stream
+        ext = os.path.splitext(urllib.parse.urlsplit(url).path)[1] if url else None
+    elif encoding in _content_encodings:
+        file = _open_fileobj(_content_encodings[encoding], stream)
+        ext = None  # The URL extension may refer to the encoded content (e.g. `.jsonl.gz` served as gzip).
+    else:
+        raise ValueError("Unsupported Content-Encoding: {!r}".format(encoding))
+
+    if url is not None and ext not in extensions:
+        size = _get_magic_size()
+        ext = _get_magic_extension(file.peek(size)[:size])
+    decompressed = _open_fileobj(ext, file) if url is not None else file
+    try:
+        yield decompressed
+    finally:
+        for obj in (decompressed, file, stream):
+            if obj is not fd:
+                obj.close()
+
+
 def _get_archive_format(path, /):
     """Return a valid archive format for `shutil.make_archive` based on the filename."""
 
@@ -214,6 +760,9 @@ def _del_archive_extension(path, /):
 
 
 def _iterfind_zip_members(name_or_obj, pattern, pwd, /):
+    import fnmatch
+    import zipfile
+
     with zipfile.ZipFile(name_or_obj) as zf:
         for name in fnmatch.filter(zf.namelist(), pattern):
             file = zf.open(name, pwd=pwd)
@@ -221,7 +770,132 @@ def _iterfind_zip_members(name_or_obj, pattern, pwd, /):
                 yield file
 
 
+def _encode_zip_member(name, data, /):
+    """Compress the data of a zip member named with a compression extension (e.g. ".jsonl.gz") with its codec."""
+
+    extension = os.path.splitext(name)[1]
+    if extension != ext_jsonl and (opener := _openers.get(extension)):
+        buffer = io.BytesIO()
+        with opener(buffer, mode="wb") as fd:
+            fd.write(data)
+        data = buffer.getvalue()
+    return data
+
+
+def _compress_zip_member(name, data, compression, compresslevel, /):
+    """
+    Build the `ZipInfo` and compressed data of a zip member holding `data`.
+
+    Runs on worker threads: the compressors release the GIL.
+    """
+
+    import zipfile
+
+    data = _encode_zip_member(name, data)
+    zinfo = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+    zinfo.compress_type = compression
+    zinfo.external_attr = 0o644 << 16  # permissions: ?rw-r--r--
+    zinfo.file_size = len(data)
+    zinfo.CRC = zlib.crc32(data)
+    if compression == zipfile.ZIP_LZMA:
+        zinfo.flag_bits |= 0x02  # The compressed data includes an end-of-stream marker.
+    if compressor := zipfile._get_compressor(compression, compresslevel):
+        data = compressor.compress(data) + compressor.flush()
+    zinfo.compress_size = len(data)
+    return zinfo, data
+
+
+def _can_write_zip_members(zf, /):
+    """
+    Check whether the private `zipfile` internals used by `_compress_zip_member` and `_write_zip_member` exist.
+
+    They are stable from CPython 3.8 to 3.14, but are not part of the public API of `zipfile`.
+    """
+
+    import zipfile
+
+    attrs = ("fp", "start_dir", "_writecheck", "_didModify", "filelist", "NameToInfo")
+    return (
+        callable(getattr(zipfile, "_get_compressor", None))
+        and callable(getattr(zipfile.ZipInfo, "FileHeader", None))
+        and all(hasattr(zf, attr) for attr in attrs)
+    )
+
+
+def _write_zip_member(zf, zinfo, data, /):
+    """Append a member whose data is already compressed to a zip file open for writing (as `ZipFile.writestr`)."""
+
+    import zipfile
+
+    zip64 = max(zinfo.file_size, zinfo.compress_size) > zipfile.ZIP64_LIMIT
+    zf.fp.seek(zf.start_dir)
+    zinfo.header_offset = zf.fp.tell()
+    zf._writecheck(zinfo)
+    zf._didModify = True
+    zf.fp.write(zinfo.FileHeader(zip64))
+    zf.fp.write(data)
+    zf.start_dir = zf.fp.tell()
+    zf.filelist.append(zinfo)
+    zf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _dump_zip(path, data, workers, compression, compresslevel, dump_if_empty, cls, kwargs, /):
+    """
+    Dump the items of `data` into the members of a zip archive, compressed concurrently on `workers` threads.
+
+    Each member is serialized on the calling thread (consuming the iterables of `data` in order), compressed
+    on a worker thread, and appended to the archive in order once compressed. Each member is held in memory,
+    with at most `2 * workers` members compressed ahead. Without the `zipfile` internals needed to append
+    compressed members, they are compressed serially with `ZipFile.writestr` instead.
+    """
+
+    import concurrent.futures
+    import zipfile
+
+    def iter_members():
+        name = chunks = None
+        seen = set()
+        for relpath, iterable in data:
+            member = os.path.normpath(os.fspath(relpath))
+            if os.path.isabs(member):
+                raise ValueError(f"Absolute path is not allowed: {member}")
+            if member != name:
+                if name is not None:
+                    yield name, chunks
+                if member in seen:
+                    raise ValueError(f"Items of {member} must be contiguous to write zip members directly.")
+                seen.add(member)
+                name, chunks = member, []
+            chunks.append(b"".join(dumper(iterable, text_mode=False, cls=cls, **kwargs)))
+        if name is not None:
+            yield name, chunks
+
+    zf = zipfile.ZipFile(path, mode="w", compression=compression, compresslevel=compresslevel)
+    with zf:
+        members = ((name, b"".join(chunks)) for name, chunks in iter_members() if dump_if_empty or any(chunks))
+        if not _can_write_zip_members(zf):
+            for name, member in members:
+                zf.writestr(name, _encode_zip_member(name, member))
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                in_flight = collections.deque()
+                for name, member in members:
+                    in_flight.append(pool.submit(_compress_zip_member, name, member, compression, compresslevel))
+                    if len(in_flight) > workers * 2:  # Bound the memory used by members waiting to be written.
+                        _write_zip_member(zf, *in_flight.popleft().result())
+                while in_flight:
+                    _write_zip_member(zf, *in_flight.popleft().result())
+
+    if dump_if_empty or zf.filelist:
+        return _del_archive_extension(path) + ".zip"  # As `shutil.make_archive`.
+    os.remove(path)
+    return None
+
+
 def _iterfind_tar_members(name_or_obj, pattern, /):
+    import fnmatch
+    import tarfile
+
     args, kwargs = (), {}
     if isinstance(name_or_obj, io.BytesIO):
         name_or_obj.seek(0)  # Ensure the pointer is at the start
@@ -254,6 +928,16 @@ def _get_encode(cls, kwargs):
     return encode
 
 
+def _serialize(encode, obj, /):
+    """Serialize an object, reusing the raw line of a `LazyRecord` that was never deserialized."""
+
+    if type(obj) is LazyRecord:
+        if obj._value is _undecoded:
+            return obj.raw.rstrip()
+        obj = obj._value
+    return encode(obj)
+
+
 def _get_decode(cls, kwargs):
     if not (cls or kwargs):
         decode = _default_decode
@@ -265,126 +949,865 @@ def _get_decode(cls, kwargs):
         decode = functools.partial(cls, **kwargs)
     return decode
 
-# ---------------------------------- Public API ----------------------------------
 
+def _get_schema_decode(decode, schema, /):
+    """
+    Wrap `decode` so that decoded objects with the same keys share a single set of key strings.
 
-def dumper(iterable, /, *, text_mode=True, cls=None, **kwargs):
-    """Dump an iterable of objects into JSON Lines format."""
+    Objects whose keys do not match the schema (same keys, same order) are returned untouched.
 
-    encode = _get_encode(cls, kwargs)
-    for obj in iterable:
-        value = encode(obj)  # can be bytes, like "orjson.dumps".
-        yield _get_line(value, text_mode)
+    :param Callable decode: Function decoding a single line.
+    :param bool | Iterable[str] schema: Keys of the records, or `True` to learn them from the first decoded object.
+    :rtype: Callable
+    """
 
+    keys = None if schema is True else tuple(schema)
 
-def loader(stream, broken, /, *, cls=None, **kwargs):
-    """Load a JSON Lines formatted stream into an object iterator."""
+    def schema_decode(line):
+        nonlocal keys
+        obj = decode(line)
+        if type(obj) is dict:
+            if keys is None:
+                keys = tuple(obj)
+            if len(obj) == len(keys) and tuple(obj) == keys:
+                # Rebuild the object so that it references the shared keys instead of its own copies.
+                return dict(zip(keys, obj.values()))
+        return obj
+
+    return schema_decode
 
-    decode = _get_decode(cls, kwargs)
-    is_bytes = None
-    for lineno, line in enumerate(stream, start=1):
-        if is_bytes is None:  # Avoid "isinstance" check on every line after the first one.
-            is_bytes = isinstance(line, bytes)
-        try:
-            yield decode(line.decode(_utf_8) if is_bytes else line)
-        except Exception as e:
-            _logger.warning("Broken line at %s: %s", lineno, e)
-            if not broken:
-                raise
 
+def _iter_blocks(source, opener, block_size, /):
+    """Iterate over the (decompressed) bytes of a filename or binary file-like object in blocks."""
 
-def dumps(iterable, /, *, cls=None, **kwargs):
+    if isinstance(source, (str, os.PathLike)):
+        openhook = opener or _xopen
+        with openhook(os.fspath(source), mode="rb", encoding=None) as fd:
+            yield from iter(functools.partial(fd.read, block_size), b"")
+    else:
+        yield from iter(functools.partial(source.read, block_size), b"")
+
+
+def _is_blank_line(line, /):
     """
-    Serialize an iterable into a JSON Lines formatted string.
+    Check whether a raw line is empty, so it is not counted as a record by the functions not deserializing it.
 
-    :param Iterable[Any] iterable: Iterable of objects
-    :param Optional[Callable] cls: Custom `json.JSONEncoder` subclass (defaults to `json.JSONEncoder`).
-    :param Unpack[dict] kwargs: keyword arguments used to configure the `JSONEncoder`.
-    :rtype: str
+    Empty lines hold at most 2 bytes of whitespace, such as a line terminator (LF or CRLF).
     """
 
-    return "".join(dumper(iterable, text_mode=True, cls=cls, **kwargs))
+    return len(line) <= 2 and not line.strip()
 
 
-def loads(text, /, *, broken=False, cls=None, **kwargs):
-    """
-    Deserialize a JSON Lines formatted string into an object iterator.
+def _iter_lines(source, opener, /):
+    """Iterate over the non-empty raw lines of a filename or file-like object without deserializing them."""
 
-    :param str text: JSON Lines formatted string.
-    :param bool broken: If true, skip broken lines (only logging a warning).
+    if isinstance(source, (str, os.PathLike)):
+        openhook = opener or _xopen
+        with openhook(os.fspath(source), mode="rb", encoding=None) as fd:
+            yield from itertools.filterfalse(_is_blank_line, fd)
+    else:
+        yield from itertools.filterfalse(_is_blank_line, source)
 
-    :param Optional[type[json.JSONDecoder] | Callable[..., Any]] cls: Custom decoder (defaults to `json.JSONDecoder`)
-        - JSONDecoder subclass
-        - Callable accepting arbitrary arguments and returning a decoded object
-    :param Unpack[dict] kwargs: keyword arguments used to pass the Custom decoder (`cls`).
 
-    :rtype: Iterator[Any]
+def _is_longer_line(line, max_line_bytes, /):
+    """Check whether a raw line is longer than `max_line_bytes` bytes (UTF-8 encoded), excluding its line feed."""
+
+    size = len(line) - (line[-1:] in _line_ends)
+    if isinstance(line, str) and size * 4 > max_line_bytes:  # Up to 4 bytes per character.
+        size = len(line.encode(_utf_8, "surrogatepass")) - (line[-1:] == _new_line)
+    return size > max_line_bytes
+
+
+def _iter_bounded_lines(stream, max_line_bytes, /):
+    """
+    Return an iterator over the lines of a stream, yielding `None` instead of the lines longer than `max_line_bytes`.
+
+    File-like objects are read with bounded `readline` calls, so longer lines are skipped up to the next
+    line terminator without ever being held in memory. Lines of other iterables are checked once produced
+    (`None` items, already skipped, are passed through). The stream itself is returned if `max_line_bytes` is `None`.
     """
 
-    # io.StringIO iteration is C-implemented and yields lines lazily without
-    # allocating an intermediate list, unlike str.splitlines().
-    yield from loader(io.StringIO(text), broken, cls=cls, **kwargs)
+    if max_line_bytes is None:
+        return stream
+    elif hasattr(stream, "readline"):
+        return _iter_bounded_readlines(stream.readline, max_line_bytes)
+    else:
+        return (None if line is None or _is_longer_line(line, max_line_bytes) else line for line in stream)
+
+
+def _iter_bounded_readlines(readline, max_line_bytes, /):
+    limit = max_line_bytes + 1  # Room for the line terminator (in characters for text streams).
+    while line := readline(limit):
+        if len(line) < limit or line[-1:] in _line_ends:
+            yield None if _is_longer_line(line, max_line_bytes) else line
+        else:
+            while (line := readline(limit)) and line[-1:] not in _line_ends:
+                pass  # Skip the rest of the line.
+            yield None
+
+
+def _iter_buffer_lines(buffer, /):
+    """Iterate over the lines of a bytes-like object as `bytes`, copying each line but never the whole buffer."""
+
+    if isinstance(buffer, bytes):
+        yield from io.BytesIO(buffer)  # Shares the immutable buffer instead of copying it.
+        return
 
+    view = memoryview(buffer).cast("B")  # Bytes, whatever the format of the buffer.
+    start = 0
+    for match in _new_lines.finditer(view):
+        end = match.end()
+        yield view[start:end].tobytes()
+        start = end
+    if start < len(view):
+        yield view[start:].tobytes()
 
-def dump(iterable, file, /, *, opener=None, text_mode=True, cls=None, **kwargs):
+
+def _reservoir_sample(iterable, n, rng, /):
     """
-    Dump an iterable to a JSON Lines file.
+    Select `n` random items from an iterable of unknown length, keeping their original order.
 
-    :param Iterable[Any] iterable: Iterable of objects.
-    :param str | bytes | os.PathLike | Any file: File to dump.
-        * If a file object is provided, the `writelines` or `write` methods will be used to write the string data.
-    :param Optional[Callable] opener: Custom function to open the file if a filename is provided.
-    :param bool text_mode: If false, write bytes to the file.
+    Uses the "Algorithm L" of reservoir sampling, which computes how many items to skip
+    instead of drawing a random number for each item.
+    """
 
-    :param Optional[type[json.JSONEncoder] | Callable[..., Any]] cls: Custom encoder (defaults to `json.JSONEncoder`)
-        - JSONEncoder subclass
-        - Callable accepting arbitrary arguments and returning an encoded object
-    :param Unpack[dict] kwargs: keyword arguments used to pass the Custom encoder (`cls`).
+    def draw():
+        return rng.random() or sys.float_info.min  # Uniform in the open interval (0, 1)
 
-    :raises ValueError: If the file object is missing the `writelines` and `write` methods.
+    if not n:
+        return []
+    items = enumerate(iterable)
+    reservoir = list(itertools.islice(items, n))
+    if len(reservoir) == n:
+        w = math.exp(math.log(draw()) / n)
+        while True:
+            skip = math.floor(math.log(draw()) / math.log1p(-min(w, 1 - sys.float_info.epsilon)))
+            item = next(itertools.islice(items, skip, None), None)
+            if item is None:
+                break
+            reservoir[rng.randrange(n)] = item
+            w *= math.exp(math.log(draw()) / n)
+
+    reservoir.sort(key=lambda item: item[0])
+    return [item for _, item in reservoir]
+
+
+def _seek_sample(fd, n, rng, /):
     """
+    Select `n` random lines of an uncompressed binary file by seeking to random offsets (or all its lines if fewer).
 
-    lines = dumper(iterable, text_mode=text_mode, cls=cls, **kwargs)
-    if isinstance(file, (str, os.PathLike)):
-        file = os.fspath(file)
-        fd_mode = "wt" if text_mode else "wb"
-        fd_open = opener or _xopen
-        with fd_open(file, mode=fd_mode, encoding=_get_encoding(fd_mode)) as fd:
-            fd.writelines(lines)
-    elif hasattr(file, "writelines"):
-        file.writelines(lines)
-    elif hasattr(file, "write"):
-        for line in lines:
-            file.write(line)
+    Each offset is resynchronized on the start of the next line, so lines following longer lines
+    are more likely to be selected: the sample is biased, but its cost does not depend on the file size.
+    If `n` distinct lines are not found within a bounded number of attempts (because `n` is a large fraction
+    of the lines, or the file has fewer lines), the whole file is sampled by reservoir sampling instead.
+    """
+
+    size = os.fstat(fd.fileno()).st_size
+    lines = {}
+    duplicates = 0
+    for _ in range(n * 10 if size else 0):
+        start = _get_line_start(fd, rng.randrange(size))  # Skip up to the next line terminator.
+        line = fd.readline()
+        if not _is_blank_line(line):
+            if start in lines:
+                duplicates += 1
+                if duplicates > n:  # Most lines are already selected: seeking is not worth it.
+                    break
+            else:
+                lines[start] = line
+                if len(lines) == n:
+                    return [lines[start] for start in sorted(lines)]
+    fd.seek(0)
+    return _reservoir_sample(_iter_lines(fd, None), n, rng)
+
+
+def _check_shard(shard, /):
+    """Validate a `(index, count)` shard specification."""
+
+    index, count = shard
+    if not 0 <= index < count:
+        raise ValueError(f"Invalid shard {shard!r}: index must be in the range [0, count).")
+    return index, count
+
+
+def _select_shard(lines, shard, /):
+    """Select the lines of the given shard by line number (modulo sharding)."""
+
+    if shard is None:
+        return lines
     else:
-        raise ValueError("Invalid file object, missing `writelines` and `write` methods.")
+        index, count = shard
+        return itertools.islice(lines, index, None, count)
 
 
-def dump_fork(paths, /, *, opener=None, text_mode=True, dump_if_empty=True, cls=None, **kwargs):
+def _iter_shard_lines(fd, shard, max_line_bytes, /):
     """
-    Incrementally dumps multiple iterables into the specified jsonlines files, effectively reducing memory consumption.
+    Iterate over the lines of an uncompressed binary file within the byte range of the given shard.
 
-    :param Iterable[str | os.PathLike, Iterable[Any]] paths: Iterable of iterables by filepath.
-    :param Optional[Callable] opener: Custom function to open the given file paths.
-    :param bool text_mode: If false, write bytes to the file.
-    :param bool dump_if_empty: If false, don't create an empty jsonlines file.
+    The file is split into `count` equal byte ranges, and each shard holds the lines starting within its range,
+    so only its slice of the file is read. Lines longer than `max_line_bytes` are yielded as `None`.
+    """
 
-    :param Optional[type[json.JSONEncoder] | Callable[..., Any]] cls: Custom encoder (defaults to `json.JSONEncoder`)
-        - JSONEncoder subclass
-        - Callable accepting arbitrary arguments and returning an encoded object
-    :param Unpack[dict] kwargs: keyword arguments used to pass the Custom encoder (`cls`).
+    index, count = shard
+    size = os.fstat(fd.fileno()).st_size
+    start = index * size // count
+    end = (index + 1) * size // count
+    position = _get_line_start(fd, start)  # Skip the line starting in the previous shard.
+    if position >= end:
+        return
+    for line in _iter_bounded_lines(fd, max_line_bytes):
+        position = fd.tell() if line is None else position + len(line)
+        yield line
+        if position >= end:
+            break
+
+
+def _get_line_start(fd, position, /):
+    """Return the position of the first line starting at or after `position` in a binary file, and seek to it."""
+
+    fd.seek(max(position - 1, 0))
+    if position:
+        while (chunk := fd.readline(_block_size)) and chunk[-1:] != _new_line_bytes:
+            pass  # Skip the rest of the line containing the previous byte, without holding it in memory.
+        position = fd.tell()
+    return position
+
+
+def _get_last_line_start(fd, start, end, block_size, /):
+    """Return the position of the last line starting within (start, end] in a binary file, or `None`."""
+
+    position = end
+    while position > start:
+        begin = max(start, position - block_size)
+        fd.seek(begin)
+        if (index := fd.read(position - begin).rfind(_new_line_bytes)) >= 0:
+            return begin + index + 1
+        position = begin
+    return None
+
+
+def _iter_split_ranges(fd, size, parts, max_bytes, block_size, /):
     """
+    Iterate over the byte ranges of the parts of an uncompressed file, aligned to line boundaries.
 
-    def get_writer(dst):
-        nothing = True
-        fd_mode = "wt" if text_mode else "wb"
-        fd_open = opener or _xopen
-        with fd_open(dst, mode=fd_mode, encoding=_get_encoding(fd_mode)) as fd:
-            try:
+    With `parts`, the file is split into equal byte ranges holding the lines starting within them (as `shard`).
+    With `max_bytes`, each range holds as many whole lines as fit in `max_bytes`, or a single longer line.
+    """
+
+    if parts:
+        bounds = [_get_line_start(fd, index * size // parts) for index in range(parts)] + [size]
+        yield from zip(bounds, bounds[1:])
+    else:
+        start = 0
+        while start < size:
+            end = start + max_bytes
+            if end < size:
+                end = _get_last_line_start(fd, start, end, block_size) or _get_line_start(fd, end)
+            yield start, min(end, size)
+            start = end
+
+
+def _copy_range(src_fd, dst_fd, start, end, block_size, kernel, /):
+    """
+    Copy the byte range [start, end) of a binary file into a binary file-like object.
+
+    If `kernel` (the destination is a regular file), the range is copied within the kernel where supported.
+    """
+
+    position = start
+    if kernel:
+        dst_fd.flush()
+        src, dst = src_fd.fileno(), dst_fd.fileno()
+    for name in ("copy_file_range", "sendfile") if kernel else ():
+        with contextlib.suppress(AttributeError, OSError):  # Unavailable, or unsupported by these files.
+            while position < end:
+                count = min(end - position, 1 << 30)
+                if name == "copy_file_range":
+                    copied = os.copy_file_range(src, dst, count, position)
+                else:
+                    copied = os.sendfile(dst, src, position, count)
+                if not copied:
+                    break
+                position += copied
+        if position >= end:
+            return
+
+    src_fd.seek(position)
+    while position < end and (block := src_fd.read(min(end - position, block_size))):
+        dst_fd.write(block)
+        position += len(block)
+
+
+def _check_split_pattern(pattern, /):
+    """Validate that a filename pattern holds exactly one replacement field, formatting indexes to distinct names."""
+
+    fields = [field for _, field, _, _ in string.Formatter().parse(pattern) if field is not None]
+    try:
+        distinct = len(fields) == 1 and pattern.format(0) != pattern.format(1)
+    except (IndexError, KeyError, ValueError):
+        distinct = False
+    if not distinct:
+        raise ValueError(f"Invalid pattern {pattern!r}: it must contain exactly one {{}} field for the part index.")
+    return pattern
+
+
+def _iter_split_lines(lines, size, parts, max_bytes, max_records, /):
+    """Iterate over the non-empty raw lines, terminated by a line feed, paired with the index of their part."""
+
+    index = position = used = records = 0
+    for raw in lines:
+        if parts:
+            index = ((position + 1) * parts - 1) // size  # The part whose byte range holds the line start.
+            position += len(raw)
+        if _is_blank_line(raw):
+            continue
+        line = raw if raw[-1:] == _new_line_bytes else raw + _new_line_bytes
+        if max_records:
+            index, records = records // max_records, records + 1
+        elif max_bytes:
+            if used and used + len(line) > max_bytes:
+                index, used = index + 1, 0
+            used += len(line)
+        yield index, line
+
+
+def _iter_paths(sources, /):
+    """Iterate over the filenames given as a glob pattern, a filename or an iterable of filenames."""
+
+    import glob
+
+    if isinstance(sources, (str, os.PathLike)):
+        pathname = os.fspath(sources)
+        if glob.has_magic(pathname):
+            yield from sorted(glob.glob(pathname))
+        else:
+            yield pathname
+    else:
+        yield from (os.fspath(path) for path in sources)
+
+
+def _put(q, item, stop, /):
+    """Put an item into a bounded queue, giving up if the `stop` event is set while waiting for free space."""
+
+    import queue
+
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+        except queue.Full:
+            continue
+        else:
+            return True
+    return False
+
+
+def _read_ahead(filename, opener, q, stop, /):
+    """Read the raw lines of a file in batches into a queue, ending with `None` (or the raised exception)."""
+
+    try:
+        openhook = opener or _xopen
+        with openhook(filename, mode="rb", encoding=None) as fd:
+            for batch in iter(functools.partial(fd.readlines, _block_size), []):
+                if not _put(q, batch, stop):
+                    return
+    except Exception as e:
+        _put(q, e, stop)
+    else:
+        _put(q, None, stop)
+
+
+def _iter_read_ahead(q, /):
+    """Iterate over the raw lines put into a queue by `_read_ahead`."""
+
+    for batch in iter(q.get, None):
+        if isinstance(batch, Exception):
+            raise batch
+        yield from batch
+
+
+def _iter_read_ahead_files(paths, workers, ordered, prefetch, opener, /):
+    """
+    Iterate over `(filename, lines)` tuples of several files, whose raw lines are read ahead on background threads.
+
+    Up to `workers` files are read ahead at once, each one buffering up to `prefetch` batches of lines.
+    The background threads are released when the iterator is closed.
+    """
+
+    import concurrent.futures
+    import queue
+
+    pending = collections.deque()  # Files being read ahead, as (filename, queue)
+    stop = threading.Event()
+
+    def submit():
+        if (filename := next(paths, None)) is not None:
+            q = queue.Queue(maxsize=prefetch)
+            pool.submit(_read_ahead, filename, opener, q, stop)
+            pending.append((filename, q))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            for _ in range(workers):
+                submit()
+            while pending:
+                if not ordered:
+                    # Prefer a file whose data is already available.
+                    pending.rotate(-next((i for i, (_, q) in enumerate(pending) if q.qsize()), 0))
+                filename, q = pending.popleft()
+                submit()
+                yield filename, _iter_read_ahead(q)
+        finally:
+            stop.set()  # Release the background threads if the iterator is closed before the end.
+
+
+def _open_or_pass(file, opener, mode, /):
+    """Open a filename with the given opener, or return a context manager that leaves a file-like object open."""
+
+    if isinstance(file, (str, os.PathLike)):
+        openhook = opener or _xopen
+        return openhook(os.fspath(file), mode=mode, encoding=_get_encoding(mode))
+    else:
+        return contextlib.nullcontext(file)
+
+
+def _transform_lines(lines, func, broken, decoder, encoder, /):
+    """Deserialize raw lines, apply a function to each object, and serialize the results that are not `None`."""
+
+    results = (result for result in map(func, loader(lines, broken, cls=decoder)) if result is not None)
+    return b"".join(dumper(results, text_mode=False, cls=encoder))
+
+
+# Temporary runs favor speed over compression ratio.
+_run_opener = functools.partial(_openers[ext_gz], compresslevel=1)
+_max_open = 64  # Maximum number of files merged at once.
+
+
+def _dump_sorted_run(lines, path, key, reverse, broken, decoder, encoder, /):
+    """Deserialize raw lines, sort the objects and dump them into a (temporary) file."""
+
+    objs = sorted(loader(lines, broken, cls=decoder), key=key, reverse=reverse)
+    dump(objs, path, opener=_run_opener, text_mode=False, cls=encoder)
+    return path
+
+
+def _merge(inputs, dst, dst_opener, max_open, tmp_dir, key, reverse, broken, decoder, encoder, /):
+    """
+    Merge sorted inputs, given as `(source, opener)` tuples, into a destination.
+
+    If there are more than `max_open` inputs, they are merged in several passes, by groups of `max_open`
+    consecutive inputs into temporary runs, so that ties keep the order of the inputs (stable merge).
+    """
+
+    import tempfile
+
+    def merge_into(group, path, opener):
+        iterables = [load(source, opener=source_opener, broken=broken, cls=decoder) for source, source_opener in group]
+        merged = heapq.merge(*iterables, key=key, reverse=reverse)
+        dump(merged, path, opener=opener, text_mode=False, cls=encoder)
+
+    with contextlib.ExitStack() as stack:
+        for n in itertools.count():
+            if len(inputs) <= max_open:
+                break
+            if n == 0:
+                tmp = stack.enter_context(tempfile.TemporaryDirectory(dir=tmp_dir))
+            runs = []
+            for i in range(0, len(inputs), max_open):
+                group = inputs[i : i + max_open]
+                path = os.path.join(tmp, f"{n}-{i}.jsonl.gz")
+                merge_into(group, path, _run_opener)
+                runs.append((path, _run_opener))
+                for source, opener in group:
+                    if opener is _run_opener:
+                        os.unlink(source)  # Release the disk space of the runs already merged.
+            inputs = runs
+
+        merge_into(inputs, dst, dst_opener)
+
+
+def _new_hash_set(max_memory, /):
+    """
+    Return `add(h)` and `items()` functions for a set of 128-bit hashes, stored in an array-backed hash table.
+
+    The table uses 16 bytes per slot instead of the ~70 bytes per item of a Python `set` of ints.
+    `add` returns true if the hash was not in the set, or `None` if the set is full because growing it
+    would exceed `max_memory` bytes.
+    """
+
+    import array
+
+    mask64 = (1 << 64) - 1
+    slots = 1024
+    table = array.array("Q", bytes(16 * slots))
+    size = 0
+
+    def insert(hi, lo):
+        i = (hi % slots) * 2
+        while table[i] or table[i + 1]:
+            if table[i] == hi and table[i + 1] == lo:
+                return False
+            i = (i + 2) % (slots * 2)
+        table[i] = hi
+        table[i + 1] = lo
+        return True
+
+    def add(h):
+        nonlocal table, slots, size
+        hi, lo = h >> 64, (h & mask64) | 1  # The lowest bit is set so that no hash is stored as an empty slot.
+        if size * 4 >= slots * 3:  # Keep the load factor below 75%
+            if slots * 32 > max_memory:
+                return None
+            old = table
+            slots *= 2
+            table = array.array("Q", bytes(16 * slots))
+            for j in range(0, len(old), 2):
+                if old[j] or old[j + 1]:
+                    insert(old[j], old[j + 1])
+        if insert(hi, lo):
+            size += 1
+            return True
+        return False
+
+    def items():
+        for j in range(0, len(table), 2):
+            if table[j] or table[j + 1]:
+                yield (table[j] << 64) | table[j + 1]
+
+    return add, items
+
+
+def _new_bloom_filter(capacity, error_rate, /):
+    """
+    Return an `add(h)` function for a Bloom filter of 128-bit hashes, sized for `capacity` items.
+
+    `add` returns true if the hash was not in the filter. False positives (hashes wrongly reported as already
+    added) happen with a probability of about `error_rate` while the filter holds less than `capacity` items.
+    """
+
+    bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    table = bytearray((bits + 7) // 8)
+
+    def add(h):
+        h1, h2 = h >> 64, (h & ((1 << 64) - 1)) | 1
+        new = False
+        for i in range(hashes):
+            position = (h1 + i * h2) % bits
+            byte, bit = position >> 3, 1 << (position & 7)
+            if not table[byte] & bit:
+                table[byte] |= bit
+                new = True
+        return new
+
+    return add
+
+
+# Compact and deterministic serialization used to hash the deduplication keys.
+_key_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode
+
+
+def _iter_gzip_lines_from(fd, cursor, state, max_line_bytes, /):
+    """
+    Iterate over the raw lines of a binary gzip file from a cursor, updating `state` with the cursor after each line.
+
+    Gzip files made of several members (e.g. appended to) can be resumed from the start of the member
+    holding the current line, without decompressing the previous members.
+    Lines longer than `max_line_bytes` are yielded as `None`, and dropped while decompressed.
+    """
+
+    offset, skip, lineno = cursor
+    member, member_lines = offset, 0  # Resynchronization point, and number of lines read since it.
+    pending, overlong = b"", False  # Start of the current line, and whether it was dropped for being too long.
+    decompressor, fresh = zlib.decompressobj(16 + zlib.MAX_WBITS), True
+    fd.seek(offset)
+    for block in iter(functools.partial(fd.read, _block_size), b""):
+        data, full = block, False
+        while data or full:
+            if fresh:
+                data = data.lstrip(b"\x00")  # Gzip members can be padded with zeroes.
+                if not data:
+                    break
+                fresh = False
+            chunk = decompressor.decompress(data, _block_size)  # Decompressed in bounded chunks.
+            full = len(chunk) == _block_size  # More output may be pending, even without more input.
+            lines = (pending + chunk).split(_new_line_bytes)
+            pending = lines.pop()
+            for line in lines:
+                member_lines += 1
+                if skip:
+                    skip -= 1
+                else:
+                    lineno += 1
+                    state[:] = (member, member_lines, lineno)
+                    too_long = overlong or (max_line_bytes is not None and len(line) > max_line_bytes)
+                    yield None if too_long else line
+                overlong = False
+            if max_line_bytes is not None and len(pending) > max_line_bytes:
+                pending, overlong = b"", True
+            if decompressor.eof:
+                data = decompressor.unused_data
+                if not (pending or overlong):  # The next member starts on a line boundary.
+                    member, member_lines = offset + len(block) - len(data), 0
+                decompressor, fresh = zlib.decompressobj(16 + zlib.MAX_WBITS), True
+            else:
+                data = decompressor.unconsumed_tail
+        offset += len(block)
+
+    if not fresh:
+        raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+    if (pending or overlong) and not skip:
+        state[:] = (member, member_lines + 1, lineno + 1)
+        yield None if overlong else pending
+
+
+def _iter_lines_from(filename, cursor, state, max_line_bytes, /):
+    """
+    Iterate over the raw lines of a file from a cursor, updating `state` with the cursor after each line.
+
+    Uncompressed files are resumed from the byte offset of the next line, and gzip files from the start
+    of the current member. Other compression formats cannot be resumed from an offset,
+    so the lines read before the cursor are skipped (without being deserialized).
+    Lines longer than `max_line_bytes` are yielded as `None`.
+    """
+
+    offset, skip, lineno = cursor
+    with open(filename, mode="rb") as fd:  # Opened once, to detect its compression and read it.
+        extension = _get_file_extension(filename, "rb", fileobj=fd)
+        if extension == ext_gz:
+            yield from _iter_gzip_lines_from(fd, cursor, state, max_line_bytes)
+        elif extension in (ext_jsonl, None):
+            fd.seek(offset)
+            for line in _iter_bounded_lines(fd, max_line_bytes):
+                offset = fd.tell() if line is None else offset + len(line)
+                if skip:
+                    skip -= 1
+                    continue
+                lineno += 1
+                state[:] = (offset, 0, lineno)
+                yield line
+        else:
+            with _open_fileobj(extension, fd) as dfd:
+                for line in itertools.islice(_iter_bounded_lines(dfd, max_line_bytes), skip, None):
+                    skip += 1
+                    lineno += 1
+                    state[:] = (0, skip, lineno)
+                    yield line
+
+
+def _get_object_decode(decode, /):
+    """
+    Wrap `decode` so that lines not holding a JSON object raise a `TypeError` naming the line.
+
+    :param Callable decode: Function decoding a single line.
+    :rtype: Callable
+    """
+
+    lineno = 0
+
+    def object_decode(line):
+        nonlocal lineno
+        lineno += 1
+        obj = decode(line)
+        if not isinstance(obj, dict):
+            raise TypeError(f"Line {lineno} is not a JSON object: got {type(obj).__name__}.")
+        return obj
+
+    return object_decode
+
+
+def _check_max_line_bytes(max_line_bytes, /):
+    """Validate the maximum size of the lines to load."""
+
+    if max_line_bytes is not None and max_line_bytes < 1:
+        raise ValueError("max_line_bytes must be a positive integer.")
+
+
+def _iter_loaded(lines, broken, max_line_bytes, schema, lazy, cls, kwargs, /):
+    """Deserialize raw lines already bounded by `max_line_bytes` (longer lines are given as `None`)."""
+
+    decode = _get_decode(cls, kwargs)
+    if schema:
+        decode = _get_schema_decode(decode, schema)
+    is_bytes = None
+    if lazy:
+        # Raw lines, deserialized on first access. Broken lines can only be skipped once deserialized.
+        decode = functools.partial(_get_decoded_lazy_record if broken else LazyRecord, decode=decode)
+        is_bytes = False
+    for lineno, line in enumerate(lines, start=1):
+        if line is None:  # Longer than `max_line_bytes`, and already skipped.
+            _logger.warning("Broken line at %s: longer than %s bytes", lineno, max_line_bytes)
+            if not broken:
+                raise ValueError(f"Line {lineno} is longer than {max_line_bytes} bytes.")
+            continue
+        if is_bytes is None:  # Avoid "isinstance" check on every line after the first one.
+            is_bytes = isinstance(line, bytes)
+        try:
+            yield decode(line.decode(_utf_8) if is_bytes else line)
+        except Exception as e:
+            _logger.warning("Broken line at %s: %s", lineno, e)
+            if not broken:
+                raise
+
+
+def _iter_columns(iterable, fields, chunk_size, /):
+    """Accumulate the values of the given fields of an iterable of objects into columns."""
+
+    import array
+
+    typecodes = dict(fields) if isinstance(fields, dict) else dict.fromkeys(fields)
+
+    def new_columns():
+        return {name: [] if code is None else array.array(code) for name, code in typecodes.items()}
+
+    columns = new_columns()
+    appenders = tuple((name, column.append) for name, column in columns.items())
+    size = 0
+    for obj in iterable:
+        get = obj.get
+        for name, append in appenders:
+            append(get(name))
+        size += 1
+        if size == chunk_size:
+            yield columns
+            columns = new_columns()
+            appenders = tuple((name, column.append) for name, column in columns.items())
+            size = 0
+
+    if size or chunk_size is None:
+        yield columns
+
+
+# ---------------------------------- Public API ----------------------------------
+
+
+def dumper(iterable, /, *, text_mode=True, cls=None, **kwargs):
+    """Dump an iterable of objects into JSON Lines format."""
+
+    encode = _get_encode(cls, kwargs)
+    for obj in iterable:
+        value = _serialize(encode, obj)  # can be bytes, like "orjson.dumps".
+        yield _get_line(value, text_mode)
+
+
+def loader(stream, broken, /, *, schema=None, max_line_bytes=None, lazy=False, cls=None, **kwargs):
+    """Load a JSON Lines formatted stream into an object iterator."""
+
+    _check_max_line_bytes(max_line_bytes)
+    lines = _iter_bounded_lines(stream, max_line_bytes)
+    yield from _iter_loaded(lines, broken, max_line_bytes, schema, lazy, cls, kwargs)
+
+
+def dumps(iterable, /, *, text_mode=True, cls=None, **kwargs):
+    """
+    Serialize an iterable into a JSON Lines formatted string.
+
+    :param Iterable[Any] iterable: Iterable of objects
+    :param bool text_mode: If false, return UTF-8 encoded bytes instead of a string (e.g. to send them over a socket),
+        built with a single join of the encoded lines.
+    :param Optional[Callable] cls: Custom `json.JSONEncoder` subclass (defaults to `json.JSONEncoder`).
+    :param Unpack[dict] kwargs: keyword arguments used to configure the `JSONEncoder`.
+    :rtype: str | bytes
+    """
+
+    return ("" if text_mode else b"").join(dumper(iterable, text_mode=text_mode, cls=cls, **kwargs))
+
+
+def loads(text, /, *, broken=False, lazy=False, cls=None, **kwargs):
+    """
+    Deserialize a JSON Lines formatted string (or UTF-8 encoded bytes-like object) into an object iterator.
+
+    :param str | bytes | bytearray | memoryview text: JSON Lines formatted string, or bytes-like object
+        (e.g. received from a socket), which is split into lines without being decoded nor copied as a whole.
+    :param bool broken: If true, skip broken lines (only logging a warning).
+    :param bool lazy: If true, yield `LazyRecord` objects deserialized on first access (see `load`).
+
+    :param Optional[type[json.JSONDecoder] | Callable[..., Any]] cls: Custom decoder (defaults to `json.JSONDecoder`)
+        - JSONDecoder subclass
+        - Callable accepting arbitrary arguments and returning a decoded object
+    :param Unpack[dict] kwargs: keyword arguments used to pass the Custom decoder (`cls`).
+
+    :rtype: Iterator[Any | LazyRecord]
+    """
+
+    if isinstance(text, str):
+        # io.StringIO iteration is C-implemented and yields lines lazily without
+        # allocating an intermediate list, unlike str.splitlines().
+        lines = io.StringIO(text)
+    else:
+        lines = _iter_buffer_lines(text)
+    yield from loader(lines, broken, lazy=lazy, cls=cls, **kwargs)
+
+
+def dump(iterable, file, /, *, opener=None, text_mode=True, mode="w", atomic=False, cls=None, **kwargs):
+    """
+    Dump an iterable to a JSON Lines file.
+
+    :param Iterable[Any] iterable: Iterable of objects.
+    :param str | bytes | os.PathLike | Any file: File to dump.
+        * If a file object is provided, the `writelines` or `write` methods will be used to write the string data.
+    :param Optional[Callable] opener: Custom function to open the file if a filename is provided.
+    :param bool text_mode: If false, write bytes to the file.
+    :param str mode: If a filename is provided, "w" to truncate the file or "a" to append to it.
+        Compressed files are appended a new stream (e.g. a gzip member), and remain readable as a whole.
+    :param bool atomic: If true and a filename is provided, write to a temporary file in the same directory,
+        synchronized to disk and then renamed to the filename, so readers never see a partially written file.
+
+    :param Optional[type[json.JSONEncoder] | Callable[..., Any]] cls: Custom encoder (defaults to `json.JSONEncoder`)
+        - JSONEncoder subclass
+        - Callable accepting arbitrary arguments and returning an encoded object
+    :param Unpack[dict] kwargs: keyword arguments used to pass the Custom encoder (`cls`).
+
+    :raises ValueError: If the file object is missing the `writelines` and `write` methods,
+        if the mode is not valid, or if `atomic` is combined with the append mode.
+    """
+
+    if mode not in ("w", "a"):
+        raise ValueError(f"Invalid mode: {mode!r}")
+    if atomic and mode == "a":
+        raise ValueError("Atomic writes are not supported in append mode.")
+
+    lines = dumper(iterable, text_mode=text_mode, cls=cls, **kwargs)
+    if isinstance(file, (str, os.PathLike)):
+        file = os.fspath(file)
+        fd_mode = mode + ("t" if text_mode else "b")
+        fd_open = opener or _xopen
+        with _atomic_path(file) if atomic else contextlib.nullcontext(file) as path:
+            with fd_open(path, mode=fd_mode, encoding=_get_encoding(fd_mode)) as fd:
+                fd.writelines(lines)
+    elif hasattr(file, "writelines"):
+        file.writelines(lines)
+    elif hasattr(file, "write"):
+        for line in lines:
+            file.write(line)
+    else:
+        raise ValueError("Invalid file object, missing `writelines` and `write` methods.")
+
+
+def dump_fork(paths, /, *, opener=None, text_mode=True, dump_if_empty=True, cls=None, **kwargs):
+    """
+    Incrementally dumps multiple iterables into the specified jsonlines files, effectively reducing memory consumption.
+
+    :param Iterable[str | os.PathLike, Iterable[Any]] paths: Iterable of iterables by filepath.
+    :param Optional[Callable] opener: Custom function to open the given file paths.
+    :param bool text_mode: If false, write bytes to the file.
+    :param bool dump_if_empty: If false, don't create an empty jsonlines file.
+
+    :param Optional[type[json.JSONEncoder] | Callable[..., Any]] cls: Custom encoder (defaults to `json.JSONEncoder`)
+        - JSONEncoder subclass
+        - Callable accepting arbitrary arguments and returning an encoded object
+    :param Unpack[dict] kwargs: keyword arguments used to pass the Custom encoder (`cls`).
+    """
+
+    def get_writer(dst):
+        nothing = True
+        fd_mode = "wt" if text_mode else "wb"
+        fd_open = opener or _xopen
+        with fd_open(dst, mode=fd_mode, encoding=_get_encoding(fd_mode)) as fd:
+            try:
                 while True:
                     obj = yield
                     nothing = False
-                    fd.write(_get_line(encode(obj), text_mode))
+                    fd.write(_get_line(_serialize(encode, obj), text_mode))
             except GeneratorExit:
                 # Flush compressor buffers before closing the generator to
                 # ensure a valid end-of-stream marker (required for .gz/.xz/.zst in Python 3.14+)
@@ -412,7 +1835,286 @@ def dump_fork(paths, /, *, opener=None, text_mode=True, dump_if_empty=True, cls=
             writer.close()
 
 
-def load(source, /, *, opener=None, broken=False, cls=None, **kwargs):
+class Writer:
+    """
+    Long-lived writer of a JSON Lines file, for objects produced incrementally (e.g. events of a service).
+
+    Serialized objects are collected in an in-memory buffer, which is written to the file when it exceeds
+    `buffer_size` bytes, every `flush_interval` seconds (from a background thread), on `flush` and on `close`.
+    The file is opened once, so compressed files are written as a single stream, finalized on `close`.
+    Writers are thread-safe and can be used as context managers, closing the file on exit.
+    """
+
+    _fsync_policies = ("never", "close", "always")
+
+    def __init__(
+        self,
+        file,
+        /,
+        *,
+        mode="w",
+        opener=None,
+        buffer_size=64 * 1024,
+        flush_interval=None,
+        fsync="close",
+        cls=None,
+        **kwargs,
+    ):
+        """
+        Open a JSON Lines file for writing.
+
+        If the file's extension indicates a recognized compression format (.gz, .bz2, .xz),
+        the corresponding compression method is applied.
+
+        :param str | os.PathLike file: File to write.
+        :param str mode: "w" to truncate the file, or "a" to append to it (a new stream for compressed files,
+            detected from the content of files without a recognized extension).
+        :param Optional[Callable] opener: Custom function to open the file, called with a binary mode.
+        :param int buffer_size: Size in bytes of the buffer of serialized objects written to the file at once.
+        :param Optional[float] flush_interval: If given, the buffer is also flushed every `flush_interval` seconds.
+        :param str fsync: When the file is synchronized to disk with `os.fsync`:
+            "never", on "close" (default) or "always" (on every buffer flush).
+
+        :param Optional[type[json.JSONEncoder] | Callable[..., Any]] cls: Custom encoder
+            (defaults to `json.JSONEncoder`)
+            - JSONEncoder subclass
+            - Callable accepting arbitrary arguments and returning an encoded object
+        :param Unpack[dict] kwargs: keyword arguments used to pass the Custom encoder (`cls`).
+
+        :raises ValueError: If the mode or the fsync policy is not valid.
+        """
+
+        if mode not in ("w", "a"):
+            raise ValueError(f"Invalid mode: {mode!r}")
+        if fsync not in self._fsync_policies:
+            raise ValueError(f"Invalid fsync policy: {fsync!r}")
+
+        self.name = os.fspath(file)
+        self._encode = _get_encode(cls, kwargs)
+        self._buffer = bytearray()
+        self._buffer_size = buffer_size
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._error = None
+
+        if opener:
+            self._raw = self._fd = opener(self.name, mode=mode + "b", encoding=None)
+        else:
+            # Keep the raw file to synchronize it once the compressed stream is finalized.
+            extension = _get_write_extension(self.name, mode)
+            codec = None if extension == ext_jsonl else _openers.get(extension)
+            self._raw = open(self.name, mode=mode + "b")  # noqa: SIM115
+            try:
+                self._fd = codec(self._raw, mode=mode + "b") if codec else self._raw
+            except BaseException:
+                self._raw.close()
+                raise
+
+        self._thread = None
+        if flush_interval:
+            self._thread = threading.Thread(
+                target=self._flush_periodically,
+                args=(flush_interval,),
+                name="jsonl-writer",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def closed(self):
+        return self._closed.is_set()
+
+    def _check(self):
+        if self._error:
+            raise self._error
+        if self._closed.is_set():
+            raise ValueError("I/O operation on closed writer.")
+
+    def _sync(self):
+        self._fd.flush()
+        if self._raw is not self._fd:
+            self._raw.flush()
+        os.fsync(self._raw.fileno())
+
+    def _write_buffer(self, flush, /):
+        """Write the buffer to the file (the lock must be held), flushing the file if requested."""
+
+        if self._buffer:
+            self._fd.write(self._buffer)
+            self._buffer.clear()
+        if self._fsync == "always":
+            self._sync()
+        else:
+            if flush:
+                self._fd.flush()  # Compressors also flush their pending output.
+            self._raw.flush()
+
+    def _flush_periodically(self, interval, /):
+        while not self._closed.wait(interval):
+            with self._lock:
+                if self._closed.is_set():
+                    break
+                try:
+                    self._write_buffer(True)
+                except Exception as e:  # Raised on the next call of the writer.
+                    _logger.error("Failed to flush %s: %s", self.name, e)
+                    self._error = e
+                    break
+
+    def write(self, obj):
+        """
+        Serialize an object and add it to the file as a line.
+
+        :param Any obj: Object to write.
+        :raises ValueError: If the writer is closed.
+        """
+
+        self._add(_get_line(_serialize(self._encode, obj), False))
+
+    def _add(self, data, /):
+        with self._lock:
+            self._check()
+            self._buffer += data
+            if len(self._buffer) >= self._buffer_size:
+                self._write_buffer(False)
+
+    def write_many(self, iterable):
+        """
+        Serialize the objects of an iterable and add them to the file as lines.
+
+        :param Iterable[Any] iterable: Objects to write.
+        :raises ValueError: If the writer is closed.
+        """
+
+        lines = (_get_line(_serialize(self._encode, obj), False) for obj in iterable)
+        while batch := b"".join(itertools.islice(lines, 1024)):  # Take the lock once per batch of lines.
+            self._add(batch)
+
+    def flush(self):
+        """Write the buffered objects to the file, and flush it (synchronizing it to disk if `fsync="always"`)."""
+
+        with self._lock:
+            self._check()
+            self._write_buffer(True)
+
+    def close(self):
+        """Write the buffered objects, finalize the compressed stream (if any) and close the file."""
+
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if self._thread:
+            self._thread.join()
+
+        with self._lock:
+            try:
+                if self._buffer:
+                    self._fd.write(self._buffer)
+                    self._buffer.clear()
+                if self._fd is not self._raw:
+                    self._fd.close()  # Write the end of the compressed stream into the raw file.
+                if self._fsync != "never":
+                    self._raw.flush()
+                    os.fsync(self._raw.fileno())
+            finally:
+                self._raw.close()
+        if self._error:
+            raise self._error
+
+
+def _get_decoded_lazy_record(line, /, *, decode):
+    """Build a `LazyRecord` deserialized right away, so that a broken line raises while loading."""
+
+    record = LazyRecord(line, decode=decode)
+    _ = record.value
+    return record
+
+
+class LazyRecord(collections.abc.Mapping):
+    """
+    Read-only record holding a raw JSON Lines line, deserialized on first access (see `load` with `lazy=True`).
+
+    Fields are accessed like a mapping (`record["key"]`, `record.get("key")`, `"key" in record`...), which
+    deserializes the line once. Records that were never deserialized are written by `dump`, `dumper`,
+    `dump_fork` and `Writer` as their raw line, without being serialized again (nor validated).
+    """
+
+    __slots__ = ("raw", "_value", "_decode")
+
+    def __init__(self, raw, /, *, decode=None):
+        """
+        Wrap a raw line.
+
+        :param str | bytes raw: JSON line (UTF-8 encoded if bytes).
+        :param Optional[Callable] decode: Function deserializing the line (defaults to `json.JSONDecoder().decode`).
+        """
+
+        self.raw = raw
+        self._value = _undecoded
+        self._decode = decode or _default_decode
+
+    @property
+    def value(self):
+        """Deserialized object of the line (deserialized on first access)."""
+
+        if self._value is _undecoded:
+            raw = self.raw
+            self._value = self._decode(raw.decode(_utf_8) if isinstance(raw, bytes) else raw)
+            self._decode = None  # Not needed anymore.
+        return self._value
+
+    @property
+    def decoded(self):
+        """Whether the line was already deserialized."""
+
+        return self._value is not _undecoded
+
+    def __getitem__(self, key):
+        return self.value[key]
+
+    def __iter__(self):
+        return iter(self.value)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __contains__(self, key):
+        return key in self.value
+
+    def __eq__(self, other):
+        return self.value == (other.value if isinstance(other, LazyRecord) else other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.raw!r})"
+
+
+def load(
+    source,
+    /,
+    *,
+    opener=None,
+    broken=False,
+    max_line_bytes=None,
+    lazy=False,
+    schema=None,
+    shard=None,
+    with_cursor=False,
+    resume_from=None,
+    retries=_http_retries,
+    backoff=_http_backoff,
+    cache=None,
+    cls=None,
+    **kwargs,
+):
     """
     Deserialize a UTF-8 encoded JSON Lines source—such as a filename, URL, or file-like object—into an object iterator.
 
@@ -420,38 +2122,94 @@ def load(source, /, *, opener=None, broken=False, cls=None, **kwargs):
     the corresponding decompression method is applied; if not, the standard open function is used by default.
 
     :param str | bytes | os.PathLike | urllib.request.Request | Any source:
-        If a URL or `urllib.request.Request` object is provided, the file will be retrieved
-        remotely using `urllib.request.urlopen`.
+        If a URL or `urllib.request.Request` object is provided, the file will be retrieved remotely.
+        HTTP(S) GET requests reuse pooled keep-alive connections, and other requests use `urllib.request.urlopen`.
         For more details, see: https://docs.python.org/3/library/urllib.request.html#urllib.request.urlopen
     :param Optional[Callable] opener: Custom function to open the file if a filename is provided.
     :param bool broken: If true, skip broken lines (only logging a warning).
+    :param Optional[int] max_line_bytes: Maximum length in bytes of a line, excluding its final line feed.
+        Lines are read in bounded chunks, and longer lines raise a `ValueError` or, if `broken` is true,
+        are skipped up to the next line terminator without being held in memory.
+    :param bool lazy: If true, yield `LazyRecord` objects holding the raw lines, which are only deserialized
+        when accessed (so malformed lines only raise then), and are written back unchanged by `dump` if not accessed.
+        If `broken` is also true, lines are deserialized while loading so that broken ones are skipped.
+    :param Optional[bool | Iterable[str]] schema: Keys shared by the records (or `True` to learn them from the first
+        one). Decoded objects with exactly these keys reuse the same key strings, reducing memory consumption.
+    :param Optional[tuple[int, int]] shard: `(index, count)` to load only one of `count` disjoint parts of the source.
+        Uncompressed files are split into equal byte ranges aligned to line boundaries, so only the range of the shard
+        is read; other sources are split by line number (every `count`-th line starting from `index`).
+    :param bool with_cursor: If true, yield `(cursor, object)` tuples, where `cursor` is the `Cursor`
+        from which loading can be resumed right after the object (filenames only).
+    :param Optional[Cursor | Sequence[int]] resume_from: `Cursor` (or its persisted values) from which loading
+        is resumed (filenames only). Uncompressed files are resumed from the next line's byte offset
+        and gzip files from the start of the current member; for other compression formats,
+        the previous lines are skipped without being deserialized.
+    :param int retries: Number of retries of a failed HTTP(S) request, or of an interrupted download,
+        which is resumed from the current position with a `Range` request.
+    :param float backoff: Seconds to wait before the first retry, doubled on each following retry.
+    :param Optional[URLCache] cache: Cache of HTTP(S) sources, revalidated with conditional requests.
 
     :param Optional[type[json.JSONDecoder] | Callable[..., Any]] cls: Custom decoder (defaults to `json.JSONDecoder`)
         - JSONDecoder subclass
         - Callable accepting arbitrary arguments and returning a decoded object
     :param Unpack[dict] kwargs: keyword arguments used to pass the Custom decoder (`cls`).
 
-    :rtype: Iterator[Any]
+    :raises ValueError: If the shard index is not in the range [0, count), if a line is longer than
+        `max_line_bytes` (unless `broken` is true), or if cursors are requested for a source other than a filename,
+        with a custom opener or a shard.
+    :rtype: Iterator[Any | LazyRecord] | Iterator[tuple[Cursor, Any | LazyRecord]]
     """
 
+    import urllib.request
+
+    if shard is not None:
+        shard = _check_shard(shard)
+    if with_cursor or resume_from is not None:
+        if not isinstance(source, (str, os.PathLike)) or _looks_like_url(source) or opener or shard:
+            raise ValueError("Cursors are only supported for filenames, without custom opener nor shard.")
+
+    _check_max_line_bytes(max_line_bytes)
+
+    def load_lines(lines):  # Lines already bounded by `max_line_bytes`.
+        return _iter_loaded(lines, broken, max_line_bytes, schema, lazy, cls, kwargs)
+
     # URL or Request object handling
     if _looks_like_url(source):
         if opener is not None:
             raise ValueError("Custom opener is not supported for URLs or Request objects.")
-        with urllib.request.urlopen(source) as fd:
+        url = source.full_url if isinstance(source, urllib.request.Request) else source
+        with _urlopen(source, retries=retries, backoff=backoff, cache=cache) as fd, _xresponse(fd, url=url) as dfd:
             charset = fd.headers.get_content_charset(failobj=_utf_8)
             # Wrap the file descriptor to handle text encoding.
-            with io.TextIOWrapper(fd, encoding=charset) as stream:
-                yield from loader(stream, broken, cls=cls, **kwargs)
+            with io.TextIOWrapper(dfd, encoding=charset) as stream:
+                yield from load_lines(_select_shard(_iter_bounded_lines(stream, max_line_bytes), shard))
     # Filename handling
     elif isinstance(source, (str, os.PathLike)):
         filename = source if isinstance(source, str) else os.fspath(source)  # Ensure it's a string path
-        openhook = opener or _xopen
-        with openhook(filename, mode="rb", encoding=None) as fd:
-            yield from loader(fd, broken, cls=cls, **kwargs)
+        if with_cursor or resume_from is not None:
+            state = list(Cursor(0, 0, 0) if resume_from is None else Cursor(*resume_from))
+            lines = _iter_lines_from(filename, Cursor(*state), state, max_line_bytes)
+            objs = load_lines(lines)
+            if with_cursor:
+                # `loader` reads a line only when the next object is requested, so `state` matches each object.
+                yield from ((Cursor(*state), obj) for obj in objs)
+            else:
+                yield from objs
+        elif shard and opener is None:
+            with open(filename, mode="rb") as fd:  # Opened once, to detect its compression and read it.
+                extension = _get_file_extension(filename, "rb", fileobj=fd)
+                if extension in (ext_jsonl, None):
+                    yield from load_lines(_iter_shard_lines(fd, shard, max_line_bytes))
+                else:
+                    with _open_fileobj(extension, fd) as dfd:
+                        yield from load_lines(_select_shard(_iter_bounded_lines(dfd, max_line_bytes), shard))
+        else:
+            openhook = opener or _xopen
+            with openhook(filename, mode="rb", encoding=None) as fd:
+                yield from load_lines(_select_shard(_iter_bounded_lines(fd, max_line_bytes), shard))
     # File-like object handling
     else:
-        yield from loader(source, broken, cls=cls, **kwargs)
+        yield from load_lines(_select_shard(_iter_bounded_lines(source, max_line_bytes), shard))
 
 
 def load_archive(
@@ -463,6 +2221,11 @@ def load_archive(
     opener=None,
     broken=False,
     chunk_size=64 * 1024,
+    schema=None,
+    shard=None,
+    retries=_http_retries,
+    backoff=_http_backoff,
+    cache=None,
     cls=None,
     **kwargs,
 ):
@@ -472,8 +2235,7 @@ def load_archive(
     Tar archives can be compressed with gzip, bzip2, xz or zst (Python +3.14). (e.g., `.tar.gz`, `.tar.bz2`, `.tar.xz`).
 
     :param str | bytes | os.PathLike | urllib.request.Request | Any file: Archive file to load.
-        If a URL or `urllib.request.Request` object is provided, the file will be retrieved
-        remotely using `urllib.request.urlopen`.
+        If a URL or `urllib.request.Request` object is provided, the file will be retrieved remotely (see `load`).
         For more details, see: https://docs.python.org/3/library/urllib.request.html#urllib.request.urlopen
 
     :param str pattern: Pattern to match filenames inside the archive,
@@ -486,6 +2248,13 @@ def load_archive(
     :param int chunk_size:
         The size (in bytes) of chunks when reading from a URL to avoid loading the entire file into memory at once.
         Default is 64 KB (64 * 1024 bytes).
+    :param Optional[bool | Iterable[str]] schema: Keys shared by the records (or `True` to learn them from the first
+        one of each member). Decoded objects with exactly these keys reuse the same key strings.
+    :param Optional[tuple[int, int]] shard: `(index, count)` to load only one of `count` disjoint parts of each member,
+        split by line number (every `count`-th line starting from `index`).
+    :param int retries: Number of retries of a failed or interrupted download of a URL (see `load`).
+    :param float backoff: Seconds to wait before the first retry, doubled on each following retry.
+    :param Optional[URLCache] cache: Cache of HTTP(S) sources, revalidated with conditional requests.
 
     :param Optional[type[json.JSONDecoder] | Callable[..., Any]] cls: Custom decoder (defaults to `json.JSONDecoder`)
         - JSONDecoder subclass
@@ -495,6 +2264,10 @@ def load_archive(
     :rtype: Iterator[tuple[str, Iterator[Any]]]
     """
 
+    import tarfile
+    import tempfile
+    import zipfile
+
     with tempfile.TemporaryDirectory() as tmp:
 
         if _looks_like_url(file):
@@ -504,7 +2277,8 @@ def load_archive(
             # If a URL or request obj is provided, first download the file incrementally
             # to avoid loading the entire file into memory.
             tmp_path = os.path.join(tmp, "archive")
-            with urllib.request.urlopen(file) as src_fd, open(tmp_path, mode="wb") as tmp_fd:
+            response = _urlopen(file, retries=retries, backoff=backoff, cache=cache)
+            with response, _xresponse(response) as src_fd, open(tmp_path, mode="wb") as tmp_fd:
                 for block in iter(functools.partial(src_fd.read, chunk_size), b''):
                     tmp_fd.write(block)
             file = tmp_path
@@ -519,7 +2293,7 @@ def load_archive(
         for member in members:
             filename = member.name
             with _xfile(filename, member) as fp:
-                it = load(fp, opener=opener, broken=broken, cls=cls, **kwargs)
+                it = load(fp, opener=opener, broken=broken, schema=schema, shard=shard, cls=cls, **kwargs)
                 yield (filename, it)
 
 
@@ -531,6 +2305,9 @@ def dump_archive(
     opener=None,
     text_mode=True,
     dump_if_empty=True,
+    workers=None,
+    compression=None,
+    compresslevel=None,
     cls=None,
     **kwargs,
 ):
@@ -549,16 +2326,24 @@ def dump_archive(
     :param Optional[Callable] opener: Custom function to open the given file paths.
     :param bool text_mode: If false, write bytes to the file.
     :param bool dump_if_empty: If false, don't create an empty jsonlines file nor an empty archive.
+    :param Optional[int] workers: Number of threads compressing zip members concurrently.
+        Members are written directly into the zip, in order; the items of each file path must be contiguous.
+    :param Optional[int] compression: Compression method of zip members (defaults to `zipfile.ZIP_DEFLATED`).
+    :param Optional[int] compresslevel: Compression level of zip members.
 
     :param Optional[type[json.JSONEncoder] | Callable[..., Any]] cls: Custom encoder (defaults to `json.JSONEncoder`)
         - JSONEncoder subclass
         - Callable accepting arbitrary arguments and returning an encoded object
     :param Unpack[dict] kwargs: keyword arguments used to pass the Custom encoder (`cls`).
 
-    :raises ValueError: If a filepath in `items_by_relpath` is absolute, or if the archive extension is unsupported.
+    :raises ValueError: If a filepath in `items_by_relpath` is absolute, if the archive extension is unsupported,
+        if `compression` or `compresslevel` is given for a tar archive, or if `workers` is less than 1.
     :return: Path to the created archive file, or `None` if no items were dumped and `dump_if_empty` is `False`.
     """
 
+    import shutil
+    import tempfile
+
     def worker(root_dir, /):
         for relpath, iterable in data:
             file_relpath = os.fspath(relpath) if isinstance(relpath, os.PathLike) else relpath
@@ -573,6 +2358,17 @@ def dump_archive(
     # Validate the archive format before proceeding to dump.
     arc_fmt = _get_archive_format(path)
     archive = _del_archive_extension(path)
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1.")
+    direct = workers is not None or compression is not None or compresslevel is not None
+    if direct and arc_fmt != "zip" and (compression is not None or compresslevel is not None):
+        raise ValueError("compression and compresslevel are only supported for zip archives.")
+    if direct and arc_fmt == "zip" and opener is None:
+        if compression is None:
+            import zipfile
+
+            compression = zipfile.ZIP_DEFLATED
+        return _dump_zip(path, data, workers or 1, compression, compresslevel, dump_if_empty, cls, kwargs)
     # Dump the items to a temporary directory.
     with tempfile.TemporaryDirectory() as tmpdir:
         dump_fork(
@@ -588,3 +2384,1051 @@ def dump_archive(
             return shutil.make_archive(archive, arc_fmt, root_dir=tmpdir, logger=_logger)
         else:
             return None
+
+
+def load_columns(source, fields, /, *, chunk_size=None, opener=None, broken=False, cls=None, **kwargs):
+    """
+    Deserialize a JSON Lines source of objects into columns, holding a sequence of values per field.
+
+    Values are accumulated while streaming the source, so the objects themselves are never held in memory.
+    Objects missing a field contribute `None` to its column. Lines holding other values than objects are
+    broken lines: they raise a `TypeError`, or are skipped if `broken` is true.
+
+    :param str | bytes | os.PathLike | urllib.request.Request | Any source: Source to load (see `load`).
+    :param Iterable[str] | dict[str, Optional[str]] fields: Names of the fields to collect.
+        If a dict is provided, its values are `array.array` typecodes (e.g. "q" or "d") used to store numeric fields
+        compactly; `None` stores the values of the field in a list.
+    :param Optional[int] chunk_size: If provided, return an iterator yielding the columns every `chunk_size` objects.
+    :param Optional[Callable] opener: Custom function to open the file if a filename is provided.
+    :param bool broken: If true, skip broken lines (only logging a warning).
+
+    :param Optional[type[json.JSONDecoder] | Callable[..., Any]] cls: Custom decoder (defaults to `json.JSONDecoder`)
+        - JSONDecoder subclass
+        - Callable accepting arbitrary arguments and returning a decoded object
+    :param Unpack[dict] kwargs: keyword arguments used to pass the Custom decoder (`cls`).
+
+    :raises ValueError: If `chunk_size` is not a positive integer.
+    :raises TypeError: If a line does not hold a JSON object (unless `broken` is true),
+        or if a value cannot be stored in the `array.array` of its field.
+    :rtype: dict[str, list | array.array] | Iterator[dict[str, list | array.array]]
+    """
+
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    decode = _get_object_decode(_get_decode(cls, kwargs))
+    iterable = load(source, opener=opener, broken=broken, cls=decode)
+    columns = _iter_columns(iterable, fields, chunk_size)
+    return columns if chunk_size else next(columns)
+
+
+def count(source, /, *, opener=None, block_size=_block_size):
+    """
+    Count the non-empty lines of a JSON Lines source without deserializing them.
+
+    The (decompressed) content is read in large blocks and only its line terminators are counted,
+    which is much faster than loading the objects.
+
+    :param str | bytes | os.PathLike | Any source: Filename or binary file-like object to count.
+        Compressed files are detected as in `load`.
+    :param Optional[Callable] opener: Custom function to open the file if a filename is provided.
+    :param int block_size: Size in bytes of the blocks read at once.
+    :rtype: int
+    """
+
+    lines = 0
+    empty = 0
+    tail = _new_line_bytes  # Last bytes read, starting with a virtual terminator before the first line.
+    for block in _iter_blocks(source, opener, block_size):
+        lines += block.count(_new_line_bytes)
+        data = tail + block
+        for match in _blank_lines.finditer(data):
+            empty += match.end() >= len(tail)  # Empty lines ending within the tail were counted already.
+        tail = data[-3:]
+
+    if tail[-1:] != _new_line_bytes:
+        lines += 1  # The last line has no line terminator.
+        _, terminator, last = tail.rpartition(_new_line_bytes)
+        empty += bool(terminator) and _is_blank_line(last)
+    return lines - empty
+
+
+def stats(source, /, *, opener=None):
+    """
+    Compute statistics about the lines of a JSON Lines source without deserializing them.
+
+    Returns a dict with the following keys:
+        - `count`: Number of non-empty lines.
+        - `size`: Size in bytes of the (decompressed) content.
+        - `compressed_size`: Size in bytes of the file, or `None` if a file-like object is provided.
+        - `compression_ratio`: `size` divided by `compressed_size`, or `None` if it cannot be computed.
+        - `min_line_size`, `max_line_size`, `avg_line_size`: Size in bytes of the non-empty lines,
+          excluding the line terminator, or `None` if there are no lines.
+
+    :param str | bytes | os.PathLike | Any source: Filename or binary file-like object to inspect.
+        Compressed files are detected as in `load`.
+    :param Optional[Callable] opener: Custom function to open the file if a filename is provided.
+    :rtype: dict[str, Any]
+    """
+
+    def measure(lines):
+        nonlocal size, lines_count, total, min_size, max_size
+        for line in lines:
+            length = len(line)
+            size += length
+            if line[-1:] == _new_line_bytes:
+                length -= 1
+            if not _is_blank_line(line):
+                lines_count += 1
+                total += length
+                min_size = length if min_size is None else min(min_size, length)
+                max_size = length if max_size is None else max(max_size, length)
+
+    size = lines_count = total = 0
+    min_size = max_size = compressed_size = None
+    if isinstance(source, (str, os.PathLike)):
+        filename = os.fspath(source)
+        openhook = opener or _xopen
+        with openhook(filename, mode="rb", encoding=None) as fd:
+            measure(fd)
+        compressed_size = os.path.getsize(filename)
+    else:
+        measure(source)
+
+    return {
+        "count": lines_count,
+        "size": size,
+        "compressed_size": compressed_size,
+        "compression_ratio": size / compressed_size if compressed_size else None,
+        "min_line_size": min_size,
+        "max_line_size": max_size,
+        "avg_line_size": total / lines_count if lines_count else None,
+    }
+
+
+def sample(source, n, /, *, seed=None, seek=False, opener=None, broken=False, cls=None, **kwargs):
+    """
+    Deserialize a random sample of `n` objects from a JSON Lines source, keeping their original order.
+
+    The raw lines are sampled before deserialization, so only the selected lines are decoded.
+
+    :param str | bytes | os.PathLike | Any source: Filename or file-like object to sample.
+        Compressed files are detected as in `load`.
+    :param int n: Number of objects to select. Fewer objects are returned if the source has fewer lines.
+    :param Optional[int | str | bytes] seed: Seed of the random number generator, for reproducible samples.
+    :param bool seek: If true and the source is an uncompressed filename, select the lines by seeking to random
+        offsets instead of reading the whole file. This is much faster on large files, but biased:
+        lines following longer lines are more likely to be selected. If `n` is a large fraction of the lines,
+        the whole file is read instead (as without `seek`), so exactly `n` objects are still returned.
+    :param Optional[Callable] opener: Custom function to open the file if a filename is provided.
+    :param bool broken: If true, skip broken lines (only logging a warning).
+
+    :param Optional[type[json.JSONDecoder] | Callable[..., Any]] cls: Custom decoder (defaults to `json.JSONDecoder`)
+        - JSONDecoder subclass
+        - Callable accepting arbitrary arguments and returning a decoded object
+    :param Unpack[dict] kwargs: keyword arguments used to pass the Custom decoder (`cls`).
+
+    :raises ValueError: If `n` is negative.
+    :rtype: list[Any]
+    """
+
+    import random
+
+    if n < 0:
+        raise ValueError("Sample size must be non-negative.")
+
+    rng = random.Random(seed)
+    if seek and isinstance(source, (str, os.PathLike)) and opener is None:
+        filename = os.fspath(source)
+        with open(filename, mode="rb") as fd:  # Opened once, to detect its compression and read it.
+            extension = _get_file_extension(filename, "rb", fileobj=fd)
+            if extension in (ext_jsonl, None):
+                lines = _seek_sample(fd, n, rng)
+            else:
+                with _open_fileobj(extension, fd) as dfd:
+                    lines = _reservoir_sample(_iter_lines(dfd, None), n, rng)
+    else:
+        lines = _reservoir_sample(_iter_lines(source, opener), n, rng)
+    return list(loader(lines, broken, cls=cls, **kwargs))
+
+
+def load_many(
+    sources,
+    /,
+    *,
+    workers=4,
+    ordered=True,
+    with_path=False,
+    prefetch=4,
+    opener=None,
+    broken=False,
+    schema=None,
+    cls=None,
+    **kwargs,
+):
+    """
+    Deserialize several JSON Lines files into a single object iterator, reading the upcoming files in background.
+
+    Up to `workers` files are opened, decompressed and read ahead on background threads while the objects
+    of the current file are consumed, so the startup of each file does not stall the consumer.
+
+    :param str | os.PathLike | Iterable[str | os.PathLike] sources: Filenames to load, or a glob pattern
+        (e.g. "data/*.jsonl.gz") whose matches are loaded in sorted order.
+        Compressed files are detected as in `load`.
+    :param int workers: Maximum number of files read ahead simultaneously.
+    :param bool ordered: If true, yield the files in the given order; otherwise, yield first the files
+        whose data is already available.
+    :param bool with_path: If true, yield `(filename, object)` tuples instead of objects.
+    :param int prefetch: Maximum number of blocks of lines (about 1 MB each) read ahead per file.
+    :param Optional[Callable] opener: Custom function to open the files.
+    :param bool broken: If true, skip broken lines (only logging a warning).
+    :param Optional[bool | Iterable[str]] schema: Keys shared by the records (see `load`).
+
+    :param Optional[type[json.JSONDecoder] | Callable[..., Any]] cls: Custom decoder (defaults to `json.JSONDecoder`)
+        - JSONDecoder subclass
+        - Callable accepting arbitrary arguments and returning a decoded object
+    :param Unpack[dict] kwargs: keyword arguments used to pass the Custom decoder (`cls`).
+
+    :raises ValueError: If `workers` or `prefetch` is not a positive integer.
+    :rtype: Iterator[Any] | Iterator[tuple[str, Any]]
+    """
+
+    if workers < 1 or prefetch < 1:
+        raise ValueError("workers and prefetch must be positive integers.")
+
+    files = _iter_read_ahead_files(_iter_paths(sources), workers, ordered, prefetch, opener)
+    with contextlib.closing(files):
+        for filename, lines in files:
+            objs = loader(lines, broken, schema=schema, cls=cls, **kwargs)
+            if with_path:
+                yield from ((filename, obj) for obj in objs)
+            else:
+                yield from objs
+
+
+def transform(
+    src,
+    dst,
+    func,
+    /,
+    *,
+    workers=None,
+    ordered=True,
+    batch_size=_block_size,
+    opener=None,
+    broken=False,
+    decoder=None,
+    encoder=None,
+):
+    """
+    Apply a function to every object of a JSON Lines source and write the results to a JSON Lines destination.
+
+    The source is read in batches of raw lines that are deserialized, transformed and serialized
+    in a pool of worker processes, so the work is spread over several CPU cores.
+    At most two batches per worker are in flight at any time, keeping memory consumption constant.
+
+    :param str | bytes | os.PathLike | Any src: Filename or binary file-like object to read.
+        Compressed files are detected as in `load`.
+    :param str | bytes | os.PathLike | Any dst: Filename or binary file-like object to write.
+        Compressed files are written according to their extension, as in `dump`.
+    :param Callable[[Any], Any] func: Function applied to each object. Results that are `None` are discarded,
+        which allows filtering objects out. It must be picklable (e.g. a module-level function) if `workers` is not 1.
+    :param Optional[int] workers: Number of worker processes (defaults to the number of CPUs).
+        If 1, everything runs in the current process.
+    :param bool ordered: If true, the results are written in the order of the source;
+        otherwise, batches are written as soon as they are processed.
+    :param int batch_size: Approximate size in bytes of the batches of lines sent to the workers.
+    :param Optional[Callable] opener: Custom function to open the files if filenames are provided.
+    :param bool broken: If true, skip broken lines (only logging a warning).
+    :param Optional[type[json.JSONDecoder] | Callable[..., Any]] decoder: Custom decoder, as the `cls` of `load`.
+    :param Optional[type[json.JSONEncoder] | Callable[..., Any]] encoder: Custom encoder, as the `cls` of `dump`.
+
+    :raises ValueError: If `workers` is not a positive integer.
+    """
+
+    import concurrent.futures
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be a positive integer.")
+
+    with _open_or_pass(src, opener, "rb") as src_fd, _open_or_pass(dst, opener, "wb") as dst_fd:
+        batches = iter(functools.partial(src_fd.readlines, batch_size), [])
+        if workers == 1:
+            for lines in batches:
+                dst_fd.write(_transform_lines(lines, func, broken, decoder, encoder))
+            return
+
+        def pop_result():
+            if ordered:
+                future = in_flight.popleft()
+            else:
+                done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                future = done.pop()
+                in_flight.remove(future)
+            return future.result()
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight = collections.deque()
+            for lines in batches:
+                if len(in_flight) >= workers * 2:
+                    dst_fd.write(pop_result())
+                in_flight.append(pool.submit(_transform_lines, lines, func, broken, decoder, encoder))
+            while in_flight:
+                dst_fd.write(pop_result())
+
+
+def concat(sources, dst, /, *, opener=None, block_size=_block_size):
+    """
+    Concatenate JSON Lines sources into a destination without deserializing them.
+
+    The (decompressed) content of each source is copied in large blocks, so sources and destination
+    can use different compression formats. A line terminator is added to sources whose last line lacks one,
+    so lines of consecutive sources are never merged.
+
+    :param str | os.PathLike | Iterable[str | bytes | os.PathLike | Any] sources: Filenames or binary file-like
+        objects to concatenate, or a glob pattern whose matches are concatenated in sorted order.
+        Compressed files are detected as in `load`.
+    :param str | bytes | os.PathLike | Any dst: Filename or binary file-like object to write.
+        Compressed files are written according to their extension, as in `dump`.
+    :param Optional[Callable] opener: Custom function to open the files if filenames are provided.
+    :param int block_size: Size in bytes of the blocks copied at once.
+    """
+
+    if isinstance(sources, (str, os.PathLike)):
+        sources = _iter_paths(sources)
+
+    with _open_or_pass(dst, opener, "wb") as dst_fd:
+        write = dst_fd.write
+        for source in sources:
+            last = _new_line_bytes
+            for block in _iter_blocks(source, opener, block_size):
+                write(block)
+                last = block[-1:]
+            if last != _new_line_bytes:
+                write(_new_line_bytes)
+
+
+def recompress(src, dst, /, *, opener=None, block_size=_block_size):
+    """
+    Convert a JSON Lines source to another compression format without deserializing it.
+
+    For example, `recompress("data.jsonl.gz", "data.jsonl.xz")` is much faster than `dump(load(src), dst)`
+    because the decompressed content is copied in large blocks instead of being parsed and serialized again.
+
+    :param str | bytes | os.PathLike | Any src: Filename or binary file-like object to read.
+        Compressed files are detected as in `load`.
+    :param str | bytes | os.PathLike | Any dst: Filename or binary file-like object to write.
+        Compressed files are written according to their extension, as in `dump`.
+    :param Optional[Callable] opener: Custom function to open the files if filenames are provided.
+    :param int block_size: Size in bytes of the blocks copied at once.
+    """
+
+    concat((src,), dst, opener=opener, block_size=block_size)
+
+
+def split(
+    src,
+    dst_pattern,
+    /,
+    *,
+    parts=None,
+    max_bytes=None,
+    max_records=None,
+    workers=1,
+    opener=None,
+    block_size=_block_size,
+):
+    """
+    Split a JSON Lines source into parts without deserializing it, returning the filenames of the parts.
+
+    Parts are aligned to line boundaries. Exactly one of `parts`, `max_bytes` or `max_records` must be given.
+    Uncompressed files split by `parts` or `max_bytes` are split by byte ranges, which are copied within
+    the kernel (`os.copy_file_range` or `os.sendfile`) into uncompressed parts. Other sources are streamed,
+    skipping empty lines.
+
+    :param str | bytes | os.PathLike | Any src: Filename or binary file-like object to read.
+        Compressed files are detected as in `load`.
+    :param str | os.PathLike dst_pattern: Filename of the parts, formatted with their index
+        (e.g. "part-{:03}.jsonl.gz"). Compressed files are written according to their extension, as in `dump`.
+    :param Optional[int] parts: Number of parts of about the same size. Each part holds the lines starting within
+        its equal byte range of the (decompressed) source, so some parts may be empty.
+    :param Optional[int] max_bytes: Maximum size in bytes of the (decompressed) parts.
+        Lines longer than `max_bytes` get a part of their own.
+    :param Optional[int] max_records: Maximum number of lines per part.
+    :param int workers: Number of threads writing the parts of uncompressed files in parallel.
+    :param Optional[Callable] opener: Custom function to open the files if filenames are provided.
+    :param int block_size: Size in bytes of the blocks copied at once.
+
+    :raises ValueError: If not exactly one of `parts`, `max_bytes` or `max_records` is given, if it or `workers`
+        is not a positive integer, if `dst_pattern` does not contain exactly one `{}` field,
+        or if `parts` is given for a file-like object.
+    :return: Filenames of the parts written, in order.
+    :rtype: list[str]
+    """
+
+    options = {"parts": parts, "max_bytes": max_bytes, "max_records": max_records}
+    given = [name for name, value in options.items() if value is not None]
+    if len(given) != 1:
+        raise ValueError("Exactly one of parts, max_bytes or max_records must be given.")
+    if options[given[0]] < 1 or workers < 1:
+        raise ValueError(f"{given[0]} and workers must be positive integers.")
+
+    dst_pattern = _check_split_pattern(os.fspath(dst_pattern))
+    filename = os.fspath(src) if isinstance(src, (str, os.PathLike)) else None
+    if filename is None and parts:
+        raise ValueError("parts requires a filename, to measure the source beforehand.")
+
+    def write_empty_parts(names, stop, /):
+        for name in map(dst_pattern.format, range(len(names), stop)):
+            with _open_or_pass(name, opener, "wb"):
+                names.append(name)
+
+    def split_lines(fd, size, /):
+        names = []
+        lines = _iter_split_lines(fd, size, parts, max_bytes, max_records)
+        for index, group in itertools.groupby(lines, key=operator.itemgetter(0)):
+            write_empty_parts(names, index)  # Parts of byte ranges without line starts.
+            name = dst_pattern.format(index)
+            with _open_or_pass(name, opener, "wb") as dst_fd:
+                dst_fd.writelines(map(operator.itemgetter(1), group))
+            names.append(name)
+        write_empty_parts(names, parts or 0)
+        return names
+
+    if filename is None or opener is not None:
+        size = sum(map(len, _iter_blocks(filename, opener, block_size))) if parts else None
+        with _open_or_pass(src, opener, "rb") as fd:
+            return split_lines(fd, size)
+
+    with open(filename, mode="rb") as fd:  # Opened once, to detect its compression and read it.
+        extension = _get_file_extension(filename, "rb", fileobj=fd)
+        if extension not in (ext_jsonl, None) or max_records:
+            size = None
+            if parts:  # Measure the decompressed content, then read it again.
+                with _open_fileobj(extension, fd) as dfd:
+                    size = sum(map(len, iter(functools.partial(dfd.read, block_size), b"")))
+                fd.seek(0)
+            with _open_fileobj(extension, fd) as dfd:
+                return split_lines(dfd, size)
+        size = os.fstat(fd.fileno()).st_size
+        ranges = list(_iter_split_ranges(fd, size, parts, max_bytes, block_size))
+        fd.seek(max(size - 1, 0))
+        unterminated = fd.read(1) not in (b"", _new_line_bytes)
+
+    def write_part(index, start, end, /):
+        name = dst_pattern.format(index)
+        plain = _get_file_extension(name, "wb") in (ext_jsonl, None)
+        with open(filename, mode="rb") as src_fd, (open if plain else _xopen)(name, mode="wb") as dst_fd:
+            _copy_range(src_fd, dst_fd, start, end, block_size, plain)
+            if end == size > start and unterminated:
+                dst_fd.write(_new_line_bytes)
+        return name
+
+    if workers == 1:
+        return [write_part(index, start, end) for index, (start, end) in enumerate(ranges)]
+
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(write_part, index, start, end) for index, (start, end) in enumerate(ranges)]
+        return [future.result() for future in futures]
+
+
+def sort(
+    src,
+    dst,
+    /,
+    *,
+    key=None,
+    reverse=False,
+    max_memory=64 * 1024 * 1024,
+    workers=1,
+    tmp_dir=None,
+    opener=None,
+    broken=False,
+    decoder=None,
+    encoder=None,
+):
+    """
+    Sort the objects of a JSON Lines source into a destination, even if they do not fit in memory (external sort).
+
+    The source is split into runs of about `max_memory` bytes of raw lines, each of them sorted in memory
+    and spilled to a temporary compressed file; the runs are then lazily merged into the destination (see `merge`).
+    The sort is stable, as `sorted`.
+
+    :param str | bytes | os.PathLike | Any src: Filename or binary file-like object to read.
+        Compressed files are detected as in `load`.
+    :param str | bytes | os.PathLike | Any dst: Filename or binary file-like object to write.
+        Compressed files are written according to their extension, as in `dump`.
+    :param Optional[Callable[[Any], Any]] key: Function extracting the comparison key of each object, as in `sorted`.
+    :param bool reverse: If true, sort in descending order.
+    :param int max_memory: Approximate size in bytes of the raw lines sorted in memory at once.
+        The deserialized objects usually take several times this size.
+    :param int workers: Number of worker processes sorting runs in parallel.
+        If not 1, `key` must be picklable (e.g. a module-level function).
+    :param Optional[str | os.PathLike] tmp_dir: Directory where the temporary runs are stored
+        (defaults to the system temporary directory).
+    :param Optional[Callable] opener: Custom function to open the files if filenames are provided.
+    :param bool broken: If true, skip broken lines (only logging a warning).
+    :param Optional[type[json.JSONDecoder] | Callable[..., Any]] decoder: Custom decoder, as the `cls` of `load`.
+    :param Optional[type[json.JSONEncoder] | Callable[..., Any]] encoder: Custom encoder, as the `cls` of `dump`.
+
+    :raises ValueError: If `max_memory` or `workers` is not a positive integer.
+    """
+
+    import concurrent.futures
+    import tempfile
+
+    if max_memory < 1 or workers < 1:
+        raise ValueError("max_memory and workers must be positive integers.")
+
+    with _open_or_pass(src, opener, "rb") as src_fd:
+        batches = iter(functools.partial(src_fd.readlines, max_memory), [])
+        first = next(batches, [])
+        second = next(batches, None)
+        if second is None:  # Everything fits in memory: no need to spill runs.
+            objs = sorted(loader(first, broken, cls=decoder), key=key, reverse=reverse)
+            dump(objs, dst, opener=opener, text_mode=False, cls=encoder)
+            return
+
+        with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+            batches = enumerate(itertools.chain((first, second), batches))
+            args = (key, reverse, broken, decoder, encoder)
+            if workers == 1:
+                runs = [_dump_sorted_run(lines, os.path.join(tmp, f"{i}.jsonl.gz"), *args) for i, lines in batches]
+            else:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = collections.deque()
+                    runs = []
+                    for i, lines in batches:
+                        if len(futures) >= workers * 2:  # Bound the number of batches held in memory.
+                            runs.append(futures.popleft().result())
+                        path = os.path.join(tmp, f"{i}.jsonl.gz")
+                        futures.append(pool.submit(_dump_sorted_run, lines, path, *args))
+                    runs.extend(future.result() for future in futures)
+
+            inputs = [(run, _run_opener) for run in runs]
+            _merge(inputs, dst, opener, _max_open, tmp, key, reverse, broken, decoder, encoder)
+
+
+def merge(
+    sources,
+    dst,
+    /,
+    *,
+    key=None,
+    reverse=False,
+    max_open=_max_open,
+    tmp_dir=None,
+    opener=None,
+    broken=False,
+    decoder=None,
+    encoder=None,
+):
+    """
+    Merge JSON Lines sources, each of them already sorted, into a sorted destination.
+
+    The sources are lazily merged with `heapq.merge`, holding a single object per source in memory.
+    If there are more than `max_open` sources, they are merged in several passes through temporary files,
+    so that no more than `max_open` files are open at once. The merge is stable: equal objects keep
+    the order of their sources.
+
+    :param str | os.PathLike | Iterable[str | bytes | os.PathLike | Any] sources: Filenames or file-like objects
+        to merge, or a glob pattern whose matches are merged in sorted order.
+        Compressed files are detected as in `load`.
+    :param str | bytes | os.PathLike | Any dst: Filename or binary file-like object to write.
+        Compressed files are written according to their extension, as in `dump`.
+    :param Optional[Callable[[Any], Any]] key: Function extracting the comparison key of each object, as in `sorted`.
+    :param bool reverse: If true, the sources are sorted in descending order.
+    :param int max_open: Maximum number of sources merged at once.
+    :param Optional[str | os.PathLike] tmp_dir: Directory where the temporary files are stored
+        (defaults to the system temporary directory).
+    :param Optional[Callable] opener: Custom function to open the files if filenames are provided.
+    :param bool broken: If true, skip broken lines (only logging a warning).
+    :param Optional[type[json.JSONDecoder] | Callable[..., Any]] decoder: Custom decoder, as the `cls` of `load`.
+    :param Optional[type[json.JSONEncoder] | Callable[..., Any]] encoder: Custom encoder, as the `cls` of `dump`.
+
+    :raises ValueError: If `max_open` is lower than 2.
+    """
+
+    if max_open < 2:
+        raise ValueError("max_open must be at least 2.")
+    if isinstance(sources, (str, os.PathLike)):
+        sources = _iter_paths(sources)
+
+    inputs = [(source, opener) for source in sources]
+    _merge(inputs, dst, opener, max_open, tmp_dir, key, reverse, broken, decoder, encoder)
+
+
+def dedupe(
+    src,
+    dst,
+    /,
+    *,
+    key=None,
+    exact=True,
+    max_memory=256 * 1024 * 1024,
+    partitions=64,
+    capacity=10_000_000,
+    error_rate=0.001,
+    tmp_dir=None,
+    opener=None,
+    broken=False,
+    cls=None,
+    **kwargs,
+):
+    """
+    Remove the duplicated objects of a JSON Lines source, keeping the first occurrence of each one.
+
+    Objects are identified by a 128-bit hash of their key, stored in a compact array-backed set instead of
+    a Python `set` of full keys. The kept lines are written as they were read, without being serialized again.
+
+    - Exact mode (default): when the set of hashes grows beyond `max_memory` bytes, it is spilled to disk
+      together with the remaining lines, partitioned by hash, and each partition is deduplicated separately.
+    - Approximate mode (`exact=False`): a Bloom filter of fixed size is used instead; a small fraction
+      (about `error_rate`) of unique objects may be wrongly discarded as duplicates.
+
+    :param str | bytes | os.PathLike | Any src: Filename or binary file-like object to read.
+        Compressed files are detected as in `load`.
+    :param str | bytes | os.PathLike | Any dst: Filename or binary file-like object to write.
+        Compressed files are written according to their extension, as in `dump`.
+    :param Optional[Callable[[Any], Any]] key: Function returning the JSON-serializable key of each object.
+        If not provided, lines are compared as they are, without being deserialized.
+    :param bool exact: If false, use a Bloom filter (approximate mode).
+    :param int max_memory: Maximum size in bytes of the set of hashes before spilling to disk (exact mode).
+    :param int partitions: Number of partitions used when spilling to disk (exact mode).
+    :param int capacity: Expected number of unique objects (approximate mode).
+    :param float error_rate: Expected rate of unique objects wrongly discarded (approximate mode).
+    :param Optional[str | os.PathLike] tmp_dir: Directory where the spilled partitions are stored
+        (defaults to the system temporary directory).
+    :param Optional[Callable] opener: Custom function to open the files if filenames are provided.
+    :param bool broken: If true, skip broken lines (only logging a warning).
+
+    :param Optional[type[json.JSONDecoder] | Callable[..., Any]] cls: Custom decoder (defaults to `json.JSONDecoder`)
+        - JSONDecoder subclass
+        - Callable accepting arbitrary arguments and returning a decoded object
+    :param Unpack[dict] kwargs: keyword arguments used to pass the Custom decoder (`cls`).
+    """
+
+    import hashlib
+    import tempfile
+
+    decode = _get_decode(cls, kwargs)
+
+    def hash_bytes(data):
+        return int.from_bytes(hashlib.blake2b(data, digest_size=16).digest(), "big")
+
+    def iter_hashes(lines):
+        for lineno, line in enumerate(lines, start=1):
+            data = line.encode(_utf_8) if isinstance(line, str) else line
+            if _is_blank_line(data):
+                continue
+            if key is None:
+                yield hash_bytes(data.rstrip()), data
+                continue
+            try:
+                value = key(decode(data.decode(_utf_8)))
+            except Exception as e:
+                _logger.warning("Broken line at %s: %s", lineno, e)
+                if not broken:
+                    raise
+            else:
+                yield hash_bytes(_key_encode(value).encode(_utf_8)), data
+
+    def terminated(data):
+        return data if data.endswith(_new_line_bytes) else data + _new_line_bytes
+
+    with _open_or_pass(src, opener, "rb") as src_fd, _open_or_pass(dst, opener, "wb") as dst_fd:
+        hashed = iter_hashes(src_fd)
+        if exact:
+            add, items = _new_hash_set(max_memory)
+        else:
+            add = _new_bloom_filter(capacity, error_rate)
+        for h, data in hashed:
+            is_new = add(h)
+            if is_new is None:  # Memory limit reached: spill to disk
+                hashed = itertools.chain(((h, data),), hashed)
+                break
+            elif is_new:
+                dst_fd.write(terminated(data))
+        else:  # Everything fitted in memory.
+            return
+
+        with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+            _logger.info("Deduplication set is full, spilling to %s partitions", partitions)
+            paths = [os.path.join(tmp, f"{i}.jsonl.gz") for i in range(partitions)]
+
+            def spilled():
+                for h in items():
+                    yield paths[(h >> 1) % partitions], ([h],)  # Hashes already seen go first in each partition.
+                for seq, (h, data) in enumerate(hashed):
+                    yield paths[(h >> 1) % partitions], ([h, seq, data.decode(_utf_8)],)
+
+            dump_fork(spilled(), opener=_run_opener, dump_if_empty=False)
+
+            def deduped(path):
+                add, _ = _new_hash_set(float("inf"))
+                for h, *item in load(path, opener=_run_opener):
+                    if add(h) and item:
+                        yield item
+
+            existing = [path for path in paths if os.path.exists(path)]
+            merged = heapq.merge(*map(deduped, existing), key=operator.itemgetter(0))
+            dst_fd.writelines(terminated(data.encode(_utf_8)) for _, data in merged)
+
+
+def register_codec(ext, magic, opener, /):
+    """
+    Register a compression codec, used to read and write the files with its extension or initial bytes.
+
+    The codec is honored by every function opening files or file-like objects (e.g. `load`, `dump`, `dump_fork`,
+    `load_archive`), and replaces the built-in one if registered with the same extension.
+
+    :param str ext: File extension of the compressed files, including the leading dot (e.g. ".lz4").
+    :param Optional[bytes] magic: Initial bytes identifying the compressed files, used for files without
+        a recognized extension (`None` to only detect the codec by extension).
+    :param Callable opener: Function like `gzip.open`, called as `opener(file, mode=mode, encoding=encoding)`
+        where `file` is a filename or a binary file-like object, and `mode` a binary or text mode.
+    :raises ValueError: If the extension does not start with a dot.
+    """
+
+    if not ext.startswith(".") or len(ext) < 2:
+        raise ValueError(f"Invalid codec extension: {ext!r}")
+
+    extensions.add(ext)
+    _openers[ext] = opener
+    _magics.pop(ext, None)
+    if magic:
+        _magics[ext] = bytes(magic)
+
+
+# ---------------------------------- Command-line interface ----------------------------------
+
+
+def _cli_input(name, /):
+    """Open an input of the command-line interface as a binary stream: a filename, or "-" for the standard input."""
+
+    if name != "-":
+        return _xopen(name, mode="rb")
+    stdin = sys.stdin.buffer
+    size = _get_magic_size()
+    ext = _get_magic_extension(stdin.peek(size)[:size])  # Compressed standard input, detected without consuming it.
+    return contextlib.nullcontext(stdin) if ext is None else _open_fileobj(ext, stdin)
+
+
+def _cli_output(name, /):
+    """Open the output of the command-line interface: a filename (compressed by extension), or "-" for the stdout."""
+
+    return contextlib.nullcontext(sys.stdout.buffer) if name == "-" else _xopen(name, mode="wb")
+
+
+def _iter_cli_files(files, workers, /):
+    """Iterate over the raw lines of each input, reading up to `workers` files ahead on background threads."""
+
+    if workers > 1 and len(files) > 1 and "-" not in files:
+        with contextlib.closing(_iter_read_ahead_files(iter(files), workers, True, 4, None)) as inputs:
+            yield from (lines for _, lines in inputs)
+    else:
+        for name in files:
+            with _cli_input(name) as fd:
+                yield fd
+
+
+def _iter_cli_lines(files, workers, totals, /):
+    """Iterate over the non-empty raw lines of the inputs, terminated by a line feed, and add them to `totals`."""
+
+    return _iter_counted_lines(_iter_cli_files(files, workers), totals)
+
+
+def _iter_counted_lines(fds, totals, /):
+    """Iterate over the non-empty raw lines of binary files, terminated by a line feed, and add them to `totals`."""
+
+    lines = size = 0
+    try:
+        for fd in fds:
+            for line in itertools.filterfalse(_is_blank_line, fd):
+                lines += 1
+                size += len(line)
+                yield line if line[-1:] == _new_line_bytes else line + _new_line_bytes
+    finally:
+        totals["lines"] += lines
+        totals["bytes"] += size
+
+
+def _tail_lines(fd, n, /):
+    """Return the last `n` non-empty raw lines of an uncompressed binary file, reading it backwards in blocks."""
+
+    lines = []  # In reverse order.
+    position = fd.seek(0, os.SEEK_END)
+    partial = b""  # Start of the earliest line read, which may continue in the previous block.
+    while position and len(lines) < n:
+        size = min(position, _block_size)
+        position = fd.seek(position - size)
+        partial, *complete = (fd.read(size) + partial).split(_new_line_bytes)
+        terminated = (line + _new_line_bytes for line in reversed(complete))
+        lines.extend(itertools.filterfalse(_is_blank_line, terminated))
+    if not position and not _is_blank_line(partial + _new_line_bytes):
+        lines.append(partial + _new_line_bytes)
+    return lines[:n][::-1]
+
+
+def _get_cli_predicate(args, /):
+    """Build the predicate of the `filter` command, matching raw lines by substring and/or by `key=value`."""
+
+    predicates = []
+    if args.contains is not None:
+        text = args.contains.encode(_utf_8)
+        predicates.append(lambda line: text in line)
+    if args.where is not None:
+        key, sep, value = args.where.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid condition {args.where!r}, expected KEY=VALUE.")
+        with contextlib.suppress(ValueError):  # Not a JSON value: compared as a string.
+            value = json.loads(value)
+        path = key.split(".")
+        missing = object()
+
+        def where(line):
+            try:
+                obj = _default_decode(line.decode(_utf_8))
+            except ValueError:
+                if args.broken:
+                    return False
+                raise
+            for name in path:
+                obj = obj.get(name, missing) if isinstance(obj, dict) else missing
+            return obj == value
+
+        predicates.append(where)
+    return lambda line: all(predicate(line) for predicate in predicates) != args.invert
+
+
+def _cli_cat(args, totals, /):
+    with _cli_output(args.output) as out:
+        out.writelines(_iter_cli_lines(args.files, args.workers, totals))
+
+
+def _cli_head(args, totals, /):
+    lines = _iter_cli_lines(args.files, args.workers, totals)
+    with contextlib.closing(lines), _cli_output(args.output) as out:
+        out.writelines(itertools.islice(lines, args.lines))
+
+
+def _cli_tail(args, totals, /):
+    (name, *others) = args.files
+    if others or name == "-":
+        lines = collections.deque(_iter_cli_lines(args.files, args.workers, totals), maxlen=args.lines)
+    else:
+        with open(name, mode="rb") as fd:  # Opened once, to detect its compression and read it.
+            extension = _get_file_extension(name, "rb", fileobj=fd)
+            if extension in (ext_jsonl, None):
+                lines = _tail_lines(fd, args.lines)
+                totals["lines"] += len(lines)
+                totals["bytes"] += sum(map(len, lines))
+            else:
+                with _open_fileobj(extension, fd) as dfd:
+                    lines = collections.deque(_iter_counted_lines([dfd], totals), maxlen=args.lines)
+    with _cli_output(args.output) as out:
+        out.writelines(lines)
+
+
+def _cli_count(args, totals, /):
+    import concurrent.futures
+
+    def count_input(name):
+        with _cli_input(name) as fd:
+            return count(fd)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as pool:
+        counts = list(pool.map(count_input, args.files))
+    totals["lines"] += sum(counts)
+    totals["bytes"] = None  # Lines are counted in blocks, without being measured.
+    if len(counts) == 1:
+        print(counts[0])
+    else:
+        for name, n in zip(args.files, counts):
+            print(n, name, sep="\t")
+        print(sum(counts), "total", sep="\t")
+
+
+def _cli_sample(args, totals, /):
+    import random
+
+    rng = random.Random(args.seed)
+    (name, *others) = args.files
+    if not args.seek or others or name == "-":
+        lines = _reservoir_sample(_iter_cli_lines(args.files, args.workers, totals), args.lines, rng)
+    else:
+        with open(name, mode="rb") as fd:  # Opened once, to detect its compression and read it.
+            extension = _get_file_extension(name, "rb", fileobj=fd)
+            if extension in (ext_jsonl, None):
+                lines = _seek_sample(fd, args.lines, rng)
+                totals["lines"] += len(lines)
+                totals["bytes"] += sum(map(len, lines))
+            else:
+                with _open_fileobj(extension, fd) as dfd:
+                    lines = _reservoir_sample(_iter_counted_lines([dfd], totals), args.lines, rng)
+    with _cli_output(args.output) as out:
+        out.writelines(line if line[-1:] == _new_line_bytes else line + _new_line_bytes for line in lines)
+
+
+def _cli_recompress(args, totals, /):
+    with _cli_input(args.src) as fd, _cli_output(args.dst) as out:
+        for block in iter(functools.partial(fd.read, _block_size), b""):
+            totals["lines"] += block.count(_new_line_bytes)
+            totals["bytes"] += len(block)
+            out.write(block)
+
+
+def _cli_split(args, totals, /):
+    with contextlib.ExitStack() as stack:
+        src = args.src if args.src != "-" else stack.enter_context(_cli_input(args.src))
+        options = {"parts": args.parts, "max_bytes": args.max_bytes, "max_records": args.max_records}
+        names = split(src, args.pattern, workers=args.workers, **options)
+    totals["lines"] = None  # Parts are split without reading their lines.
+    totals["bytes"] = sum(map(os.path.getsize, names))
+
+
+def _cli_filter(args, totals, /):
+    predicate = _get_cli_predicate(args)
+    with _cli_output(args.output) as out:
+        out.writelines(filter(predicate, _iter_cli_lines(args.files, args.workers, totals)))
+
+
+def _positive_int(value, /):
+    """Parse a positive integer argument of the command-line interface."""
+
+    number = int(value)
+    if number < 1:
+        raise ValueError(value)
+    return number
+
+
+def _non_negative_int(value, /):
+    """Parse a non-negative integer argument of the command-line interface."""
+
+    number = int(value)
+    if number < 0:
+        raise ValueError(value)
+    return number
+
+
+def _get_cli_parser():
+    """Build the argument parser of the command-line interface."""
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m jsonl",
+        description="Process JSON Lines files without deserializing them. Compressed inputs are detected "
+        "by extension or magic numbers (also on the standard input), and outputs are compressed by extension.",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+
+    stats_parser = argparse.ArgumentParser(add_help=False)
+    stats_parser.add_argument("--stats", action="store_true", help="print throughput statistics to standard error")
+    inputs_parser = argparse.ArgumentParser(add_help=False, parents=[stats_parser])
+    inputs_parser.add_argument("files", nargs="*", default=["-"], metavar="FILE", help="input files (default: stdin)")
+    inputs_parser.add_argument(
+        "-w",
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="number of input files read in parallel (default: 1)",
+    )
+    output_parser = argparse.ArgumentParser(add_help=False, parents=[inputs_parser])
+    output_parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+
+    command = commands.add_parser("cat", parents=[output_parser], help="concatenate the lines of the inputs")
+    command.set_defaults(func=_cli_cat)
+    for func, help_ in ((_cli_head, "first lines of the inputs"), (_cli_tail, "last lines of the inputs")):
+        command = commands.add_parser(func.__name__[len("_cli_") :], parents=[output_parser], help=help_)
+        command.add_argument("-n", "--lines", type=_non_negative_int, default=10, help="number of lines (default: 10)")
+        command.set_defaults(func=func)
+    command = commands.add_parser("count", parents=[inputs_parser], help="count the lines of each input")
+    command.set_defaults(func=_cli_count)
+
+    command = commands.add_parser("sample", parents=[output_parser], help="random sample of lines, in input order")
+    command.add_argument("-n", "--lines", type=_non_negative_int, default=10, help="number of lines (default: 10)")
+    command.add_argument("--seed", help="seed of the random number generator")
+    command.add_argument("--seek", action="store_true", help="approximate sample of an uncompressed file by seeking")
+    command.set_defaults(func=_cli_sample)
+
+    command = commands.add_parser("recompress", parents=[stats_parser], help="change the compression of a file")
+    command.add_argument("src", help='input file, or "-" for stdin')
+    command.add_argument("dst", help='output file compressed according to its extension, or "-" for stdout')
+    command.set_defaults(func=_cli_recompress)
+
+    command = commands.add_parser("split", parents=[stats_parser], help="split the lines of a file into parts")
+    command.add_argument("src", help='input file, or "-" for stdin')
+    command.add_argument("pattern", help='output filenames, formatted with the part index (e.g. "part-{:03}.jsonl.gz")')
+    group = command.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        "--parts",
+        type=_positive_int,
+        help="number of parts of about the same size in bytes (not in lines: parts may be empty if lines are long)",
+    )
+    group.add_argument("--max-bytes", type=_positive_int, help="maximum size in bytes of the (decompressed) parts")
+    group.add_argument("--max-records", type=_positive_int, help="maximum number of lines per part")
+    command.add_argument(
+        "-w",
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="number of parts of an uncompressed file written in parallel (default: 1)",
+    )
+    command.set_defaults(func=_cli_split)
+
+    command = commands.add_parser("filter", parents=[output_parser], help="lines matching a substring or a key")
+    command.add_argument("-c", "--contains", metavar="TEXT", help="select the lines containing TEXT")
+    command.add_argument(
+        "-k",
+        "--where",
+        metavar="KEY=VALUE",
+        help="select the objects whose KEY (dotted for nested keys) equals "
+        "VALUE, parsed as JSON if valid or else taken as a string",
+    )
+    command.add_argument("-v", "--invert", action="store_true", help="select the non-matching lines")
+    command.add_argument("--broken", action="store_true", help="skip malformed lines instead of failing")
+    command.set_defaults(func=_cli_filter)
+    return parser
+
+
+def _main(argv=None, /):
+    """Run the command-line interface (`python -m jsonl`) with the given arguments, returning its exit status."""
+
+    parser = _get_cli_parser()
+    args = parser.parse_args(argv)
+    if args.command == "filter" and args.contains is None and args.where is None:
+        parser.error("filter requires --contains and/or --where")
+
+    totals = {"lines": 0, "bytes": 0}
+    start = time.perf_counter()
+    try:
+        args.func(args, totals)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The standard output was closed early (e.g. piped into `head`): silence the flush at exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"{parser.prog}: error: {e}", file=sys.stderr)
+        return 1
+
+    if args.stats:
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        lines, size = totals["lines"], totals["bytes"]
+        if lines is None:
+            message = f"{size / 1e6:,.1f} MB in {elapsed:.3f} s ({size / 1e6 / elapsed:,.1f} MB/s)"
+        else:
+            message = f"{lines:,} lines in {elapsed:.3f} s: {lines / elapsed:,.0f} lines/s"
+            if size is not None:
+                message += f", {size / 1e6:,.1f} MB ({size / 1e6 / elapsed:,.1f} MB/s)"
+        print(message, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
@@ -26,12 +26,12 @@ class CustomEncoder(json.JSONEncoder):
 
 
 @contextlib.contextmanager
-def manage_http_server(directory):
+def manage_http_server(directory, handler=None):
     """
     Context manager to run a simple HTTP server in a separate thread.
 
     Yields the base URI of the server.
-    The server serves files from the specified directory.
+    The server serves files from the specified directory, unless a request `handler` class is given.
     """
 
     class MyHandler(http.server.SimpleHTTPRequestHandler):
@@ -41,7 +41,7 @@ def manage_http_server(directory):
 
     server = http.server.ThreadingHTTPServer(
         ("127.0.0.1", 0),
-        functools.partial(MyHandler, directory=os.path.abspath(directory)),
+        handler or functools.partial(MyHandler, directory=os.path.abspath(directory)),
     )
     name, port = server.socket.getsockname()
     url = "http://{}:{}/".format(name, port)
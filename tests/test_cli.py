@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+import jsonl
+import tests
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+content = tests.string_data.encode(jsonl._utf_8)
+lines = content.splitlines(keepends=True)
+
+
+@pytest.fixture
+def stdin(monkeypatch):
+    def set_stdin(data):
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BufferedReader(io.BytesIO(data)), encoding=jsonl._utf_8))
+
+    return set_stdin
+
+
+@pytest.fixture
+def src(tmp_dir, file_extension):
+    return tests.write_text(str(tmp_dir / f"src{file_extension}"), content=tests.string_data)
+
+
+def run(capsysbinary, *argv):
+    assert jsonl._main(argv) == 0
+    return capsysbinary.readouterr().out
+
+
+def test_cat(capsysbinary, src, tmp_dir):
+    other = tests.write_text(str(tmp_dir / "other.jsonl"), content='\n{"a": 1}')  # Blank and unterminated lines.
+    assert run(capsysbinary, "cat", src, other) == content + b'{"a": 1}\n'
+
+
+@pytest.mark.parametrize("workers", (1, 3))
+def test_cat_workers(capsysbinary, tmp_dir, workers):
+    paths = [tests.write_text(str(tmp_dir / f"{i}.jsonl.gz"), content=tests.string_data) for i in range(5)]
+    assert run(capsysbinary, "cat", "--workers", str(workers), *paths) == content * 5
+
+
+@pytest.mark.parametrize("data", (content, gzip.compress(content)))
+def test_cat_stdin(capsysbinary, stdin, data):
+    stdin(data)
+    assert run(capsysbinary, "cat") == content
+
+
+def test_cat_output(capsysbinary, src, tmp_dir):
+    dst = str(tmp_dir / "dst.jsonl.gz")
+    assert run(capsysbinary, "cat", src, "-o", dst) == b""
+    assert tests.read_text(dst) == tests.string_data
+
+
+@pytest.mark.parametrize("n", (0, 1, 3, 10))
+def test_head(capsysbinary, src, n):
+    assert run(capsysbinary, "head", "-n", str(n), src) == b"".join(lines[:n])
+
+
+@pytest.mark.parametrize("n", (0, 1, 3, 10))
+def test_tail(capsysbinary, src, n):
+    assert run(capsysbinary, "tail", "-n", str(n), src) == b"".join(lines[max(len(lines) - n, 0) :])
+
+
+@pytest.mark.parametrize("text", ("\n\n" + tests.string_data + "\n", tests.string_data.rstrip("\n")))
+def test_tail_lines(tmp_dir, monkeypatch, text):
+    monkeypatch.setattr(jsonl, "_block_size", 7)  # Lines spanning several blocks.
+    path = tests.write_text(str(tmp_dir / "src.jsonl"), content=text)
+    with open(path, mode="rb") as fd:
+        for n in range(len(lines) + 2):
+            assert jsonl._tail_lines(fd, n) == lines[max(len(lines) - n, 0) :]
+
+
+def test_count(capsysbinary, src, tmp_dir):
+    assert run(capsysbinary, "count", src) == b"4\n"
+    other = tests.write_text(str(tmp_dir / "other.jsonl"), content=tests.string_data * 2)
+    expected = "4\t{}\n8\t{}\n12\ttotal\n".format(src, other).encode(jsonl._utf_8)
+    assert run(capsysbinary, "count", "-w", "2", src, other) == expected
+
+
+def test_count_stdin(capsysbinary, stdin):
+    stdin(gzip.compress(content))
+    assert run(capsysbinary, "count") == b"4\n"
+
+
+@pytest.mark.parametrize("seek", (False, True))
+def test_sample(capsysbinary, src, seek):
+    output = run(capsysbinary, "sample", "-n", "2", "--seed", "1", src, *(("--seek",) if seek else ()))
+    sampled = output.splitlines(keepends=True)
+    assert len(sampled) == 2
+    assert sampled == sorted(sampled, key=lines.index)
+
+
+@pytest.mark.parametrize("seek", (False, True))
+def test_sample_zero_lines(capsysbinary, src, seek):
+    assert run(capsysbinary, "sample", "-n", "0", src, *(("--seek",) if seek else ())) == b""
+
+
+def test_recompress(capsysbinary, src, tmp_dir):
+    dst = str(tmp_dir / "dst.jsonl.xz")
+    run(capsysbinary, "recompress", src, dst)
+    assert tests.read_text(dst) == tests.string_data
+
+
+@pytest.mark.parametrize(
+    "options, expected",
+    (
+        (("--parts", "3"), [2, 1, 1]),
+        (("--parts", "6"), [1, 1, 0, 1, 1, 0]),
+        (("--parts", "2", "-w", "2"), [2, 2]),
+        (("--max-bytes", "150"), [2, 2]),
+        (("--max-records", "3"), [3, 1]),
+        (("--max-records", "4"), [4]),
+    ),
+)
+def test_split(capsysbinary, src, tmp_dir, options, expected):
+    pattern = str(tmp_dir / "part-{:02}.jsonl.gz")
+    run(capsysbinary, "split", src, pattern, *options)
+    assert not os.path.exists(pattern.format(len(expected)))
+    parts = [tests.read_text(pattern.format(i)).splitlines(keepends=True) for i in range(len(expected))]
+    assert list(map(len, parts)) == expected
+    assert "".join(map("".join, parts)) == tests.string_data
+
+
+def test_split_invalid_pattern(capsysbinary, src, tmp_dir):
+    assert jsonl._main(["split", src, str(tmp_dir / "part.jsonl"), "--parts", "2"]) == 1
+    assert b"exactly one {} field" in capsysbinary.readouterr().err
+
+
+def test_split_stdin(capsysbinary, stdin, tmp_dir):
+    stdin(gzip.compress(content))
+    pattern = str(tmp_dir / "part-{}.jsonl")
+    run(capsysbinary, "split", "-", pattern, "--max-records", "2")
+    parts = [tests.read_text(pattern.format(i)).encode(jsonl._utf_8) for i in range(2)]
+    assert parts == [b"".join(lines[:2]), b"".join(lines[2:])]
+    assert jsonl._main(["split", "-", pattern, "--parts", "2"]) == 1
+    assert b"parts requires a filename" in capsysbinary.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "options, expected",
+    (
+        (("--contains", "Alexa"), [1]),
+        (("--contains", "two pair", "--invert"), [0, 2, 3]),
+        (("--where", "name=May"), [2]),
+        (("--where", 'name="May"'), [2]),
+        (("--where", "wins=[]"), [2]),
+        (("--where", "name=Nobody"), []),
+        (("--where", "name.first=May"), []),
+        (("--contains", "wins", "--where", "name=May"), [2]),
+    ),
+)
+def test_filter(capsysbinary, src, options, expected):
+    assert run(capsysbinary, "filter", src, *options) == b"".join(lines[i] for i in expected)
+
+
+def test_filter_nested_key(capsysbinary, tmp_dir):
+    path = tests.write_text(str(tmp_dir / "src.jsonl"), content='{"a": {"b": 1}}\n{"a": 1}\n[1]\n')
+    assert run(capsysbinary, "filter", path, "--where", "a.b=1") == b'{"a": {"b": 1}}\n'
+
+
+def test_filter_broken(capsysbinary, tmp_dir):
+    path = tests.write_text(str(tmp_dir / "src.jsonl"), content='{"a": 1}\n{"a": \n{"a": 1}\n')
+    assert run(capsysbinary, "filter", path, "--where", "a=1", "--broken") == b'{"a": 1}\n' * 2
+    assert jsonl._main(["filter", path, "--where", "a=1"]) == 1
+    assert "error" in capsysbinary.readouterr().err.decode()
+
+
+@pytest.mark.parametrize("command", ("head", "tail", "sample"))
+def test_negative_lines(capsysbinary, src, command):
+    with pytest.raises(SystemExit):
+        jsonl._main([command, "-n", "-1", src])
+    assert b"invalid _non_negative_int value: '-1'" in capsysbinary.readouterr().err
+
+
+def test_filter_without_condition(src):
+    with pytest.raises(SystemExit):
+        jsonl._main(["filter", src])
+
+
+def test_stats(capsysbinary, src, tmp_dir):
+    assert jsonl._main(["cat", "--stats", src]) == 0
+    assert b"4 lines in" in capsysbinary.readouterr().err
+    assert jsonl._main(["split", "--stats", src, str(tmp_dir / "part-{}.jsonl"), "--parts", "2"]) == 0
+    assert b"MB in" in capsysbinary.readouterr().err
+
+
+def test_missing_file(capsysbinary, tmp_dir):
+    assert jsonl._main(["cat", str(tmp_dir / "missing.jsonl")]) == 1
+    assert b"No such file" in capsysbinary.readouterr().err
+
+
+def test_module(tmp_dir):
+    path = tests.write_text(str(tmp_dir / "src.jsonl.gz"), content=tests.string_data)
+    args = [sys.executable, "-m", "jsonl", "head", "-n", "1", path]
+    result = subprocess.run(args, capture_output=True, check=True, cwd=ROOT_DIR)
+    assert result.stdout == lines[0]
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+import io
+
+import pytest
+
+import jsonl
+import tests
+
+
+@pytest.mark.parametrize("src_extension", sorted(jsonl.extensions))
+def test_concat(tmp_dir, src_extension, file_extension):
+    src1 = tests.write_text(str(tmp_dir / f"src1{src_extension}"), content=tests.string_data)
+    src2 = tests.write_text(str(tmp_dir / f"src2{src_extension}"), content='["no line terminator"]')
+    src3 = tests.write_text(str(tmp_dir / f"src3{src_extension}"))
+    dst = str(tmp_dir / f"dst{file_extension}")
+
+    jsonl.concat([src1, src2, src3, src1], dst)
+    assert list(jsonl.load(dst)) == [*tests.data, ["no line terminator"], *tests.data]
+
+
+def test_concat_glob(tmp_dir):
+    for i in range(3):
+        jsonl.dump([{"id": i}], tmp_dir / f"part-{i}.jsonl.gz")
+    dst = io.BytesIO()
+    jsonl.concat(tmp_dir / "part-*.jsonl.gz", dst)
+    assert dst.getvalue() == b'{"id": 0}\n{"id": 1}\n{"id": 2}\n'
+
+
+def test_concat_file_objects():
+    dst = io.BytesIO()
+    jsonl.concat([io.BytesIO(b"[1]\n"), io.BytesIO(b"[2]"), io.BytesIO(b"[3]\n")], dst, block_size=2)
+    assert dst.getvalue() == b"[1]\n[2]\n[3]\n"
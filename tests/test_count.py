@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import io
+import pathlib
+
+import pytest
+
+import jsonl
+import tests
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        (b"", 0),
+        (b"\n", 0),
+        (b"\n\n\n", 0),
+        (b"[1]", 1),
+        (b"[1]\n", 1),
+        (b"[1]\n[2]", 2),
+        (b"[1]\n[2]\n", 2),
+        (b"\n[1]\n\n\n[2]\n\n", 2),
+        (b"[1]\r\n\r\n[2]\r\n", 2),
+        (b"\r\n \n\t\n[1]\n\r", 1),
+        (b"[1]\n  ", 1),
+        (b"[1]\n   \n   ", 3),  # Longer whitespace-only lines are (broken) records, as for `load`.
+    ],
+)
+@pytest.mark.parametrize("block_size", (1, 2, 3, 1024))
+def test_count_fileobj(content, expected, block_size):
+    assert jsonl.count(io.BytesIO(content), block_size=block_size) == expected
+
+
+def test_count_filepath(filepath, pathlike):
+    tests.write_text(filepath, content=tests.string_data)
+    source = pathlib.Path(filepath) if pathlike else filepath
+    assert jsonl.count(source) == len(tests.data)
+
+
+def test_count_using_opener(filepath):
+    tests.write_text(filepath, content=tests.string_data)
+    assert jsonl.count(filepath, opener=jsonl._xopen) == len(tests.data)
+
+
+@pytest.mark.parametrize("content", (b"[1]\r\n\r\n[2]\r\n", b"\n[1]\n \n\r\n[2]\n\t\n", b"[1]\n   \n[2]\n  "))
+def test_count_matches_other_utilities(tmp_dir, content):
+    path = tmp_dir / "src.jsonl"
+    path.write_bytes(content)
+    expected = jsonl.count(path)
+    assert jsonl.stats(path)["count"] == expected
+    assert len(list(jsonl._iter_lines(path, None))) == expected  # Lines sampled by `sample`.
+    assert jsonl.sample(path, 10, broken=True) == jsonl.sample(path, 10, seek=True, broken=True)
+    assert len(jsonl.split(path, str(tmp_dir / "part-{}.jsonl.gz"), max_records=1)) == expected
+    jsonl.dedupe(path, tmp_dir / "dst.jsonl")
+    assert jsonl.count(tmp_dir / "dst.jsonl") == expected
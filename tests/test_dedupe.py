@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+import random
+
+import pytest
+
+import jsonl
+
+data = [{"id": i % 1500, "value": i % 600} for i in random.Random(0).sample(range(3000), 3000)]
+
+
+def unique(objs, key):
+    seen = set()
+    for obj in objs:
+        if (k := json.dumps(key(obj))) not in seen:
+            seen.add(k)
+            yield obj
+
+
+@pytest.mark.parametrize("max_memory", (16 * 1024, 32 * 1024, 10**9))
+def test_dedupe_exact(tmp_dir, file_extension, max_memory):
+    src = tmp_dir / f"src{file_extension}"
+    dst = tmp_dir / f"dst{file_extension}"
+    jsonl.dump(data, src)
+
+    jsonl.dedupe(src, dst, key=lambda obj: obj["id"], max_memory=max_memory, partitions=4, tmp_dir=tmp_dir)
+    assert list(jsonl.load(dst)) == list(unique(data, lambda obj: obj["id"]))
+
+
+def test_dedupe_exact_spill(tmp_dir):
+    src = tmp_dir / "src.jsonl"
+    dst = tmp_dir / "dst.jsonl"
+    objs = [{"id": i % 5000} for i in range(10000)]
+    jsonl.dump(objs, src)
+
+    jsonl.dedupe(src, dst, max_memory=32 * 1024, partitions=8)
+    assert list(jsonl.load(dst)) == objs[:5000]
+
+
+def test_dedupe_whole_lines():
+    src = io.BytesIO(b'{"a": 1}\n\n{"a": 2}\n{"a": 1}\r\n{"a":1}\n{"a": 2}')
+    dst = io.BytesIO()
+    jsonl.dedupe(src, dst)
+    assert dst.getvalue() == b'{"a": 1}\n{"a": 2}\n{"a":1}\n'
+
+
+def test_dedupe_approximate():
+    src = io.BytesIO("".join(f"[{i % 100}]\n" for i in range(1000)).encode())
+    dst = io.BytesIO()
+    jsonl.dedupe(src, dst, exact=False, capacity=100, error_rate=0.0001)
+    assert dst.getvalue() == "".join(f"[{i}]\n" for i in range(100)).encode()
+
+
+def test_dedupe_text_file_object():
+    dst = io.BytesIO()
+    jsonl.dedupe(io.StringIO('["ñ"]\n["ñ"]\n'), dst, key=lambda obj: obj[0])
+    assert dst.getvalue() == '["ñ"]\n'.encode()
+
+
+def test_dedupe_broken(broken):
+    src = io.BytesIO(b"[1]\nfoo\n[1]\n")
+    dst = io.BytesIO()
+    if broken:
+        jsonl.dedupe(src, dst, key=lambda obj: obj, broken=broken)
+        assert dst.getvalue() == b"[1]\n"
+    else:
+        with pytest.raises(json.JSONDecodeError):
+            jsonl.dedupe(src, dst, key=lambda obj: obj, broken=broken)
@@ -110,3 +110,78 @@ def test_dump_with_json_encoder_fixture(json_encoder):
     with contextlib.closing(io.StringIO()) as fp:
         jsonl.dump(iter(tests.data), fp, cls=json_encoder, ensure_ascii=False)
         assert fp.getvalue() == tests.string_data
+
+
+def test_dump_append(filepath):
+    jsonl.dump(tests.data[:2], filepath)
+    jsonl.dump(tests.data[2:], filepath, mode="a")
+    assert list(jsonl.load(filepath)) == tests.data
+
+
+def test_dump_append_unknown_extension(tmp_dir):
+    path = tmp_dir / "foo.jsonl.gz"
+    jsonl.dump(tests.data[:2], path)
+    path = path.rename(tmp_dir / "foo")
+    jsonl.dump(tests.data[2:], path, mode="a")  # Appended as a new gzip member.
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+    assert list(jsonl.load(path)) == tests.data
+
+
+def test_writer_append_unknown_extension(tmp_dir):
+    path = tmp_dir / "foo.jsonl.gz"
+    jsonl.dump(tests.data[:2], path)
+    path = path.rename(tmp_dir / "foo.dat")
+    with jsonl.Writer(path, mode="a") as writer:  # Detected like `dump`: appended as a new gzip member.
+        writer.write_many(tests.data[2:])
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+    assert list(jsonl.load(path)) == tests.data
+
+
+def test_dump_append_new_file(filepath):
+    jsonl.dump(tests.data, filepath, mode="a")
+    assert list(jsonl.load(filepath)) == tests.data
+
+
+def test_dump_atomic(filepath):
+    jsonl.dump(tests.data[:1], filepath)
+    os.chmod(filepath, 0o640)
+    jsonl.dump(tests.data, filepath, atomic=True)
+    assert list(jsonl.load(filepath)) == tests.data
+    assert os.listdir(os.path.dirname(filepath)) == [os.path.basename(filepath)]
+    assert os.stat(filepath).st_mode & 0o777 == 0o640
+
+
+def test_dump_atomic_fsync_writable(tmp_dir, monkeypatch):
+    synced = []
+    os_open = os.open
+
+    def tracking_open(path, flags, *args):
+        fd = os_open(path, flags, *args)
+        synced.append((os.path.isdir(path), flags & (os.O_WRONLY | os.O_RDWR) != 0))
+        return fd
+
+    monkeypatch.setattr(os, "open", tracking_open)
+    jsonl.dump(tests.data, tmp_dir / "foo.jsonl", atomic=True)
+    # Files are synchronized through a writable handle, as required on Windows.
+    assert (False, True) in synced
+    assert (False, False) not in synced
+
+
+def test_dump_atomic_failure(tmp_dir):
+    path = tmp_dir / "foo.jsonl"
+    jsonl.dump(tests.data, path)
+
+    def failing():
+        yield tests.data[0]
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        jsonl.dump(failing(), path, atomic=True)
+    assert list(jsonl.load(path)) == tests.data  # The original file is intact.
+    assert os.listdir(tmp_dir) == ["foo.jsonl"]
+
+
+@pytest.mark.parametrize("kwargs", ({"mode": "x"}, {"mode": "a", "atomic": True}))
+def test_dump_invalid_mode(tmp_dir, kwargs):
+    with pytest.raises(ValueError):
+        jsonl.dump(tests.data, tmp_dir / "foo.jsonl", **kwargs)
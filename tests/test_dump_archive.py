@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import gzip
 import os.path
 import pathlib
+import zipfile
 
 import pytest
 
@@ -68,3 +70,74 @@ def test_empty_data(tmp_dir, dump_if_empty):
         assert result is None
         # Verify that no archive was created
         assert not os.path.exists(path)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+@pytest.mark.parametrize(
+    "compression",
+    [None, zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2, zipfile.ZIP_LZMA],
+)
+@pytest.mark.parametrize("internals", [True, False])
+def test_dump_zip_workers(tmp_dir, monkeypatch, workers, compression, internals):
+    if not internals:  # Without the private zipfile internals, members are compressed serially.
+        monkeypatch.setattr(jsonl, "_can_write_zip_members", lambda zf: False)
+    path = str(tmp_dir / "archive.zip")
+    data = [(f"path/file{i}.jsonl", [{"key": i}] * i) for i in range(20)]
+    data.append(("path/file19.jsonl", [{"key": "last"}]))  # Contiguous items are merged into a single member.
+    result = jsonl.dump_archive(path, data, workers=workers, compression=compression)
+    assert result == path
+    with zipfile.ZipFile(path) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == [f"path/file{i}.jsonl" for i in range(20)]
+        methods = {info.compress_type for info in zf.infolist()}
+        assert methods == {zipfile.ZIP_DEFLATED if compression is None else compression}
+    expected = [(f"path/file{i}.jsonl", [{"key": i}] * i) for i in range(20)]
+    expected[-1][1].append({"key": "last"})
+    assert _get_loaded_data(path) == sorted(expected)
+
+
+def test_dump_zip_compressed_members(tmp_dir):
+    path = str(tmp_dir / "archive.zip")
+    data = [("file.jsonl.gz", [{"key": "value"}]), ("file.jsonl.xz", [{"key": "value"}])]
+    jsonl.dump_archive(path, data, workers=2, compression=zipfile.ZIP_STORED)
+    with zipfile.ZipFile(path) as zf:
+        assert gzip.decompress(zf.read("file.jsonl.gz")) == b'{"key": "value"}\n'
+    loaded = [(name, list(items)) for name, items in jsonl.load_archive(path, pattern="*.jsonl.*")]
+    assert loaded == data
+
+
+def test_dump_zip_compresslevel(tmp_dir):
+    data = [("file.jsonl", [{"key": "value"}] * 1000)]
+    fast = jsonl.dump_archive(str(tmp_dir / "fast.zip"), data, compresslevel=1)
+    best = jsonl.dump_archive(str(tmp_dir / "best.zip"), data, compresslevel=9)
+    assert _get_loaded_data(fast) == _get_loaded_data(best) == data
+
+
+def test_dump_zip_non_contiguous(tmp_dir):
+    data = [("a.jsonl", [1]), ("b.jsonl", [2]), ("a.jsonl", [3])]
+    with pytest.raises(ValueError, match="must be contiguous"):
+        jsonl.dump_archive(str(tmp_dir / "archive.zip"), data, workers=2)
+
+
+@pytest.mark.parametrize("dump_if_empty", [True, False])
+def test_dump_zip_empty(tmp_dir, dump_if_empty):
+    path = str(tmp_dir / "archive.zip")
+    data = [("a.jsonl", []), ("b.jsonl", [1])]
+    assert jsonl.dump_archive(path, data, workers=2, dump_if_empty=dump_if_empty) == path
+    assert _get_loaded_data(path) == (data if dump_if_empty else data[1:])
+    result = jsonl.dump_archive(path, data[:1], workers=2, dump_if_empty=dump_if_empty)
+    assert result == (path if dump_if_empty else None)
+    assert os.path.exists(path) is dump_if_empty
+
+
+def test_dump_tar_workers(tmp_dir):
+    path = str(tmp_dir / "archive.tar.gz")
+    data = [("a.jsonl", [1]), ("b.jsonl", [2])]
+    assert jsonl.dump_archive(path, data, workers=2) == path  # Ignored for tar archives.
+    with pytest.raises(ValueError, match="only supported for zip archives"):
+        jsonl.dump_archive(path, data, compression=zipfile.ZIP_STORED)
+
+
+def test_invalid_workers(tmp_dir):
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        jsonl.dump_archive(str(tmp_dir / "archive.zip"), [], workers=0)
@@ -10,3 +10,9 @@ def test_empty():
 def test_iter_data():
     result = jsonl.dumps(iter(tests.data))
     assert result == tests.string_data
+
+
+def test_bytes():
+    result = jsonl.dumps(iter(tests.data), text_mode=False)
+    assert result == tests.string_data.encode(jsonl._utf_8)
+    assert jsonl.dumps((), text_mode=False) == b""
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+
+import bz2
+import gzip
+import http.server
+import io
+import lzma
+import os
+import urllib.error
+import zipfile
+
+import pytest
+
+import jsonl
+import tests
+from tests.conftest import manage_http_server
+
+content = tests.string_data.encode(jsonl._utf_8)
+
+
+def make_handler(body, *, drop_at=None, failures=0, ranges=True, headers=None):
+    """Build a keep-alive request handler serving `body`, recording the requests it receives."""
+
+    requests = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        etag = '"v1"'
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def do_GET(self):
+            nonlocal drop_at, failures
+            received = self.headers
+            requests.append((self.client_address, self.path, received.get("Range"), received.get("If-None-Match")))
+            type(self).accept_encoding = received.get("Accept-Encoding")
+            if self.path == "/redirect":
+                self.send_response(302)
+                self.send_header("Location", "/data")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if not self.path.startswith("/data"):
+                self.send_error(404)
+                return
+            if failures:
+                failures -= 1
+                self.send_error(503)
+                return
+
+            if self.headers.get("If-None-Match") == self.etag:
+                self.send_response(304)
+                self.send_header("ETag", self.etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            start = 0
+            if ranges and self.headers.get("Range"):
+                start = int(self.headers["Range"][len("bytes=") : -1])
+            self.send_response(206 if start else 200)
+            if start:
+                self.send_header("Content-Range", "bytes {}-{}/{}".format(start, len(body) - 1, len(body)))
+            self.send_header("Content-Length", str(len(body) - start))
+            self.send_header("ETag", self.etag)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            if drop_at is not None:
+                self.wfile.write(body[start:drop_at])
+                self.close_connection = True
+                drop_at = None
+            else:
+                self.wfile.write(body[start:])
+
+    return Handler, requests
+
+
+def test_load_reuses_connections():
+    handler, requests = make_handler(content)
+    with manage_http_server(None, handler) as url:
+        assert list(jsonl.load(url + "data")) == tests.data
+        assert list(jsonl.load(url + "data")) == tests.data
+    assert len(requests) == 2
+    assert requests[0][0] == requests[1][0]  # Same client address: the connection was reused.
+
+
+@pytest.mark.parametrize("ranges", (True, False))
+def test_load_resumes_interrupted_download(ranges):
+    handler, requests = make_handler(content, drop_at=len(content) // 2, ranges=ranges)
+    with manage_http_server(None, handler) as url:
+        assert list(jsonl.load(url + "data", backoff=0)) == tests.data
+    assert [request[2] for request in requests] == [None, "bytes={}-".format(len(content) // 2)]
+
+
+def test_load_resume_modified_resource():
+    handler, _ = make_handler(content, drop_at=10, ranges=False)
+    with manage_http_server(None, handler) as url:
+        with jsonl._urlopen(url + "data", backoff=0) as fd:
+            fd.raw._validator = '"v0"'  # Simulate a modification of the resource.
+            with pytest.raises(OSError, match="Cannot resume"):
+                fd.read()
+
+
+def test_load_retries_failures():
+    handler, requests = make_handler(content, failures=2)
+    with manage_http_server(None, handler) as url:
+        assert list(jsonl.load(url + "data", backoff=0)) == tests.data
+    assert len(requests) == 3
+
+
+def test_load_retries_exhausted():
+    handler, requests = make_handler(content, failures=5)
+    with manage_http_server(None, handler) as url:
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            list(jsonl.load(url + "data", retries=1, backoff=0))
+    assert exc.value.code == 503
+    assert len(requests) == 2
+
+
+def test_load_follows_redirects():
+    handler, requests = make_handler(content)
+    with manage_http_server(None, handler) as url:
+        assert list(jsonl.load(url + "redirect")) == tests.data
+    assert [request[1] for request in requests] == ["/redirect", "/data"]
+
+
+def test_load_not_found():
+    handler, requests = make_handler(content)
+    with manage_http_server(None, handler) as url:
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            list(jsonl.load(url + "missing", backoff=0))
+    assert exc.value.code == 404
+    assert len(requests) == 1
+
+
+def test_load_archive_resumes_interrupted_download():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w") as zf:
+        zf.writestr("foo.jsonl", content)
+    archive = buffer.getvalue()
+
+    handler, requests = make_handler(archive, drop_at=len(archive) // 3)
+    with manage_http_server(None, handler) as url:
+        result = [(name, list(items)) for name, items in jsonl.load_archive(url + "data", backoff=0)]
+    assert result == [("foo.jsonl", tests.data)]
+    assert len(requests) == 2
+
+
+def test_load_cache_revalidation(tmp_dir):
+    cache = jsonl.URLCache(tmp_dir / "cache")
+    handler, requests = make_handler(content)
+    with manage_http_server(None, handler) as url:
+        assert list(jsonl.load(url + "data", cache=cache)) == tests.data
+        assert list(jsonl.load(url + "data", cache=cache)) == tests.data  # Not modified: read from disk.
+        handler.etag = '"v2"'
+        assert list(jsonl.load(url + "data", cache=cache)) == tests.data  # Modified: downloaded again.
+        assert list(jsonl.load(url + "data", cache=cache)) == tests.data
+
+    assert [request[3] for request in requests] == [None, '"v1"', '"v1"', '"v2"']
+    assert len(os.listdir(cache.directory)) == 1
+
+
+def test_load_cache_incomplete_read(tmp_dir):
+    cache = jsonl.URLCache(tmp_dir / "cache")
+    handler, _ = make_handler(content)
+    with manage_http_server(None, handler) as url:
+        assert next(jsonl.load(url + "data", cache=cache)) == tests.data[0]
+    assert not os.listdir(cache.directory)  # Partially read responses are not stored.
+
+
+def test_load_cache_eviction(tmp_dir):
+    cache = jsonl.URLCache(tmp_dir / "cache", max_bytes=len(content) * 3 // 2)
+    handler, _ = make_handler(content)
+    with manage_http_server(None, handler) as url:
+        assert list(jsonl.load(url + "data", cache=cache)) == tests.data
+        assert list(jsonl.load(url + "data?other", cache=cache)) == tests.data
+    assert len(os.listdir(cache.directory)) == 1  # The least recently used entry was evicted.
+
+
+def test_load_archive_cache(tmp_dir):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w") as zf:
+        zf.writestr("foo.jsonl", content)
+
+    cache = jsonl.URLCache(tmp_dir / "cache")
+    handler, requests = make_handler(buffer.getvalue())
+    with manage_http_server(None, handler) as url:
+        for _ in range(2):
+            result = [(name, list(items)) for name, items in jsonl.load_archive(url + "data", cache=cache)]
+            assert result == [("foo.jsonl", tests.data)]
+    assert [request[3] for request in requests] == [None, '"v1"']
+
+
+def test_load_content_encoding():
+    handler, requests = make_handler(gzip.compress(content), headers={"Content-Encoding": "gzip"})
+    with manage_http_server(None, handler) as url:
+        assert list(jsonl.load(url + "data")) == tests.data
+        assert list(jsonl.load(url + "data.jsonl.gz")) == tests.data  # Extension of the encoded content.
+    assert "gzip" in handler.accept_encoding
+
+
+@pytest.mark.parametrize(
+    "path, body",
+    (
+        ("data.jsonl.gz", gzip.compress(content)),
+        ("data.jsonl.xz", lzma.compress(content)),
+        ("data", bz2.compress(content)),  # Detected by magic bytes.
+        ("data.jsonl", content),
+    ),
+)
+def test_load_compressed_url(path, body):
+    handler, _ = make_handler(body)
+    with manage_http_server(None, handler) as url:
+        assert list(jsonl.load(url + path)) == tests.data
+
+
+def test_load_url_registered_codec_magic(monkeypatch):
+    for name in ("extensions", "_openers", "_magics"):
+        monkeypatch.setattr(jsonl, name, type(getattr(jsonl, name))(getattr(jsonl, name)))
+    magic = b"JSONL-PREFIXED\x00"  # Longer than the magic numbers of the built-in codecs.
+
+    def opener(file, mode="rb", encoding=None):
+        file.read(len(magic))
+        return gzip.open(file, mode=mode, encoding=encoding)
+
+    jsonl.register_codec(".prefixed", magic, opener)
+    handler, _ = make_handler(magic + gzip.compress(content))
+    with manage_http_server(None, handler) as url:
+        assert list(jsonl.load(url + "data")) == tests.data
+
+
+def test_load_double_compressed_url():
+    handler, _ = make_handler(gzip.compress(gzip.compress(content)), headers={"Content-Encoding": "gzip"})
+    with manage_http_server(None, handler) as url:
+        assert list(jsonl.load(url + "data.jsonl.gz")) == tests.data
+
+
+def test_load_unsupported_content_encoding():
+    handler, _ = make_handler(content, headers={"Content-Encoding": "br"})
+    with manage_http_server(None, handler) as url:
+        with pytest.raises(ValueError, match="Content-Encoding"):
+            next(jsonl.load(url + "data"))
+
+
+def test_load_archive_content_encoding():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w") as zf:
+        zf.writestr("foo.jsonl", content)
+
+    handler, _ = make_handler(gzip.compress(buffer.getvalue()), headers={"Content-Encoding": "gzip"})
+    with manage_http_server(None, handler) as url:
+        result = [(name, list(items)) for name, items in jsonl.load_archive(url + "data")]
+    assert result == [("foo.jsonl", tests.data)]
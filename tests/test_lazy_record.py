@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+import pytest
+
+import jsonl
+import tests
+
+
+def test_load_lazy(filepath):
+    jsonl.dump(tests.data, filepath)
+    records = list(jsonl.load(filepath, lazy=True))
+    assert all(isinstance(record, jsonl.LazyRecord) for record in records)
+    assert not any(record.decoded for record in records)
+    assert records == tests.data
+    assert all(record.decoded for record in records)
+
+
+@pytest.mark.parametrize("text_mode", (True, False))
+@pytest.mark.parametrize("source", (io.StringIO, lambda text: io.BytesIO(text.encode(jsonl._utf_8))))
+def test_dump_undecoded_records(text_mode, source):
+    text = '{"b": 1,  "a": 2}\r\n[ 1, 2 ]\n{"x": 1.50}'  # Not serialized again: formatting is preserved.
+    records = list(jsonl.load(source(text), lazy=True))
+    expected = '{"b": 1,  "a": 2}\n[ 1, 2 ]\n{"x": 1.50}\n'
+    assert jsonl.dumps(records) == expected
+    assert jsonl.dumps(records, text_mode=False) == expected.encode(jsonl._utf_8)
+    assert not any(record.decoded for record in records)  # Passed through without being deserialized.
+
+
+def test_dump_decoded_records():
+    records = list(jsonl.loads('{"a":  1}\n{"a":  2}\n', lazy=True))
+    assert records[0]["a"] == 1  # Decoded: serialized again.
+    records[1].value["a"] = 3  # Modified: serialized again.
+    assert jsonl.dumps(records) == '{"a": 1}\n{"a": 3}\n'
+
+
+def test_writer_and_dump_fork(tmp_dir):
+    records = list(jsonl.loads('{"a":  1}\n{"a":  2}\n', lazy=True))
+    path = tmp_dir / "foo.jsonl"
+    with jsonl.Writer(path) as writer:
+        writer.write(records[0])
+        writer.write_many(records[1:])
+    assert tests.read_text(path) == '{"a":  1}\n{"a":  2}\n'
+
+    jsonl.dump_fork([(path, records)])
+    assert tests.read_text(path) == '{"a":  1}\n{"a":  2}\n'
+
+
+def test_mapping():
+    record = jsonl.LazyRecord(b'{"a": 1, "b": [2]}\n')
+    assert record["a"] == 1
+    assert record.get("c", 3) == 3
+    assert "b" in record
+    assert list(record) == ["a", "b"]
+    assert len(record) == 2
+    assert dict(record.items()) == {"a": 1, "b": [2]}
+    assert record == jsonl.LazyRecord('{"b": [2], "a": 1}')
+    assert record != {"a": 1}
+    assert repr(record) == 'LazyRecord(b\'{"a": 1, "b": [2]}\\n\')'
+
+
+def test_slots():
+    record = jsonl.LazyRecord("[1]")
+    with pytest.raises(AttributeError):
+        record.other = None
+    with pytest.raises(TypeError):
+        hash(record)
+
+
+def test_custom_decoder():
+    records = list(jsonl.loads('{"a": 1.5}\n', lazy=True, cls=json.JSONDecoder, parse_float=str))
+    assert records[0]["a"] == "1.5"
+
+
+def test_broken_lines_raise_on_access():
+    records = list(jsonl.loads('{"a": 1}\ninvalid\n', lazy=True))
+    assert len(records) == 2
+    with pytest.raises(json.JSONDecodeError):
+        records[1]["a"]
+    assert jsonl.dumps(records) == '{"a": 1}\ninvalid\n'  # Undecoded lines are written back as they are.
+    assert not records[0].decoded
+
+
+@pytest.mark.parametrize("text", ('{"a": 1}\ninvalid\n{"a": 2}\n', b'{"a": 1}\ninvalid\n{"a": 2}\n'))
+def test_broken_lines_skipped(text):
+    records = list(jsonl.loader(text.splitlines(keepends=True), True, lazy=True))
+    assert records == [{"a": 1}, {"a": 2}]
+    assert all(isinstance(record, jsonl.LazyRecord) and record.decoded for record in records)
+    assert jsonl.dumps(records) == '{"a": 1}\n{"a": 2}\n'
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import contextlib
+import gzip
 import io
 import json
 import os
@@ -160,3 +161,192 @@ def test_load_with_callable_decoder():
         data = list(jsonl.load(fd, cls=custom_decode))
 
     assert data == [{"KEY": "val"}, [1, 2]]
+
+
+@pytest.mark.parametrize("schema", (True, ("name", "wins")))
+def test_load_schema_shares_keys(schema):
+    with contextlib.closing(io.StringIO(tests.string_data)) as fd:
+        result = list(jsonl.load(fd, schema=schema))
+
+    assert result == tests.data
+    first, *others = result
+    for obj in others:
+        assert all(a is b for a, b in zip(first, obj))
+
+
+def test_load_schema_mismatch_fallback():
+    lines = '{"a": 1, "b": 2}\n{"b": 3, "a": 4}\n{"a": 5}\n[6]\n'
+    with contextlib.closing(io.StringIO(lines)) as fd:
+        result = list(jsonl.load(fd, schema=("a", "b")))
+    assert result == [{"a": 1, "b": 2}, {"b": 3, "a": 4}, {"a": 5}, [6]]
+    assert list(result[1]) == ["b", "a"]  # Key order of mismatched objects is preserved.
+
+
+@pytest.mark.parametrize("limit", (5, 6))
+@pytest.mark.parametrize("as_file", (True, False))
+def test_load_max_line_bytes(limit, as_file):
+    lines = ["[1]\n", json.dumps("x" * 100) + "\n", "[333]\n", "[4444" + "4" * limit + "]\n", "[5]"]
+    source = io.StringIO("".join(lines)) if as_file else lines
+    assert list(jsonl.load(source, max_line_bytes=limit, broken=True)) == [[1], [333], [5]]
+
+
+def test_load_max_line_bytes_exceeded(filepath, caplog):
+    jsonl.dump([[1], "x" * 100, [3]], filepath)
+    with pytest.raises(ValueError, match="Line 2 is longer than 10 bytes"):
+        list(jsonl.load(filepath, max_line_bytes=10))
+    assert "Broken line at 2" in caplog.text
+
+
+def test_load_max_line_bytes_bounded_reads(filepath):
+    jsonl.dump([[1], "x" * 1000, [3]], filepath)
+    with jsonl._xopen(filepath) as fd:
+        with unittest.mock.patch.object(fd, "readline", wraps=fd.readline) as readline:
+            assert list(jsonl.load(fd, max_line_bytes=10, broken=True)) == [[1], [3]]
+    assert all(call.args == (11,) for call in readline.call_args_list)
+
+
+def test_load_max_line_bytes_checked_once():
+    lines = ["[1]\n", '"x"\n', "[3]\n"]
+    with unittest.mock.patch.object(jsonl, "_is_longer_line", wraps=jsonl._is_longer_line) as is_longer_line:
+        assert list(jsonl.load(iter(lines), max_line_bytes=10)) == [[1], "x", [3]]
+    assert is_longer_line.call_count == len(lines)
+
+
+@pytest.mark.parametrize("as_file", (True, False))
+def test_load_max_line_bytes_counts_utf8_bytes(as_file):
+    lines = ['"ééééé"\n', '"éééé"\n', '"€€€"\n']  # 12, 10 and 11 bytes, but 7, 6 and 5 characters.
+    source = io.StringIO("".join(lines)) if as_file else lines
+    assert list(jsonl.load(source, max_line_bytes=10, broken=True)) == ["éééé"]
+
+
+@pytest.mark.parametrize("extension", (".jsonl", ".jsonl.gz", ".jsonl.bz2"))
+@pytest.mark.parametrize("options", ({"shard": (0, 1)}, {"shard": (1, 2)}, {"shard": (0, 3)}, {"with_cursor": True}))
+def test_load_max_line_bytes_shard_and_cursor(tmp_dir, extension, options):
+    path = tmp_dir / f"foo{extension}"
+    data = [[1], "x" * 100, [3], "y" * 50, [5]]
+    jsonl.dump(data, path)
+    if "shard" in options:
+        _, count = options["shard"]
+        shards = [jsonl.load(path, max_line_bytes=10, broken=True, shard=(index, count)) for index in range(count)]
+        assert sorted(obj for shard in shards for obj in shard) == [[1], [3], [5]]
+    else:
+        loaded = list(jsonl.load(path, max_line_bytes=10, broken=True, **options))
+        assert [obj for _, obj in loaded] == [[1], [3], [5]]
+        resumed = jsonl.load(path, max_line_bytes=10, broken=True, resume_from=loaded[1][0])
+        assert list(resumed) == [[5]]
+
+    with pytest.raises(ValueError, match="longer than 10 bytes"):
+        list(jsonl.load(path, max_line_bytes=10, **options))
+
+
+@pytest.mark.parametrize("extension", (".jsonl", ".jsonl.gz"))
+@pytest.mark.parametrize("options", ({}, {"shard": (0, 1)}, {"shard": (1, 2)}, {"with_cursor": True}))
+def test_load_max_line_bytes_bounded_memory(tmp_dir, extension, options):
+    import tracemalloc
+
+    path = str(tmp_dir / f"foo{extension}")
+    tests.write_text(path, content="[1]\n" + json.dumps("x" * 20_000_000) + "\n[3]\n")
+    tracemalloc.start()
+    try:
+        loaded = list(jsonl.load(path, max_line_bytes=1000, broken=True, **options))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 8_000_000  # Much less than the line.
+    if options.get("shard") == (1, 2):  # Byte ranges ("[3]"), or every second line (the long one) if compressed.
+        assert len(loaded) == (1 if extension == ".jsonl" else 0)
+    else:
+        assert len(loaded) == 2
+
+
+def test_load_max_line_bytes_invalid():
+    with pytest.raises(ValueError, match="max_line_bytes"):
+        next(jsonl.load(io.StringIO(tests.string_data), max_line_bytes=0))
+
+
+@pytest.mark.parametrize("count", (1, 2, 3, 7, 100))
+def test_load_shards(filepath, count):
+    data = [{"id": i, "pad": "x" * (i % 13)} for i in range(50)]
+    jsonl.dump(data, filepath)
+
+    shards = [list(jsonl.load(filepath, shard=(index, count))) for index in range(count)]
+    assert sorted((obj for shard in shards for obj in shard), key=lambda obj: obj["id"]) == data
+
+
+def test_load_shards_byte_ranges(tmp_dir):
+    path = tmp_dir / "foo.jsonl"
+    tests.write_text(path, content="[1]\n[22]\n[333]\n[4444]\n")  # Line starts: 0, 4, 9, 15 (size 22)
+    assert list(jsonl.load(path, shard=(0, 2))) == [[1], [22], [333]]  # Range [0, 11)
+    assert list(jsonl.load(path, shard=(1, 2))) == [[4444]]  # Range [11, 22)
+
+
+@pytest.mark.parametrize("index", (0, 1, 2))
+def test_load_shards_modulo(index):
+    with contextlib.closing(io.StringIO(tests.string_data)) as fd:
+        result = list(jsonl.load(fd, shard=(index, 3)))
+    assert result == tests.data[index::3]
+
+
+@pytest.mark.parametrize("shard", ((-1, 2), (2, 2), (0, 0)))
+def test_load_invalid_shard(shard):
+    with pytest.raises(ValueError):
+        next(jsonl.load(io.StringIO(tests.string_data), shard=shard))
+
+
+@pytest.mark.parametrize("position", (0, 1, 25, 49, 50))
+def test_load_resume_from_cursor(filepath, position):
+    data = [{"id": i} for i in range(50)]
+    jsonl.dump(data, filepath)
+
+    cursors = [cursor for cursor, _ in jsonl.load(filepath, with_cursor=True)]
+    assert [cursor.lineno for cursor in cursors] == list(range(1, 51))
+
+    resume_from = cursors[position - 1] if position else None
+    assert list(jsonl.load(filepath, resume_from=resume_from)) == data[position:]
+    assert list(jsonl.load(filepath, resume_from=tuple(resume_from or (0, 0, 0)))) == data[position:]
+
+
+def test_load_cursor_byte_offsets(tmp_dir):
+    path = tmp_dir / "foo.jsonl"
+    tests.write_text(path, content="[1]\n[22]\n[333]\n")
+    cursors = [cursor for cursor, _ in jsonl.load(path, with_cursor=True)]
+    assert cursors == [(4, 0, 1), (9, 0, 2), (15, 0, 3)]
+
+
+def test_load_cursor_gzip_members(tmp_dir):
+    path = tmp_dir / "foo.jsonl.gz"
+    jsonl.dump([1, 2], path)
+    size = path.stat().st_size
+    with gzip.open(path, mode="ab") as fd:  # Appends a second gzip member.
+        fd.write(b"3\n4\n")
+
+    cursors = [cursor for cursor, _ in jsonl.load(path, with_cursor=True)]
+    assert cursors[2:] == [(size, 1, 3), (size, 2, 4)]  # Resumed from the second member.
+    assert list(jsonl.load(path, resume_from=cursors[2])) == [4]
+
+
+def test_load_cursor_gzip_truncated(tmp_dir):
+    path = tmp_dir / "foo.jsonl.gz"
+    jsonl.dump(tests.data, path)
+    path.write_bytes(path.read_bytes()[:-4])
+    with pytest.raises(EOFError):
+        list(jsonl.load(path, with_cursor=True))
+
+
+def test_load_cursor_broken(tmp_dir):
+    path = tmp_dir / "foo.jsonl"
+    tests.write_text(path, content="[1]\nfoo\n[2]\n")
+    assert list(jsonl.load(path, broken=True, with_cursor=True)) == [((4, 0, 1), [1]), ((12, 0, 3), [2])]
+
+
+@pytest.mark.parametrize("kwargs", ({"shard": (0, 2)}, {"opener": open}))
+def test_load_cursor_invalid_options(filepath, kwargs):
+    with pytest.raises(ValueError):
+        next(jsonl.load(filepath, with_cursor=True, **kwargs))
+
+
+def test_load_cursor_invalid_source():
+    with pytest.raises(ValueError):
+        next(jsonl.load(io.StringIO(tests.string_data), resume_from=(0, 0, 0)))
+    with pytest.raises(ValueError):
+        next(jsonl.load("https://example.com/foo.jsonl", with_cursor=True))
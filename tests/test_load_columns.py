@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+import array
+import contextlib
+import io
+
+import pytest
+
+import jsonl
+import tests
+
+lines = '{"id": 1, "score": 1.5, "name": "foo"}\n{"id": 2, "score": 2.5}\n{"id": 3, "score": 3.5, "name": "var"}\n'
+
+
+def test_load_columns_lists():
+    with contextlib.closing(io.StringIO(lines)) as fd:
+        result = jsonl.load_columns(fd, ("id", "name"))
+    assert result == {"id": [1, 2, 3], "name": ["foo", None, "var"]}
+
+
+def test_load_columns_arrays():
+    with contextlib.closing(io.StringIO(lines)) as fd:
+        result = jsonl.load_columns(fd, {"id": "q", "score": "d", "name": None})
+    assert result["id"] == array.array("q", [1, 2, 3])
+    assert result["score"] == array.array("d", [1.5, 2.5, 3.5])
+    assert result["name"] == ["foo", None, "var"]
+
+
+def test_load_columns_array_missing_value():
+    with contextlib.closing(io.StringIO(lines)) as fd:
+        with pytest.raises(TypeError):
+            jsonl.load_columns(fd, {"name": "q"})
+
+
+@pytest.mark.parametrize("value", ("[1, 2]", "3", '"foo"', "null"))
+def test_load_columns_not_object(value):
+    with contextlib.closing(io.StringIO(lines + value + "\n")) as fd:
+        with pytest.raises(TypeError, match="Line 4 is not a JSON object"):
+            jsonl.load_columns(fd, ("id",))
+
+
+def test_load_columns_not_object_broken():
+    with contextlib.closing(io.StringIO("[1]\n" + lines + "2\n")) as fd:
+        result = jsonl.load_columns(fd, ("id",), chunk_size=2, broken=True)
+        assert [chunk["id"] for chunk in result] == [[1, 2], [3]]
+
+
+@pytest.mark.parametrize(
+    "chunk_size, expected",
+    [
+        (1, [[1], [2], [3]]),
+        (2, [[1, 2], [3]]),
+        (3, [[1, 2, 3]]),
+        (10, [[1, 2, 3]]),
+    ],
+)
+def test_load_columns_chunks(chunk_size, expected):
+    with contextlib.closing(io.StringIO(lines)) as fd:
+        result = [chunk["id"] for chunk in jsonl.load_columns(fd, ("id",), chunk_size=chunk_size)]
+    assert result == expected
+
+
+def test_load_columns_empty():
+    with contextlib.closing(io.StringIO("")) as fd:
+        assert jsonl.load_columns(fd, ("id",)) == {"id": []}
+    with contextlib.closing(io.StringIO("")) as fd:
+        assert not list(jsonl.load_columns(fd, ("id",), chunk_size=2))
+
+
+@pytest.mark.parametrize("chunk_size", (0, -1))
+def test_load_columns_invalid_chunk_size(chunk_size):
+    with pytest.raises(ValueError):
+        jsonl.load_columns(io.StringIO(lines), ("id",), chunk_size=chunk_size)
+
+
+def test_load_columns_filepath(filepath):
+    jsonl.dump(tests.data, filepath)
+    result = jsonl.load_columns(filepath, ("name",))
+    assert result == {"name": [obj["name"] for obj in tests.data]}
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+import jsonl
+import tests
+
+
+@pytest.fixture
+def paths(tmp_dir, file_extension):
+    result = []
+    for i in range(5):
+        path = str(tmp_dir / f"part-{i}{file_extension}")
+        jsonl.dump(({"part": i, "id": j} for j in range(i * 3)), path)
+        result.append(path)
+    return result
+
+
+def expected(paths):
+    return [{"part": i, "id": j} for i in range(len(paths)) for j in range(i * 3)]
+
+
+@pytest.mark.parametrize("workers", (1, 2, 10))
+def test_load_many_ordered(paths, workers):
+    assert list(jsonl.load_many(paths, workers=workers)) == expected(paths)
+
+
+@pytest.mark.parametrize("workers", (1, 3))
+def test_load_many_unordered(paths, workers):
+    result = list(jsonl.load_many(paths, workers=workers, ordered=False))
+    assert sorted(result, key=lambda obj: (obj["part"], obj["id"])) == expected(paths)
+
+
+def test_load_many_with_path(paths):
+    result = list(jsonl.load_many(paths, with_path=True, prefetch=1))
+    assert result == [(paths[obj["part"]], obj) for obj in expected(paths)]
+
+
+def test_load_many_glob(paths, tmp_dir, file_extension):
+    result = list(jsonl.load_many(tmp_dir / f"part-*{file_extension}", workers=2))
+    assert result == expected(paths)
+
+
+def test_load_many_single_path(filepath):
+    tests.write_text(filepath, content=tests.string_data)
+    assert list(jsonl.load_many(filepath)) == tests.data
+
+
+def test_load_many_early_close(paths):
+    it = jsonl.load_many(paths, workers=2, prefetch=1)
+    next(it)
+    it.close()
+
+
+def test_load_many_not_found(paths):
+    with pytest.raises(FileNotFoundError):
+        tests.consume(jsonl.load_many([*paths, "not_found.jsonl"]))
+
+
+def test_load_many_broken(tmp_dir, broken):
+    path = tests.write_text(tmp_dir / "foo.jsonl", content="[1]\nfoo\n[2]\n")
+    result = jsonl.load_many([path, path], broken=broken)
+    if broken:
+        assert list(result) == [[1], [2], [1], [2]]
+    else:
+        with pytest.raises(json.JSONDecodeError):
+            tests.consume(result)
+
+
+@pytest.mark.parametrize("kwargs", ({"workers": 0}, {"prefetch": 0}))
+def test_load_many_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        next(jsonl.load_many(["foo.jsonl"], **kwargs))
@@ -60,3 +60,23 @@ def test_whitespace_only_line_skipped_when_broken():
     text = '{"a": 1}\n  \n{"b": 2}\n'
     result = list(jsonl.loads(text, broken=True))
     assert result == [{"a": 1}, {"b": 2}]
+
+
+@pytest.mark.parametrize("factory", (bytes, bytearray, memoryview, lambda data: memoryview(bytearray(data))))
+@pytest.mark.parametrize("suffix", ("", "\n"))
+def test_bytes_like(factory, suffix):
+    text = tests.string_data.rstrip("\n") + suffix
+    result = list(jsonl.loads(factory(text.encode(jsonl._utf_8))))
+    assert result == tests.data
+
+
+def test_bytes_like_broken():
+    data = bytearray(b'{"a": 1}\n\xff\n{"b": 2}')
+    assert list(jsonl.loads(data, broken=True)) == [{"a": 1}, {"b": 2}]
+    with pytest.raises(UnicodeDecodeError):
+        tests.consume(jsonl.loads(data))
+
+
+def test_bytes_like_roundtrip():
+    result = list(jsonl.loads(jsonl.dumps(tests.data, text_mode=False)))
+    assert result == tests.data
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import io
+import operator
+
+import pytest
+
+import jsonl
+
+
+def make_sources(tmp_dir, extension, count, reverse=False):
+    paths = []
+    for i in range(count):
+        path = str(tmp_dir / f"src-{i:03}{extension}")
+        jsonl.dump(({"id": j, "src": i} for j in sorted(range(i, 100, count), reverse=reverse)), path)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("max_open", (2, 3, 64))
+@pytest.mark.parametrize("reverse", (True, False))
+def test_merge(tmp_dir, file_extension, max_open, reverse):
+    sources = make_sources(tmp_dir, file_extension, 7, reverse=reverse)
+    dst = tmp_dir / f"dst{file_extension}"
+
+    jsonl.merge(sources, dst, key=operator.itemgetter("id"), reverse=reverse, max_open=max_open, tmp_dir=tmp_dir)
+    assert [obj["id"] for obj in jsonl.load(dst)] == sorted(range(100), reverse=reverse)
+    assert not any(path.is_dir() for path in tmp_dir.iterdir())  # Temporary files are removed
+
+
+@pytest.mark.parametrize("max_open", (2, 3, 64))
+def test_merge_stable(tmp_dir, max_open):
+    sources = [str(tmp_dir / f"src-{i}.jsonl") for i in range(5)]
+    for i, path in enumerate(sources):
+        jsonl.dump([{"key": 0, "src": i}, {"key": 1, "src": i}], path)
+    dst = io.BytesIO()
+
+    jsonl.merge(sources, dst, key=operator.itemgetter("key"), max_open=max_open)
+    result = [obj["src"] for obj in jsonl.load(io.BytesIO(dst.getvalue()))]
+    assert result == [0, 1, 2, 3, 4, 0, 1, 2, 3, 4]
+
+
+def test_merge_glob(tmp_dir):
+    make_sources(tmp_dir, ".jsonl.gz", 3)
+    dst = tmp_dir / "dst.jsonl"
+    jsonl.merge(tmp_dir / "src-*.jsonl.gz", dst, key=operator.itemgetter("id"))
+    assert [obj["id"] for obj in jsonl.load(dst)] == list(range(100))
+
+
+def test_merge_file_objects():
+    dst = io.BytesIO()
+    jsonl.merge([io.BytesIO(b"[1]\n[4]\n"), io.StringIO("[2]\n[3]\n")], dst)
+    assert dst.getvalue() == b"[1]\n[2]\n[3]\n[4]\n"
+
+
+def test_merge_invalid_max_open():
+    with pytest.raises(ValueError):
+        jsonl.merge([], io.BytesIO(), max_open=1)
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import jsonl
+import tests
+
+
+@pytest.mark.parametrize("src_extension", sorted(jsonl.extensions))
+def test_recompress(tmp_dir, src_extension, file_extension):
+    src = tests.write_text(str(tmp_dir / f"src{src_extension}"), content=tests.string_data)
+    dst = str(tmp_dir / f"dst{file_extension}")
+
+    jsonl.recompress(src, dst)
+    with open(dst, mode="rb") as fd:
+        detected = jsonl._get_fileobj_extension(fd) or jsonl.ext_jsonl
+    assert detected == file_extension
+    assert tests.read_text(dst) == tests.string_data
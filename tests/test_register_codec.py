@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+import functools
+import io
+import lzma
+import os
+import zipfile
+
+import pytest
+
+import jsonl
+import tests
+
+ext_lzma = ".lzma"
+magic_lzma = b"\x5d\x00\x00"
+open_lzma = functools.partial(lzma.open, format=lzma.FORMAT_ALONE)  # Legacy `.lzma` format.
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    extensions, openers, magics = set(jsonl.extensions), dict(jsonl._openers), dict(jsonl._magics)
+    jsonl.register_codec(ext_lzma, magic_lzma, open_lzma)
+    yield
+    jsonl.extensions.clear()
+    jsonl.extensions.update(extensions)
+    jsonl._openers.clear()
+    jsonl._openers.update(openers)
+    jsonl._magics.clear()
+    jsonl._magics.update(magics)
+
+
+def test_register_codec_dump_load(tmp_dir):
+    path = tmp_dir / "foo.jsonl.lzma"
+    jsonl.dump(tests.data, path)
+    assert path.read_bytes().startswith(magic_lzma)
+    assert list(jsonl.load(path)) == tests.data
+
+
+def test_register_codec_magic(tmp_dir):
+    path = tmp_dir / "foo.jsonl.lzma"
+    jsonl.dump(tests.data, path)
+    os.rename(path, tmp_dir / "foo")
+    assert list(jsonl.load(tmp_dir / "foo")) == tests.data
+
+
+def test_register_codec_dump_fork(tmp_dir):
+    path = str(tmp_dir / "foo.jsonl.lzma")
+    jsonl.dump_fork([(path, tests.data[:2]), (path, tests.data[2:])])
+    assert list(jsonl.load(path)) == tests.data
+
+
+def test_register_codec_archive(tmp_dir):
+    buffer = io.BytesIO()
+    with open_lzma(buffer, mode="wb") as fd:
+        fd.write(tests.string_data.encode(jsonl._utf_8))
+
+    path = tmp_dir / "archive.zip"
+    with zipfile.ZipFile(path, mode="w") as zf:
+        zf.writestr("foo.jsonl.lzma", buffer.getvalue())
+    result = [(name, list(items)) for name, items in jsonl.load_archive(path, pattern="*.jsonl.lzma")]
+    assert result == [("foo.jsonl.lzma", tests.data)]
+
+
+def test_register_codec_without_magic(tmp_dir):
+    jsonl.register_codec(ext_lzma, None, open_lzma)
+    path = tmp_dir / "foo.jsonl.lzma"
+    jsonl.dump(tests.data, path)
+    assert list(jsonl.load(path)) == tests.data
+    assert jsonl._get_magic_extension(path.read_bytes()) is None
+
+
+def test_register_codec_replaces_builtin(tmp_dir):
+    calls = []
+
+    def opener(*args, **kwargs):
+        calls.append(kwargs["mode"])
+        return jsonl._lazy_opener("gzip")(*args, **kwargs)
+
+    jsonl.register_codec(jsonl.ext_gz, b"\x1f\x8b", opener)
+    path = tmp_dir / "foo.jsonl.gz"
+    jsonl.dump(tests.data, path)
+    assert list(jsonl.load(path)) == tests.data
+    assert calls == ["wt", "rb"]
+
+
+@pytest.mark.parametrize("ext", ("lzma", ".", ""))
+def test_register_codec_invalid_extension(ext):
+    with pytest.raises(ValueError):
+        jsonl.register_codec(ext, None, open_lzma)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import contextlib
+import io
+import json
+
+import pytest
+
+import jsonl
+import tests
+
+data = [{"id": i} for i in range(1000)]
+
+
+@pytest.fixture
+def datapath(filepath):
+    jsonl.dump(data, filepath)
+    return filepath
+
+
+@pytest.mark.parametrize("seek", (True, False))
+@pytest.mark.parametrize("n", (0, 1, 10, 999))
+def test_sample_size_and_order(datapath, seek, n):
+    result = jsonl.sample(datapath, n, seed=1, seek=seek)
+    assert len(result) == n
+    assert len({obj["id"] for obj in result}) == n  # Without repetitions
+    assert result == sorted(result, key=lambda obj: obj["id"])  # Original order
+    assert all(obj in data for obj in result)
+
+
+@pytest.mark.parametrize("seek", (True, False))
+def test_sample_reproducible(datapath, seek):
+    assert jsonl.sample(datapath, 10, seed=42, seek=seek) == jsonl.sample(datapath, 10, seed=42, seek=seek)
+
+
+def test_sample_is_random(datapath):
+    assert jsonl.sample(datapath, 10, seed=1) != jsonl.sample(datapath, 10, seed=2)
+
+
+@pytest.mark.parametrize("seek", (True, False))
+def test_sample_larger_than_source(filepath, seek):
+    tests.write_text(filepath, content=tests.string_data)
+    assert jsonl.sample(filepath, 100, seek=seek) == tests.data
+
+
+@pytest.mark.parametrize("n", (1, 10, 100, 500, 900, 999, 1000))
+def test_seek_sample_uneven_lines(tmp_dir, n):
+    path = tmp_dir / "uneven.jsonl"
+    objs = [{"id": i, "pad": "x" * (1000 if i % 2 else 0)} for i in range(1000)]  # Alternating long and short lines.
+    jsonl.dump(objs, path)
+    result = jsonl.sample(path, n, seed=1, seek=True)
+    assert len(result) == n
+    assert result == sorted(result, key=lambda obj: obj["id"])
+
+
+def test_sample_empty_file(tmp_dir):
+    path = tests.write_text(tmp_dir / "empty.jsonl")
+    assert jsonl.sample(path, 10, seek=True) == []
+    assert jsonl.sample(path, 10) == []
+
+
+def test_sample_fileobj_skips_empty_lines():
+    with contextlib.closing(io.BytesIO(b"\n[1]\n\n[2]\n\n")) as fd:
+        assert jsonl.sample(fd, 5) == [[1], [2]]
+
+
+def test_sample_broken(broken):
+    with contextlib.closing(io.StringIO("[1]\nfoo\n[2]\n")) as fd:
+        if broken:
+            assert jsonl.sample(fd, 3, broken=broken) == [[1], [2]]
+        else:
+            with pytest.raises(json.JSONDecodeError):
+                jsonl.sample(fd, 3, broken=broken)
+
+
+def test_sample_negative_size():
+    with pytest.raises(ValueError):
+        jsonl.sample(io.StringIO(""), -1)
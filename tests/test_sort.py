@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+import operator
+import random
+
+import pytest
+
+import jsonl
+
+data = [{"id": i, "group": i % 7} for i in random.Random(0).sample(range(1000), 1000)]
+
+
+def by_group(obj):
+    return obj["group"]
+
+
+@pytest.mark.parametrize("max_memory", (10, 1000, 10**9))
+@pytest.mark.parametrize("reverse", (True, False))
+def test_sort(tmp_dir, file_extension, max_memory, reverse):
+    src = tmp_dir / f"src{file_extension}"
+    dst = tmp_dir / f"dst{file_extension}"
+    jsonl.dump(data, src)
+
+    jsonl.sort(src, dst, key=operator.itemgetter("id"), reverse=reverse, max_memory=max_memory)
+    assert list(jsonl.load(dst)) == sorted(data, key=operator.itemgetter("id"), reverse=reverse)
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_sort_stable(tmp_dir, workers):
+    src = tmp_dir / "src.jsonl"
+    dst = tmp_dir / "dst.jsonl"
+    jsonl.dump(data, src)
+
+    jsonl.sort(src, dst, key=by_group, max_memory=500, workers=workers, tmp_dir=tmp_dir)
+    assert list(jsonl.load(dst)) == sorted(data, key=by_group)
+
+
+def test_sort_file_objects():
+    dst = io.BytesIO()
+    jsonl.sort(io.BytesIO(b"[3]\n[1]\n[2]\n"), dst)
+    assert dst.getvalue() == b"[1]\n[2]\n[3]\n"
+
+
+def test_sort_empty():
+    dst = io.BytesIO()
+    jsonl.sort(io.BytesIO(b""), dst)
+    assert dst.getvalue() == b""
+
+
+def test_sort_custom_codecs():
+    dst = io.BytesIO()
+    decoder = json.JSONDecoder(parse_float=str).decode
+    jsonl.sort(io.BytesIO(b"[2.50]\n[1.50]\n"), dst, max_memory=1, decoder=decoder)
+    assert dst.getvalue() == b'["1.50"]\n["2.50"]\n'
+
+
+@pytest.mark.parametrize("kwargs", ({"max_memory": 0}, {"workers": 0}))
+def test_sort_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        jsonl.sort(io.BytesIO(), io.BytesIO(), **kwargs)
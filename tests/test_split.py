@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+
+import pytest
+
+import jsonl
+import tests
+
+content = tests.string_data.encode(jsonl._utf_8)
+lines = content.splitlines(keepends=True)
+
+
+def get_parts(names):
+    return [tests.read_text(name).encode(jsonl._utf_8).splitlines(keepends=True) for name in names]
+
+
+def expected_parts(n):
+    """Lines starting within each of `n` equal byte ranges of the content."""
+
+    offsets = [sum(map(len, lines[:i])) for i in range(len(lines))]
+    bounds = [i * len(content) // n for i in range(n + 1)]
+    ranges = zip(bounds, bounds[1:])
+    return [[line for line, offset in zip(lines, offsets) if start <= offset < end] for start, end in ranges]
+
+
+@pytest.mark.parametrize("src_extension", sorted(jsonl.extensions))
+@pytest.mark.parametrize("parts", (1, 2, 3, 10))
+@pytest.mark.parametrize("workers", (1, 3))
+def test_split_parts(tmp_dir, src_extension, file_extension, parts, workers):
+    src = tests.write_text(str(tmp_dir / f"src{src_extension}"), content=tests.string_data)
+    names = jsonl.split(src, str(tmp_dir / f"part-{{}}{file_extension}"), parts=parts, workers=workers)
+    assert names == [str(tmp_dir / f"part-{i}{file_extension}") for i in range(parts)]
+    assert get_parts(names) == expected_parts(parts)
+
+
+@pytest.mark.parametrize("src_extension", sorted(jsonl.extensions))
+@pytest.mark.parametrize("max_bytes", (1, 80, 150, 10**6))
+def test_split_max_bytes(tmp_dir, src_extension, file_extension, max_bytes):
+    src = tests.write_text(str(tmp_dir / f"src{src_extension}"), content=tests.string_data)
+    names = jsonl.split(src, str(tmp_dir / f"part-{{}}{file_extension}"), max_bytes=max_bytes, block_size=7)
+    parts = get_parts(names)
+    assert sum(parts, []) == lines
+    assert all(len(part) == 1 or len(b"".join(part)) <= max_bytes for part in parts)
+    assert all(len(b"".join(part + next_part[:1])) > max_bytes for part, next_part in zip(parts, parts[1:]))
+
+
+@pytest.mark.parametrize("src_extension", sorted(jsonl.extensions))
+@pytest.mark.parametrize(("max_records", "expected"), ((1, [1, 1, 1, 1]), (3, [3, 1]), (4, [4]), (5, [4])))
+def test_split_max_records(tmp_dir, src_extension, max_records, expected):
+    src = tests.write_text(str(tmp_dir / f"src{src_extension}"), content="\n" + tests.string_data)
+    names = jsonl.split(src, tmp_dir / "part-{:02}.jsonl", max_records=max_records)
+    parts = get_parts(names)
+    assert list(map(len, parts)) == expected
+    assert sum(parts, []) == lines
+
+
+@pytest.mark.parametrize("options", ({"parts": 2}, {"max_bytes": 10**6}))
+def test_split_unterminated(tmp_dir, options):
+    src = tests.write_text(str(tmp_dir / "src.jsonl"), content=tests.string_data.rstrip("\n"))
+    names = jsonl.split(src, str(tmp_dir / "part-{}.jsonl"), **options)
+    assert sum(get_parts(names), []) == lines
+
+
+def test_split_empty(tmp_dir):
+    src = tests.write_text(str(tmp_dir / "src.jsonl"), content="")
+    assert get_parts(jsonl.split(src, str(tmp_dir / "part-{}.jsonl"), parts=2)) == [[], []]
+    assert jsonl.split(src, str(tmp_dir / "other-{}.jsonl"), max_bytes=10) == []
+
+
+def test_split_file_object(tmp_dir):
+    names = jsonl.split(io.BytesIO(content), str(tmp_dir / "part-{}.jsonl.gz"), max_records=3)
+    assert get_parts(names) == [lines[:3], lines[3:]]
+
+
+def test_split_kernel_copy_fallback(tmp_dir, monkeypatch):
+    def unsupported(*args):
+        raise OSError("unsupported")
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    monkeypatch.setattr(os, "sendfile", unsupported, raising=False)
+    src = tests.write_text(str(tmp_dir / "src.jsonl"), content=tests.string_data)
+    names = jsonl.split(src, str(tmp_dir / "part-{}.jsonl"), parts=3, block_size=5)
+    assert get_parts(names) == expected_parts(3)
+
+
+@pytest.mark.parametrize(
+    "options",
+    (
+        {},
+        {"parts": 2, "max_records": 2},
+        {"parts": 0},
+        {"max_bytes": -1},
+        {"max_records": 2, "workers": 0},
+    ),
+)
+def test_split_invalid_options(tmp_dir, options):
+    src = tests.write_text(str(tmp_dir / "src.jsonl"), content=tests.string_data)
+    with pytest.raises(ValueError):
+        jsonl.split(src, str(tmp_dir / "part-{}.jsonl"), **options)
+
+
+def test_split_parts_file_object(tmp_dir):
+    with pytest.raises(ValueError, match="parts requires a filename"):
+        jsonl.split(io.BytesIO(content), str(tmp_dir / "part-{}.jsonl"), parts=2)
+
+
+@pytest.mark.parametrize("pattern", ("part.jsonl", "part-{}-{}.jsonl", "part-{name}.jsonl", "part-{:.0}.jsonl"))
+@pytest.mark.parametrize("options", ({"parts": 4, "workers": 2}, {"max_bytes": 10}, {"max_records": 1}))
+def test_split_invalid_pattern(tmp_dir, pattern, options):
+    src = tests.write_text(str(tmp_dir / "src.jsonl"), content=tests.string_data)
+    with pytest.raises(ValueError, match="exactly one"):
+        jsonl.split(src, str(tmp_dir / pattern), **options)
+    assert os.listdir(tmp_dir) == ["src.jsonl"]
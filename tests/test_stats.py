@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+
+import pytest
+
+import jsonl
+import tests
+
+
+def test_stats_fileobj():
+    result = jsonl.stats(io.BytesIO(b'[1]\n\n{"a": 1}\n[10, 20]'))
+    assert result == {
+        "count": 3,
+        "size": 22,
+        "compressed_size": None,
+        "compression_ratio": None,
+        "min_line_size": 3,
+        "max_line_size": 8,
+        "avg_line_size": 19 / 3,
+    }
+
+
+def test_stats_crlf_and_whitespace_lines():
+    result = jsonl.stats(io.BytesIO(b"[1]\r\n\r\n \n[22]\r\n"))
+    assert result["count"] == 2
+    assert (result["min_line_size"], result["max_line_size"]) == (4, 5)
+
+
+def test_stats_empty():
+    result = jsonl.stats(io.BytesIO(b"\n"))
+    assert result["count"] == 0
+    assert result["size"] == 1
+    assert result["min_line_size"] is None
+    assert result["max_line_size"] is None
+    assert result["avg_line_size"] is None
+
+
+def test_stats_filepath(filepath):
+    tests.write_text(filepath, content=tests.string_data)
+    result = jsonl.stats(filepath)
+
+    lines = tests.string_data.encode(jsonl._utf_8).splitlines()
+    size = os.path.getsize(filepath)
+    assert result["count"] == len(tests.data)
+    assert result["size"] == len(tests.string_data.encode(jsonl._utf_8))
+    assert result["compressed_size"] == size
+    assert result["compression_ratio"] == pytest.approx(result["size"] / size)
+    assert result["min_line_size"] == min(map(len, lines))
+    assert result["max_line_size"] == max(map(len, lines))
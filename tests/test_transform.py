@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+
+import pytest
+
+import jsonl
+import tests
+
+
+def double_even(obj):
+    return {"id": obj["id"] * 2} if obj["id"] % 2 == 0 else None
+
+
+@pytest.mark.parametrize("ordered", (True, False))
+@pytest.mark.parametrize("workers", (1, 2))
+def test_transform(tmp_dir, file_extension, workers, ordered):
+    src = str(tmp_dir / f"src{file_extension}")
+    dst = str(tmp_dir / f"dst{file_extension}")
+    jsonl.dump(({"id": i} for i in range(1000)), src)
+
+    jsonl.transform(src, dst, double_even, workers=workers, ordered=ordered, batch_size=100)
+
+    result = list(jsonl.load(dst))
+    expected = [{"id": i * 2} for i in range(0, 1000, 2)]
+    if ordered:
+        assert result == expected
+    else:
+        assert sorted(result, key=lambda obj: obj["id"]) == expected
+
+
+def test_transform_file_objects():
+    src = io.BytesIO(tests.string_data.encode(jsonl._utf_8))
+    dst = io.BytesIO()
+    jsonl.transform(src, dst, lambda obj: obj["name"], workers=1)
+    assert dst.getvalue() == b'"Gilbert"\n"Alexa"\n"May"\n"Deloise"\n'
+
+
+def test_transform_custom_codecs():
+    src = io.BytesIO(b'{"price": 1.5}\n')
+    dst = io.BytesIO()
+    decoder = json.JSONDecoder(parse_float=str).decode
+    jsonl.transform(src, dst, lambda obj: obj, workers=1, decoder=decoder, encoder=json.JSONEncoder)
+    assert dst.getvalue() == b'{"price": "1.5"}\n'
+
+
+def test_transform_broken(broken):
+    src = io.BytesIO(b"[1]\nfoo\n[2]\n")
+    dst = io.BytesIO()
+    if broken:
+        jsonl.transform(src, dst, lambda obj: obj, workers=1, broken=broken)
+        assert dst.getvalue() == b"[1]\n[2]\n"
+    else:
+        with pytest.raises(json.JSONDecodeError):
+            jsonl.transform(src, dst, lambda obj: obj, workers=1, broken=broken)
+
+
+@pytest.mark.parametrize("workers", (0, -1))
+def test_transform_invalid_workers(workers):
+    with pytest.raises(ValueError):
+        jsonl.transform(io.BytesIO(), io.BytesIO(), double_even, workers=workers)
+
+
+def test_transform_default_workers(tmp_dir):
+    src = tests.write_text(tmp_dir / "src.jsonl", content=tests.string_data)
+    dst = tmp_dir / "dst.jsonl"
+    jsonl.transform(src, dst, dict)
+    assert list(jsonl.load(dst)) == tests.data
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import importlib
 import os.path
+import subprocess
 import sys
 import unittest.mock
 import urllib.request
@@ -9,6 +10,8 @@ import pytest
 
 import jsonl
 
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 @pytest.mark.parametrize("mode, expected", [("wt", "utf-8"), ("wb", None), ("at", "utf-8")])
 def test_get_encoding(mode, expected):
@@ -90,13 +93,48 @@ def test_looks_like_url_filepath():
 def test_zstd_module_registration():
     """Test that when zstd is available, extensions and openers are registered at module load."""
 
-    mock_zstd = unittest.mock.MagicMock()
-    with unittest.mock.patch.dict(sys.modules, {"compression": mock_zstd, "compression.zstd": mock_zstd.zstd}):
+    with unittest.mock.patch("importlib.util.find_spec") as find_spec:
         importlib.reload(jsonl)
 
         assert jsonl.ext_zst in jsonl.extensions
         assert jsonl.ext_zst in jsonl._openers
         assert "tar.zst" in jsonl._archive_formats
+        find_spec.assert_any_call("compression.zstd")
 
     # Reload again to restore original state
     importlib.reload(jsonl)
+
+
+def test_import_is_lazy():
+    """Test that `import jsonl` does not import the modules only needed by some functions."""
+
+    lazy = (
+        "array",
+        "bz2",
+        "concurrent.futures",
+        "email.message",
+        "fnmatch",
+        "glob",
+        "gzip",
+        "hashlib",
+        "http.client",
+        "lzma",
+        "queue",
+        "random",
+        "shutil",
+        "tarfile",
+        "tempfile",
+        "urllib.request",
+        "zipfile",
+        "compression.zstd",
+    )
+    code = "import sys; import jsonl; print(' '.join(name for name in {!r} if name in sys.modules))".format(lazy)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT_DIR)
+    assert result.stdout.split() == []
+
+
+def test_lazy_opener(tmp_dir):
+    path = tmp_dir / "foo.jsonl.gz"
+    with jsonl._openers[jsonl.ext_gz](path, mode="wt", encoding="utf-8") as fd:
+        fd.write("[1]\n")
+    assert list(jsonl.load(path)) == [[1]]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import time
+import unittest.mock
+
+import pytest
+
+import jsonl
+import tests
+
+
+def test_writer(filepath):
+    with jsonl.Writer(filepath) as writer:
+        writer.write(tests.data[0])
+        writer.write_many(tests.data[1:])
+    assert writer.closed
+    assert list(jsonl.load(filepath)) == tests.data
+
+
+def test_writer_append(filepath):
+    for obj in tests.data:
+        with jsonl.Writer(filepath, mode="a") as writer:
+            writer.write(obj)
+    assert list(jsonl.load(filepath)) == tests.data
+
+
+def test_writer_buffer_size(tmp_dir):
+    path = tmp_dir / "foo.jsonl"
+    with jsonl.Writer(path, buffer_size=1) as writer:
+        writer.write(tests.data[0])
+        assert path.read_text().splitlines() == [json.dumps(tests.data[0], ensure_ascii=False)]
+        with jsonl.Writer(tmp_dir / "var.jsonl") as other:
+            other.write(tests.data[0])
+            assert (tmp_dir / "var.jsonl").read_bytes() == b""  # Still buffered.
+
+
+def test_writer_flush_interval(tmp_dir):
+    path = tmp_dir / "foo.jsonl.gz"
+    with jsonl.Writer(path, flush_interval=0.01) as writer:
+        writer.write(tests.data[0])
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and not path.stat().st_size:
+            time.sleep(0.01)
+        assert path.stat().st_size  # Flushed by the background thread.
+    assert list(jsonl.load(path)) == [tests.data[0]]
+
+
+def test_writer_flush(tmp_dir):
+    path = tmp_dir / "foo.jsonl"
+    with jsonl.Writer(path) as writer:
+        writer.write_many(tests.data)
+        writer.flush()
+        assert list(jsonl.load(path)) == tests.data
+
+
+@pytest.mark.parametrize("fsync, expected", (("never", 0), ("close", 1), ("always", 3)))
+def test_writer_fsync(tmp_dir, fsync, expected):
+    with unittest.mock.patch("os.fsync") as mock_fsync:
+        with jsonl.Writer(tmp_dir / "foo.jsonl.gz", fsync=fsync) as writer:
+            writer.write(tests.data[0])
+            writer.flush()
+            writer.write(tests.data[1])
+            writer.flush()
+    assert mock_fsync.call_count == expected
+
+
+def test_writer_custom_encoder_and_opener(tmp_dir):
+    path = tmp_dir / "foo.jsonl"
+    with jsonl.Writer(path, opener=open, cls=lambda obj: json.dumps(obj).encode()) as writer:
+        writer.write_many(tests.data)
+    assert list(jsonl.load(path)) == tests.data
+
+
+def test_writer_closed(tmp_dir):
+    writer = jsonl.Writer(tmp_dir / "foo.jsonl")
+    writer.close()
+    writer.close()  # Idempotent
+    with pytest.raises(ValueError):
+        writer.write(tests.data[0])
+    with pytest.raises(ValueError):
+        writer.flush()
+
+
+@pytest.mark.parametrize("kwargs", ({"mode": "r"}, {"fsync": "sometimes"}))
+def test_writer_invalid_options(tmp_dir, kwargs):
+    with pytest.raises(ValueError):
+        jsonl.Writer(tmp_dir / "foo.jsonl", **kwargs)
+    assert not os.path.exists(tmp_dir / "foo.jsonl")
@@ -4,6 +4,7 @@ import bz2
 import gzip
 import io
 import lzma
+import os
 import unittest.mock
 
 import pytest
@@ -28,19 +29,18 @@ def test_xfile_object(filepath):
 
 
 def test_xfile_zstd_decompression():
-    """Test _xfile with a zstd-compressed file-like object when zstd is available."""
+    """Test _xfile with a zstd-compressed file-like object, using the registered zstd opener."""
 
     mock_zstd_file = unittest.mock.MagicMock()
-    mock_zstd = unittest.mock.MagicMock()
-    mock_zstd.ZstdFile.return_value = mock_zstd_file
+    mock_opener = unittest.mock.MagicMock(return_value=mock_zstd_file)
 
     obj = unittest.mock.MagicMock()
-    with unittest.mock.patch.object(jsonl, "zstd", mock_zstd):
+    with unittest.mock.patch.dict(jsonl._openers, {jsonl.ext_zst: mock_opener}):
         with unittest.mock.patch.object(jsonl, "_get_file_extension", return_value=jsonl.ext_zst):
             with jsonl._xfile("file.zst", obj) as result:
                 assert result is mock_zstd_file
 
-    mock_zstd.ZstdFile.assert_called_once_with(obj)
+    mock_opener.assert_called_once_with(obj, mode="rb")
     mock_zstd_file.close.assert_called_once()
 
 
@@ -116,3 +116,47 @@ def test_get_file_extension_ok(name, mode, fileobj, expected, tmp_dir):
 def test_get_file_extension_ko():
     with pytest.raises(FileNotFoundError):
         jsonl._get_file_extension("nonexistent.file", "r")
+
+
+@pytest.mark.parametrize("mode", ("rb", "rt"))
+def test_xopen_unknown_extension_opens_once(filepath, mode, tmp_dir):
+    jsonl.dump(tests.data, filepath)
+    path = tmp_dir / "foo.unknown"
+    os.rename(filepath, path)
+
+    with unittest.mock.patch("builtins.open", wraps=open) as mock_open:
+        with jsonl._xopen(str(path), mode=mode) as fd:
+            content = fd.read()
+    assert mock_open.call_count == 1
+    assert list(jsonl.loads(content if mode == "rt" else content.decode())) == tests.data
+    assert fd.closed
+
+
+@pytest.mark.parametrize("extension", (".jsonl", ".jsonl.gz"))
+@pytest.mark.parametrize(
+    "read",
+    (
+        lambda path: list(jsonl.load(path, shard=(0, 1))),
+        lambda path: list(jsonl.load(path, with_cursor=True)),
+        lambda path: jsonl.sample(path, 2, seek=True),
+        lambda path: jsonl._main(["tail", path]),
+        lambda path: jsonl._main(["sample", "-n", "2", "--seek", path]),
+    ),
+)
+def test_unknown_extension_opens_once(tmp_dir, capsysbinary, extension, read):
+    jsonl.dump(tests.data, tmp_dir / f"foo{extension}")
+    path = str((tmp_dir / f"foo{extension}").rename(tmp_dir / "foo.unknown"))
+
+    with unittest.mock.patch("builtins.open", wraps=open) as mock_open:
+        read(path)
+    assert [call.args[0] for call in mock_open.call_args_list].count(path) == 1
+
+
+def test_split_unknown_extension_opens_once(tmp_dir):
+    jsonl.dump(tests.data, tmp_dir / "foo.jsonl.gz")
+    path = str((tmp_dir / "foo.jsonl.gz").rename(tmp_dir / "foo.unknown"))
+
+    with unittest.mock.patch("builtins.open", wraps=open) as mock_open:
+        names = jsonl.split(path, str(tmp_dir / "part-{}.jsonl"), max_bytes=10**6)
+    assert [call.args[0] for call in mock_open.call_args_list].count(path) == 1
+    assert list(jsonl.load(names[0])) == tests.data